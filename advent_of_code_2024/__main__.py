@@ -0,0 +1,1026 @@
+"""Advent of code - Command line entry point"""
+
+# pylint: disable=too-many-lines
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import typing as t
+
+from advent_of_code_2024.benchmarks import (
+    BACKEND_SOLUTIONS,
+    BENCHMARK_SIZES,
+    DEFAULT_HISTORY_PATH,
+    DEFAULT_THRESHOLD,
+    BackendComparison,
+    BenchmarkResult,
+    append_history,
+    build_run_record,
+    compare_backends,
+    find_baseline,
+    find_regressions,
+    format_results,
+    format_speedups,
+    load_history,
+    run_benchmark,
+)
+from advent_of_code_2024.benchmarks.fuzz import (
+    Counterexample,
+    build_checks,
+    format_counterexample,
+    fuzz_check,
+)
+from advent_of_code_2024.benchmarks.sorting import (
+    SCALING_BENCHMARK_SIZES,
+    SORT_BENCHMARK_SIZES,
+    ScalingResult,
+    SortComparison,
+    compare_sorts,
+    compare_workers,
+    format_scaling,
+    format_sort_comparisons,
+)
+from advent_of_code_2024.common.backend import (
+    BACKENDS,
+    is_numpy_available,
+    set_backend,
+)
+from advent_of_code_2024.common.budget import Budget, print_progress, set_budget
+from advent_of_code_2024.common.counters import set_counters_enabled
+from advent_of_code_2024.common.parallel import (
+    PARALLEL_MODES,
+    get_parallel_mode,
+    set_parallel_mode,
+)
+from advent_of_code_2024.common.parse_cache import set_parse_cache_directory
+from advent_of_code_2024.common.render import (
+    VERBOSITY_ENV,
+    get_verbosity,
+    set_verbosity,
+)
+from advent_of_code_2024.generators import (
+    available_generator_days,
+    generate_input,
+)
+from advent_of_code_2024.runner import (
+    DEFAULT_PROFILE_DIRECTORY,
+    SolutionReport,
+    discover_solutions,
+    find_input_path,
+    format_details,
+    format_json,
+    format_table,
+    run_solutions,
+)
+from advent_of_code_2024.runner.store import (
+    ResultStore,
+    get_default_result_store_path,
+    get_default_timings_path,
+    load_timings,
+    make_timing_key,
+    save_timings,
+)
+
+
+def apply_parallel_arguments(arguments: argparse.Namespace) -> None:
+    """Set the parallel mode from the command line arguments.
+
+    Args:
+        arguments (argparse.Namespace): Parsed command line arguments.
+    """
+    if arguments.parallel_mode is None and arguments.workers is None:
+        return
+    set_parallel_mode(
+        arguments.parallel_mode or get_parallel_mode(), arguments.workers
+    )
+
+
+def apply_backend_argument(arguments: argparse.Namespace) -> None:
+    """Set the backend from the command line arguments.
+
+    Args:
+        arguments (argparse.Namespace): Parsed command line arguments.
+    """
+    if arguments.backend is not None:
+        set_backend(arguments.backend)
+
+
+def apply_budget_arguments(arguments: argparse.Namespace) -> None:
+    """Set the budget of the runs from the command line arguments.
+
+    Args:
+        arguments (argparse.Namespace): Parsed command line arguments.
+    """
+    if (
+        arguments.time_budget is None
+        and arguments.memory_budget is None
+        and not arguments.progress
+    ):
+        return
+    set_budget(
+        Budget(
+            arguments.time_budget,
+            (
+                int(arguments.memory_budget * 1024 * 1024)
+                if arguments.memory_budget is not None
+                else None
+            ),
+            print_progress if arguments.progress else None,
+        )
+    )
+
+
+def run_command(arguments: argparse.Namespace) -> int:
+    """Run the selected day parts and print their reports.
+
+    Args:
+        arguments (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Exit code.
+    """
+    apply_parallel_arguments(arguments)
+    apply_backend_argument(arguments)
+    apply_budget_arguments(arguments)
+    if arguments.parse_cache_directory is not None:
+        set_parse_cache_directory(arguments.parse_cache_directory)
+    set_verbosity(arguments.verbose or get_verbosity())
+    solutions: t.List[t.Tuple[int, int]] = discover_solutions(
+        days=arguments.days, parts=arguments.parts
+    )
+    if not solutions:
+        print("No solution matches the selection.", file=sys.stderr)
+        return 1
+
+    profile_directory: str | None = (
+        arguments.profile_directory if arguments.profile else None
+    )
+    set_counters_enabled(arguments.profile or arguments.counters)
+
+    store: ResultStore | None = None
+    # Profiled parts always run, a stored answer would have no profile.
+    if arguments.use_cache and profile_directory is None:
+        store = ResultStore(get_default_result_store_path())
+    timings_path: str = get_default_timings_path()
+    timings: t.Dict[str, float] = load_timings(timings_path)
+
+    reports_iterator: t.Iterator[SolutionReport]
+    if arguments.jobs == 1:
+        reports_iterator = run_solutions(
+            solutions, arguments.input_directory, store, profile_directory
+        )
+    else:
+        # The process pool is only imported when the parts run in workers.
+        # pylint: disable-next=import-outside-toplevel
+        from advent_of_code_2024.runner.scheduler import Job, schedule_jobs
+
+        reports_iterator = schedule_jobs(
+            [
+                Job(
+                    day,
+                    part,
+                    find_input_path(day, part, arguments.input_directory),
+                )
+                for day, part in solutions
+            ],
+            workers=arguments.jobs or None,
+            store=store,
+            timings=timings,
+            profile_directory=profile_directory,
+        )
+
+    reports: t.List[SolutionReport] = []
+    try:
+        for report in reports_iterator:
+            reports.append(report)
+            if report.status == "ok" and not report.cached:
+                timings[make_timing_key(report.day, report.part)] = (
+                    report.wall_time
+                )
+            print(
+                f"Day {report.day:02d} - Part {report.part:02d}: "
+                f"{report.status}{' (cached)' if report.cached else ''} "
+                f"({report.wall_time:.4f}s)",
+                file=sys.stderr,
+                flush=True,
+            )
+    finally:
+        if store is not None:
+            store.save()
+        save_timings(timings_path, timings)
+    reports.sort(key=lambda report: (report.day, report.part))
+
+    if arguments.format == "json":
+        print(format_json(reports))
+    else:
+        print()
+        print(format_table(reports))
+        details: str = format_details(reports)
+        if details:
+            print()
+            print(details)
+    return 0 if all(report.status == "ok" for report in reports) else 2
+
+
+def batch_command(arguments: argparse.Namespace) -> int:
+    """Run the selected day parts on many inputs and stream JSON lines.
+
+    Args:
+        arguments (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Exit code.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2024.runner.batch import (
+        format_json_line,
+        iter_batch_inputs,
+        run_batch,
+    )
+
+    apply_parallel_arguments(arguments)
+    apply_backend_argument(arguments)
+    apply_budget_arguments(arguments)
+    if not os.path.exists(arguments.source):
+        print(f"{arguments.source} not found.", file=sys.stderr)
+        return 1
+
+    failed: bool = False
+    with contextlib.ExitStack() as stack:
+        output: t.TextIO = (
+            sys.stdout
+            if arguments.output is None
+            else stack.enter_context(
+                open(arguments.output, "w", encoding="utf-8")
+            )
+        )
+        try:
+            for report in run_batch(
+                iter_batch_inputs(arguments.source),
+                arguments.days,
+                arguments.parts,
+            ):
+                failed = failed or report.status != "ok"
+                output.write(format_json_line(report) + "\n")
+                output.flush()
+        except ValueError as exception:
+            print(exception, file=sys.stderr)
+            return 1
+    return 2 if failed else 0
+
+
+def serve_command(arguments: argparse.Namespace) -> int:
+    """Run a solver daemon until its input ends or it is interrupted.
+
+    Args:
+        arguments (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Exit code.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2024.runner.daemon import serve
+
+    apply_parallel_arguments(arguments)
+    apply_backend_argument(arguments)
+    apply_budget_arguments(arguments)
+    if arguments.parse_cache_directory is not None:
+        set_parse_cache_directory(arguments.parse_cache_directory)
+    serve(
+        discover_solutions(days=arguments.days, parts=arguments.parts),
+        arguments.socket_path,
+        arguments.jobs,
+        arguments.trace_memory,
+    )
+    return 0
+
+
+def generate_command(arguments: argparse.Namespace) -> int:
+    """Generate a synthetic input and write it.
+
+    Args:
+        arguments (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Exit code.
+    """
+    raw_input: str = generate_input(
+        arguments.day, arguments.size, arguments.seed
+    )
+    if arguments.output is None:
+        sys.stdout.write(raw_input)
+    else:
+        with open(arguments.output, "w", encoding="utf-8") as file_descriptor:
+            file_descriptor.write(raw_input)
+    return 0
+
+
+def fuzz_solutions(
+    days: t.Collection[int] | None,
+    parts: t.Collection[int] | None,
+    runs: int,
+    seed: int,
+) -> t.List[Counterexample]:
+    """Run the differential checks of the selected day parts.
+
+    The progress of each check is printed on the standard error.
+
+    Args:
+        days (t.Collection[int] | None): Days to check, None for all.
+        parts (t.Collection[int] | None): Parts to check, None for all.
+        runs (int): Number of generated inputs per check.
+        seed (int): Random seed.
+
+    Returns:
+        t.List[Counterexample]: Shrunk counterexample of each failed check.
+    """
+    counterexamples: t.List[Counterexample] = []
+    for check in build_checks(days, parts):
+        counterexample: Counterexample | None = fuzz_check(check, runs, seed)
+        print(
+            f"Day {check.day:02d} - Part {check.part:02d} ({check.name}): "
+            f"{'ok' if counterexample is None else 'mismatch'}",
+            file=sys.stderr,
+            flush=True,
+        )
+        if counterexample is not None:
+            counterexamples.append(counterexample)
+    return counterexamples
+
+
+def fuzz_command(arguments: argparse.Namespace) -> int:
+    """Check the optimised solutions against their references.
+
+    Args:
+        arguments (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Exit code.
+    """
+    counterexamples: t.List[Counterexample] = fuzz_solutions(
+        arguments.days, arguments.parts, arguments.runs, arguments.seed
+    )
+    if arguments.format == "json":
+        print(
+            json.dumps(
+                [
+                    counterexample.to_dict()
+                    for counterexample in counterexamples
+                ],
+                indent=2,
+            )
+        )
+    else:
+        for counterexample in counterexamples:
+            print(format_counterexample(counterexample))
+    return 2 if counterexamples else 0
+
+
+def compare_selected_backends(
+    arguments: argparse.Namespace, solutions: t.List[t.Tuple[int, int]]
+) -> t.List[BackendComparison]:
+    """Compare the backends of the benchmarked parts having both.
+
+    Args:
+        arguments (argparse.Namespace): Parsed command line arguments.
+        solutions (t.List[t.Tuple[int, int]]): Benchmarked day parts.
+
+    Returns:
+        t.List[BackendComparison]: Backend comparisons, empty when NumPy is
+            not installed.
+    """
+    if not is_numpy_available():
+        print(
+            "NumPy is not installed: backends are not compared.",
+            file=sys.stderr,
+        )
+        return []
+    comparisons: t.List[BackendComparison] = []
+    for day, part in solutions:
+        if (day, part) in BACKEND_SOLUTIONS:
+            comparisons.extend(
+                compare_backends(
+                    day,
+                    part,
+                    arguments.sizes or BENCHMARK_SIZES[day],
+                    seed=arguments.seed,
+                    repeats=arguments.repeats,
+                    max_seconds=arguments.max_seconds,
+                )
+            )
+    return comparisons
+
+
+def bench_command(  # pylint: disable=too-many-locals
+    arguments: argparse.Namespace,
+) -> int:
+    """Benchmark the selected day parts over generated inputs.
+
+    Args:
+        arguments (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Exit code.
+    """
+    apply_parallel_arguments(arguments)
+    apply_backend_argument(arguments)
+    solutions: t.List[t.Tuple[int, int]] = [
+        (day, part)
+        for day, part in discover_solutions(
+            days=arguments.days, parts=arguments.parts
+        )
+        if day in BENCHMARK_SIZES
+    ]
+    if not solutions:
+        print("No solution matches the selection.", file=sys.stderr)
+        return 1
+
+    counterexamples: t.List[Counterexample] = (
+        fuzz_solutions(
+            arguments.days, arguments.parts, arguments.fuzz, arguments.seed
+        )
+        if arguments.fuzz
+        else []
+    )
+    results: t.List[BenchmarkResult] = []
+    for day, part in solutions:
+        solution_results: t.List[BenchmarkResult] = run_benchmark(
+            day,
+            part,
+            arguments.sizes or BENCHMARK_SIZES[day],
+            seed=arguments.seed,
+            repeats=arguments.repeats,
+            max_seconds=arguments.max_seconds,
+        )
+        results.extend(solution_results)
+        print(format_results(solution_results), file=sys.stderr, flush=True)
+
+    comparisons: t.List[BackendComparison] = (
+        compare_selected_backends(arguments, solutions)
+        if arguments.compare_backends
+        else []
+    )
+
+    sort_comparisons: t.List[SortComparison] = (
+        compare_sorts(
+            arguments.sizes or SORT_BENCHMARK_SIZES,
+            seed=arguments.seed,
+            repeats=arguments.repeats,
+            max_seconds=arguments.max_seconds,
+        )
+        if arguments.compare_sorts and any(day == 1 for day, _ in solutions)
+        else []
+    )
+    scaling: t.List[ScalingResult] = (
+        compare_workers(
+            arguments.sizes or SCALING_BENCHMARK_SIZES,
+            seed=arguments.seed,
+            repeats=arguments.repeats,
+        )
+        if arguments.compare_workers and any(day == 1 for day, _ in solutions)
+        else []
+    )
+
+    history: t.Dict[str, t.Any] = load_history(arguments.history)
+    record: t.Dict[str, t.Any] = build_run_record(results, arguments.seed)
+    baseline: t.Dict[str, t.Any] | None = find_baseline(
+        history, record["parallel"], record["backend"]
+    )
+    regressions: t.List[str] = (
+        find_regressions(results, baseline, arguments.threshold)
+        if baseline is not None
+        else []
+    )
+    if arguments.record:
+        append_history(arguments.history, record)
+
+    if arguments.format == "json":
+        print(
+            json.dumps(
+                {
+                    **record,
+                    "regressions": regressions,
+                    "speedups": [
+                        comparison.to_dict() for comparison in comparisons
+                    ],
+                    "sorts": [
+                        comparison.to_dict() for comparison in sort_comparisons
+                    ],
+                    "scaling": [result.to_dict() for result in scaling],
+                    "counterexamples": [
+                        counterexample.to_dict()
+                        for counterexample in counterexamples
+                    ],
+                },
+                indent=2,
+            )
+        )
+    else:
+        print()
+        print(format_results(results))
+        if comparisons:
+            print()
+            print("NumPy backend speedups:")
+            print(format_speedups(comparisons))
+        if sort_comparisons:
+            print()
+            print("Day 01 counting sort speedups over sorted():")
+            print(format_sort_comparisons(sort_comparisons))
+        if scaling:
+            print()
+            print("Day 01 parallel distance speedups over the sequential one:")
+            print(format_scaling(scaling))
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        for counterexample in counterexamples:
+            print(f"Mismatch: {format_counterexample(counterexample)}")
+    failed: bool = (
+        bool(regressions or counterexamples)
+        or any(result.status not in ("ok", "skipped") for result in results)
+        or any(
+            comparison.status not in ("ok", "skipped")
+            for comparison in sort_comparisons
+        )
+    )
+    return 2 if failed else 0
+
+
+def add_parallel_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the parallel mode arguments to a command parser.
+
+    Args:
+        parser (argparse.ArgumentParser): Command parser.
+    """
+    parser.add_argument(
+        "--parallel",
+        dest="parallel_mode",
+        choices=PARALLEL_MODES,
+        help=(
+            "How the independent iterations of days 6, 7, 17 and 19 run: "
+            "serially, in threads, in processes, or auto (threads on a "
+            "free-threaded interpreter, serial otherwise). Defaults to the "
+            "AOC_PARALLEL environment variable, or serial."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of parallel workers. Defaults to one per CPU.",
+    )
+
+
+def add_backend_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the backend argument to a command parser.
+
+    Args:
+        parser (argparse.ArgumentParser): Command parser.
+    """
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        help=(
+            "Backend of days 1, 2, 10 and 14: the pure Python reference, "
+            "NumPy, or auto (NumPy when it is installed). Defaults to the "
+            "AOC_BACKEND environment variable, or auto."
+        ),
+    )
+
+
+def add_budget_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the budget arguments to a command parser.
+
+    Args:
+        parser (argparse.ArgumentParser): Command parser.
+    """
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help=(
+            "Abort the long-running parts (days 6, 9 and 17) after this "
+            "many seconds, reporting how far they went."
+        ),
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        metavar="MIB",
+        help="Abort the long-running parts above this memory usage.",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help=(
+            "Report the progress of the long-running parts (fraction done, "
+            "items per second) on the standard error."
+        ),
+    )
+
+
+def build_parser() -> (
+    argparse.ArgumentParser
+):  # pylint: disable=too-many-statements
+    """Build the command line parser.
+
+    Returns:
+        argparse.ArgumentParser: Command line parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m advent_of_code_2024",
+        description="Run and measure the advent of code 2024 solutions.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="Run day parts and report time and memory usage."
+    )
+    run_parser.add_argument(
+        "-d",
+        "--day",
+        dest="days",
+        type=int,
+        action="append",
+        help="Day to run, can be repeated. Defaults to all days.",
+    )
+    run_parser.add_argument(
+        "-p",
+        "--part",
+        dest="parts",
+        type=int,
+        action="append",
+        help="Part to run, can be repeated. Defaults to all parts.",
+    )
+    run_parser.add_argument(
+        "-i",
+        "--input-dir",
+        dest="input_directory",
+        help=(
+            "Directory holding day_XX.txt or day_XX_part_YY.txt inputs. "
+            "Defaults to the input.txt file next to each part."
+        ),
+    )
+    run_parser.add_argument(
+        "-f",
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format. Defaults to table.",
+    )
+    run_parser.add_argument(
+        "--parse-cache",
+        dest="parse_cache_directory",
+        help=(
+            "Directory where parsed inputs are cached between runs. "
+            "Defaults to the AOC_PARSE_CACHE_DIR environment variable, "
+            "the cache is disabled when neither is set."
+        ),
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes, 0 for one per CPU. Defaults to 1 "
+            "(everything runs in the current process)."
+        ),
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help=(
+            "Always run the solutions instead of reusing the answers stored "
+            "for unchanged inputs and sources (stored in the file given by "
+            "the AOC_RESULT_STORE environment variable, or in the user cache "
+            "directory)."
+        ),
+    )
+    run_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Run each part under cProfile, save its statistics and print the "
+            "functions taking the most time. Implies --counters and "
+            "--no-cache."
+        ),
+    )
+    run_parser.add_argument(
+        "--profile-dir",
+        dest="profile_directory",
+        default=DEFAULT_PROFILE_DIRECTORY,
+        help=(
+            "Directory of the day_XX_part_YY_<input>.prof statistics files. "
+            f"Defaults to {DEFAULT_PROFILE_DIRECTORY}."
+        ),
+    )
+    run_parser.add_argument(
+        "--counters",
+        action="store_true",
+        help=(
+            "Report the domain counters of the solutions (nodes expanded, "
+            "cells visited, ...)."
+        ),
+    )
+    run_parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help=(
+            "Render the debug output of the solutions (grids, search "
+            "details) on the standard error. Defaults to the "
+            f"{VERBOSITY_ENV} environment variable, or quiet."
+        ),
+    )
+    add_parallel_arguments(run_parser)
+    add_backend_argument(run_parser)
+    add_budget_arguments(run_parser)
+    run_parser.set_defaults(handler=run_command)
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run day parts on a directory or a manifest of inputs (JSONL).",
+    )
+    batch_parser.add_argument(
+        "source",
+        help=(
+            "Directory holding day_XX*.txt files and day_XX/*.txt files, or "
+            'manifest file with one {"day": ..., "input": ..., "parts": '
+            "[...]} JSON object per line."
+        ),
+    )
+    batch_parser.add_argument(
+        "-d",
+        "--day",
+        dest="days",
+        type=int,
+        action="append",
+        help="Day to run, can be repeated. Defaults to all days.",
+    )
+    batch_parser.add_argument(
+        "-p",
+        "--part",
+        dest="parts",
+        type=int,
+        action="append",
+        help="Part to run, can be repeated. Defaults to all parts.",
+    )
+    batch_parser.add_argument(
+        "-o",
+        "--output",
+        help="Output JSONL file. Defaults to the standard output.",
+    )
+    add_parallel_arguments(batch_parser)
+    add_backend_argument(batch_parser)
+    add_budget_arguments(batch_parser)
+    batch_parser.set_defaults(handler=batch_command)
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Answer JSON solve requests with warm workers (daemon mode).",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        dest="socket_path",
+        help=(
+            "Unix domain socket to listen on. Defaults to the standard "
+            "input and output."
+        ),
+    )
+    serve_parser.add_argument(
+        "-d",
+        "--day",
+        dest="days",
+        type=int,
+        action="append",
+        help="Day imported at startup, can be repeated. Defaults to all days.",
+    )
+    serve_parser.add_argument(
+        "-p",
+        "--part",
+        dest="parts",
+        type=int,
+        action="append",
+        help="Part imported at startup, can be repeated. Defaults to all.",
+    )
+    serve_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes answering the requests concurrently, "
+            "0 for one per CPU. Defaults to 1 (requests run one at a time "
+            "in the daemon process)."
+        ),
+    )
+    serve_parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Measure the peak memory of each request, slowing it down.",
+    )
+    serve_parser.add_argument(
+        "--parse-cache",
+        dest="parse_cache_directory",
+        help=(
+            "Directory where parsed inputs are cached between runs. "
+            "Defaults to the AOC_PARSE_CACHE_DIR environment variable."
+        ),
+    )
+    add_parallel_arguments(serve_parser)
+    add_backend_argument(serve_parser)
+    add_budget_arguments(serve_parser)
+    serve_parser.set_defaults(handler=serve_command)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="Generate a synthetic input of a given size."
+    )
+    generate_parser.add_argument(
+        "-d",
+        "--day",
+        type=int,
+        required=True,
+        choices=available_generator_days(),
+        help="Day of the input.",
+    )
+    generate_parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        required=True,
+        help="Input size, its meaning depends on the day (lines, grid side).",
+    )
+    generate_parser.add_argument(
+        "--seed", type=int, default=0, help="Random seed. Defaults to 0."
+    )
+    generate_parser.add_argument(
+        "-o",
+        "--output",
+        help="Output file. Defaults to the standard output.",
+    )
+    generate_parser.set_defaults(handler=generate_command)
+
+    fuzz_parser = subparsers.add_parser(
+        "fuzz",
+        help=(
+            "Check the optimised solutions against their references on "
+            "random inputs."
+        ),
+    )
+    fuzz_parser.add_argument(
+        "-d",
+        "--day",
+        dest="days",
+        type=int,
+        action="append",
+        help="Day to check, can be repeated. Defaults to all days.",
+    )
+    fuzz_parser.add_argument(
+        "-p",
+        "--part",
+        dest="parts",
+        type=int,
+        action="append",
+        help="Part to check, can be repeated. Defaults to all parts.",
+    )
+    fuzz_parser.add_argument(
+        "--runs",
+        type=int,
+        default=100,
+        help="Generated inputs per check. Defaults to 100.",
+    )
+    fuzz_parser.add_argument(
+        "--seed", type=int, default=0, help="Random seed. Defaults to 0."
+    )
+    fuzz_parser.add_argument(
+        "-f",
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format of the counterexamples. Defaults to text.",
+    )
+    fuzz_parser.set_defaults(handler=fuzz_command)
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Benchmark day parts over generated inputs of several sizes.",
+    )
+    bench_parser.add_argument(
+        "-d",
+        "--day",
+        dest="days",
+        type=int,
+        action="append",
+        help="Day to benchmark, can be repeated. Defaults to all days.",
+    )
+    bench_parser.add_argument(
+        "-p",
+        "--part",
+        dest="parts",
+        type=int,
+        action="append",
+        help="Part to benchmark, can be repeated. Defaults to all parts.",
+    )
+    bench_parser.add_argument(
+        "-s",
+        "--size",
+        dest="sizes",
+        type=int,
+        action="append",
+        help="Input size, can be repeated. Defaults to the sizes of each day.",
+    )
+    bench_parser.add_argument(
+        "--seed", type=int, default=0, help="Random seed. Defaults to 0."
+    )
+    bench_parser.add_argument(
+        "--fuzz",
+        type=int,
+        default=0,
+        metavar="RUNS",
+        help=(
+            "Check the benchmarked parts against their references on RUNS "
+            "generated inputs per check first, a mismatch fails the run. "
+            "Defaults to 0 (no check)."
+        ),
+    )
+    bench_parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Runs per size, the best one is kept. Defaults to 3.",
+    )
+    bench_parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=10.0,
+        help="Stop the sweep of a part after a slower run. Defaults to 10.",
+    )
+    bench_parser.add_argument(
+        "--history",
+        default=DEFAULT_HISTORY_PATH,
+        help=f"Benchmark history file. Defaults to {DEFAULT_HISTORY_PATH}.",
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=(
+            "Relative slowdown versus the last recorded run reported as a "
+            f"regression. Defaults to {DEFAULT_THRESHOLD}."
+        ),
+    )
+    bench_parser.add_argument(
+        "--no-record",
+        dest="record",
+        action="store_false",
+        help="Do not append the run to the history.",
+    )
+    bench_parser.add_argument(
+        "-f",
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format. Defaults to table.",
+    )
+    bench_parser.add_argument(
+        "--compare-backends",
+        action="store_true",
+        help=(
+            "Also time days 1, 2, 10 and 14 with both backends and report "
+            "the NumPy speedups."
+        ),
+    )
+    bench_parser.add_argument(
+        "--compare-sorts",
+        action="store_true",
+        help=(
+            "Also time the counting sort of the day 1 location IDs against "
+            "sorted(), over lists of 1K to 100M IDs (or the given sizes)."
+        ),
+    )
+    bench_parser.add_argument(
+        "--compare-workers",
+        action="store_true",
+        help=(
+            "Also time the day 1 parallel distance computation in process "
+            "mode with 1, 2, 4, ... workers up to the number of CPUs, over "
+            "lists of 1M and 10M IDs (or the given sizes)."
+        ),
+    )
+    add_parallel_arguments(bench_parser)
+    add_backend_argument(bench_parser)
+    bench_parser.set_defaults(handler=bench_command)
+    return parser
+
+
+def main() -> None:
+    """Main function."""
+    arguments: argparse.Namespace = build_parser().parse_args()
+    sys.exit(arguments.handler(arguments))
+
+
+if __name__ == "__main__":
+    main()
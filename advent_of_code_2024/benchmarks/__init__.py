@@ -0,0 +1,613 @@
+"""Benchmarks of the daily solutions over generated inputs"""
+
+import contextlib
+import datetime
+import io
+import json
+import math
+import os
+import platform
+import time
+import typing as t
+
+from advent_of_code_2024.common.backend import (
+    get_backend,
+    get_effective_backend,
+    set_backend,
+)
+from advent_of_code_2024.common.parallel import (
+    get_effective_parallel_mode,
+    get_parallel_workers,
+    is_free_threaded,
+)
+from advent_of_code_2024.generators import generate_input
+from advent_of_code_2024.runner.registry import (
+    PACKAGE_DIRECTORY,
+    get_default_registry,
+)
+
+HISTORY_VERSION: int = 1
+DEFAULT_HISTORY_PATH: str = os.path.join(".benchmarks", "history.json")
+DEFAULT_THRESHOLD: float = 0.25
+# Differences below this duration are considered as noise.
+MINIMUM_REGRESSION_SECONDS: float = 0.005
+
+BENCHMARK_SIZES: t.Dict[int, t.List[int]] = {
+    1: [1_000, 10_000, 100_000],
+    2: [1_000, 10_000, 100_000],
+    3: [1_000, 10_000, 100_000],
+    4: [50, 100, 200],
+    5: [25, 50, 100],
+    6: [10, 20, 40],
+    7: [50, 100, 200],
+    8: [50, 100, 200],
+    9: [250, 500, 1_000],
+    10: [25, 50, 100],
+    11: [10, 100, 1_000],
+    12: [20, 40, 80],
+    13: [50, 100, 200],
+    14: [100, 1_000, 10_000],
+    15: [10, 20, 40],
+    16: [11, 21, 41],
+    17: [4, 8, 16],
+    18: [10, 20, 40],
+    19: [50, 100, 200],
+}
+
+# Day parts with a NumPy implementation, whose backends are compared.
+BACKEND_SOLUTIONS: t.Tuple[t.Tuple[int, int], ...] = (
+    (1, 1),
+    (1, 2),
+    (2, 1),
+    (2, 2),
+    (10, 2),
+    (14, 1),
+    (14, 2),
+)
+
+# Solve arguments depending on the input size, for the parts whose
+# defaults only match the puzzle input.
+SOLVE_ARGUMENTS: t.Dict[
+    t.Tuple[int, int], t.Callable[[int], t.Dict[str, t.Any]]
+] = {
+    (18, 1): lambda size: {
+        "end_position": (size, size),
+        "memory_space_width": size,
+        "memory_space_height": size,
+        "max_corrupted_bytes": (size + 1) ** 2 // 5,
+    },
+    (18, 2): lambda size: {
+        "end_position": (size, size),
+        "memory_space_width": size,
+        "memory_space_height": size,
+    },
+}
+
+COMPLEXITY_MODELS: t.Dict[str, t.Callable[[float], float]] = {
+    "O(1)": lambda _: 1.0,
+    "O(log n)": math.log,
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^2)": lambda n: n**2,
+    "O(n^3)": lambda n: n**3,
+}
+
+
+class BenchmarkResult:
+    """Benchmark result class."""
+
+    day: int
+    part: int
+    size: int
+    status: str
+    seconds: float
+    error: str | None
+
+    def __init__(self, day: int, part: int, size: int) -> None:
+        self.day = day
+        self.part = part
+        self.size = size
+        self.status = "pending"
+        self.seconds = 0.0
+        self.error = None
+
+    def __repr__(self) -> str:
+        return (
+            f"BenchmarkResult(Day: {self.day}, Part: {self.part}, "
+            f"Size: {self.size}, Seconds: {self.seconds:.4f})"
+        )
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Convert the result to a JSON serializable dictionary.
+
+        Returns:
+            t.Dict[str, t.Any]: Result as a dictionary.
+        """
+        return {
+            "day": self.day,
+            "part": self.part,
+            "size": self.size,
+            "status": self.status,
+            "seconds": self.seconds,
+            "error": self.error,
+        }
+
+
+class BackendComparison:
+    """Backend comparison class: timings of both backends on one input."""
+
+    day: int
+    part: int
+    size: int
+    python_seconds: float
+    numpy_seconds: float
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        day: int,
+        part: int,
+        size: int,
+        python_seconds: float,
+        numpy_seconds: float,
+    ) -> None:
+        self.day = day
+        self.part = part
+        self.size = size
+        self.python_seconds = python_seconds
+        self.numpy_seconds = numpy_seconds
+
+    def __repr__(self) -> str:
+        return (
+            f"BackendComparison(Day: {self.day}, Part: {self.part}, "
+            f"Size: {self.size}, Speedup: {self.speedup:.2f})"
+        )
+
+    @property
+    def speedup(self) -> float:
+        """Speedup of the NumPy backend over the Python one.
+
+        Returns:
+            float: Python duration divided by the NumPy duration.
+        """
+        if self.numpy_seconds <= 0:
+            return math.inf
+        return self.python_seconds / self.numpy_seconds
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Convert the comparison to a JSON serializable dictionary.
+
+        Returns:
+            t.Dict[str, t.Any]: Comparison as a dictionary.
+        """
+        return {
+            "day": self.day,
+            "part": self.part,
+            "size": self.size,
+            "python_seconds": self.python_seconds,
+            "numpy_seconds": self.numpy_seconds,
+            "speedup": self.speedup,
+        }
+
+
+def time_solution(
+    solve: t.Callable[..., t.Any],
+    raw_input: str,
+    arguments: t.Dict[str, t.Any],
+    repeats: int,
+) -> float:
+    """Time a solve function, keeping the best of several runs.
+
+    Args:
+        solve (t.Callable[..., t.Any]): Solve function.
+        raw_input (str): Raw input.
+        arguments (t.Dict[str, t.Any]): Other solve arguments.
+        repeats (int): Number of runs.
+
+    Returns:
+        float: Best wall time, in seconds.
+    """
+    best: float = math.inf
+    for _ in range(max(repeats, 1)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start: float = time.perf_counter()
+            solve(raw_input, **arguments)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(
+    day: int,
+    part: int,
+    sizes: t.List[int],
+    **options: t.Any,
+) -> t.List[BenchmarkResult]:
+    """Run a day part over generated inputs of increasing sizes.
+
+    The sweep stops as soon as a size takes more than max_seconds, larger
+    sizes are reported as skipped.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        sizes (t.List[int]): Input sizes.
+        **options (t.Any): seed (generators seed, defaults to 0), repeats
+            (runs per size, defaults to 3) and max_seconds (time limit of a
+            run, defaults to 10).
+
+    Returns:
+        t.List[BenchmarkResult]: Result of each size.
+    """
+    results: t.List[BenchmarkResult] = [
+        BenchmarkResult(day, part, size) for size in sorted(sizes)
+    ]
+    try:
+        solve: t.Callable[..., t.Any] = get_default_registry().load(day, part)
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        for result in results:
+            result.status = "import-error"
+            result.error = f"{type(exception).__name__}: {exception}"
+        return results
+
+    seed: int = options.get("seed", 0)
+    repeats: int = options.get("repeats", 3)
+    max_seconds: float = options.get("max_seconds", 10.0)
+    too_slow: bool = False
+    for result in results:
+        if too_slow:
+            result.status = "skipped"
+            continue
+        try:
+            result.seconds = time_solution(
+                solve,
+                generate_input(day, result.size, seed),
+                (
+                    SOLVE_ARGUMENTS[(day, part)](result.size)
+                    if (day, part) in SOLVE_ARGUMENTS
+                    else {}
+                ),
+                repeats,
+            )
+            result.status = "ok"
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            result.status = "error"
+            result.error = f"{type(exception).__name__}: {exception}"
+        too_slow = result.status != "ok" or result.seconds > max_seconds
+    return results
+
+
+def compare_backends(
+    day: int,
+    part: int,
+    sizes: t.List[int],
+    **options: t.Any,
+) -> t.List[BackendComparison]:
+    """Run a day part with the Python and the NumPy backends.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        sizes (t.List[int]): Input sizes.
+        **options (t.Any): Options of run_benchmark.
+
+    Returns:
+        t.List[BackendComparison]: Comparison of each size measured with
+            both backends.
+    """
+    backend: str = get_backend()
+    try:
+        set_backend("python")
+        python_results: t.List[BenchmarkResult] = run_benchmark(
+            day, part, sizes, **options
+        )
+        set_backend("numpy")
+        numpy_results: t.List[BenchmarkResult] = run_benchmark(
+            day, part, sizes, **options
+        )
+    finally:
+        set_backend(backend)
+    return [
+        BackendComparison(
+            day,
+            part,
+            python_result.size,
+            python_result.seconds,
+            numpy_result.seconds,
+        )
+        for python_result, numpy_result in zip(python_results, numpy_results)
+        if python_result.status == "ok" and numpy_result.status == "ok"
+    ]
+
+
+def fit_exponent(points: t.List[t.Tuple[int, float]]) -> float:
+    """Fit the exponent of a power law through (size, duration) points.
+
+    Args:
+        points (t.List[t.Tuple[int, float]]): Sizes and durations.
+
+    Returns:
+        float: Slope of the log-log least squares regression.
+    """
+    log_sizes: t.List[float] = [math.log(size) for size, _ in points]
+    log_seconds: t.List[float] = [math.log(duration) for _, duration in points]
+    mean_size: float = sum(log_sizes) / len(points)
+    mean_seconds: float = sum(log_seconds) / len(points)
+    variance: float = sum((value - mean_size) ** 2 for value in log_sizes)
+    if not variance:
+        return 0.0
+    return (
+        sum(
+            (log_size - mean_size) * (log_duration - mean_seconds)
+            for log_size, log_duration in zip(log_sizes, log_seconds)
+        )
+        / variance
+    )
+
+
+def fit_complexity(
+    sizes: t.List[int], seconds: t.List[float]
+) -> t.Tuple[str, float] | None:
+    """Fit the empirical complexity of a solution.
+
+    The exponent is the slope of the log-log regression of the durations,
+    the model is the one of COMPLEXITY_MODELS with the lowest relative
+    least squares error.
+
+    Args:
+        sizes (t.List[int]): Input sizes.
+        seconds (t.List[float]): Duration of each size.
+
+    Returns:
+        t.Tuple[str, float] | None: Best model and exponent, None when less
+            than two sizes could be measured.
+    """
+    points: t.List[t.Tuple[int, float]] = [
+        (size, duration)
+        for size, duration in zip(sizes, seconds)
+        if size > 1 and duration > 0
+    ]
+    if len(points) < 2:
+        return None
+
+    best_model: str = ""
+    best_error: float = math.inf
+    for name, model in COMPLEXITY_MODELS.items():
+        values: t.List[float] = [model(size) for size, _ in points]
+        scale: float = sum(
+            value * duration for value, (_, duration) in zip(values, points)
+        ) / sum(value**2 for value in values)
+        error: float = sum(
+            ((scale * value - duration) / duration) ** 2
+            for value, (_, duration) in zip(values, points)
+        )
+        if error < best_error:
+            best_model, best_error = name, error
+    return best_model, fit_exponent(points)
+
+
+def get_git_revision() -> str | None:
+    """Get the current git revision of the sources.
+
+    Returns:
+        str | None: Commit hash, None outside of a git repository.
+    """
+    import subprocess  # pylint: disable=import-outside-toplevel
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=PACKAGE_DIRECTORY,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path: str) -> t.Dict[str, t.Any]:
+    """Load a benchmark history file.
+
+    Args:
+        path (str): Path to the history file.
+
+    Raises:
+        ValueError: If the history file has an unknown version.
+
+    Returns:
+        t.Dict[str, t.Any]: History, empty if the file does not exist.
+    """
+    if not os.path.isfile(path):
+        return {"version": HISTORY_VERSION, "runs": []}
+    with open(path, "r", encoding="utf-8") as file_descriptor:
+        history: t.Dict[str, t.Any] = json.load(file_descriptor)
+    if history.get("version") != HISTORY_VERSION:
+        raise ValueError(
+            f"Unsupported benchmark history version {history.get('version')}."
+        )
+    return history
+
+
+def get_parallel_settings() -> t.Dict[str, t.Any]:
+    """Get the parallel settings the benchmark runs with.
+
+    Returns:
+        t.Dict[str, t.Any]: Effective parallel mode, number of workers and
+            whether the interpreter is free-threaded.
+    """
+    return {
+        "mode": get_effective_parallel_mode(),
+        "workers": get_parallel_workers(),
+        "free_threaded": is_free_threaded(),
+    }
+
+
+def find_baseline(
+    history: t.Dict[str, t.Any],
+    parallel: t.Dict[str, t.Any],
+    backend: str = "python",
+) -> t.Dict[str, t.Any] | None:
+    """Find the last recorded run made with the same parallel settings and
+    the same backend.
+
+    Args:
+        history (t.Dict[str, t.Any]): Benchmark history.
+        parallel (t.Dict[str, t.Any]): Parallel settings of the new run.
+        backend (str, optional): Effective backend of the new run.
+            Defaults to "python".
+
+    Returns:
+        t.Dict[str, t.Any] | None: Baseline run, None if there is none.
+    """
+    for run in reversed(history["runs"]):
+        # Runs recorded before the parallel modes ran serially, and the
+        # ones recorded before the NumPy backend ran in Python.
+        run_parallel: t.Dict[str, t.Any] = run.get(
+            "parallel", {"mode": "serial", "workers": 1, "free_threaded": False}
+        )
+        if run_parallel == parallel and run.get("backend", "python") == backend:
+            return t.cast(t.Dict[str, t.Any], run)
+    return None
+
+
+def build_run_record(
+    results: t.List[BenchmarkResult], seed: int
+) -> t.Dict[str, t.Any]:
+    """Build the history record of a benchmark run.
+
+    Args:
+        results (t.List[BenchmarkResult]): Benchmark results.
+        seed (int): Generators seed.
+
+    Returns:
+        t.Dict[str, t.Any]: History record.
+    """
+    return {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "revision": get_git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parallel": get_parallel_settings(),
+        "backend": get_effective_backend(),
+        "seed": seed,
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def append_history(path: str, record: t.Dict[str, t.Any]) -> None:
+    """Append a run record to a benchmark history file.
+
+    Args:
+        path (str): Path to the history file.
+        record (t.Dict[str, t.Any]): Run record.
+    """
+    history: t.Dict[str, t.Any] = load_history(path)
+    history["runs"].append(record)
+    directory: str = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file_descriptor:
+        json.dump(history, file_descriptor, indent=2)
+
+
+def find_regressions(
+    results: t.List[BenchmarkResult],
+    baseline: t.Dict[str, t.Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> t.List[str]:
+    """Compare benchmark results with a baseline run.
+
+    Args:
+        results (t.List[BenchmarkResult]): Benchmark results.
+        baseline (t.Dict[str, t.Any]): Baseline run record.
+        threshold (float, optional): Allowed relative slowdown.
+            Defaults to 0.25.
+
+    Returns:
+        t.List[str]: Description of each regression.
+    """
+    baseline_seconds: t.Dict[t.Tuple[int, int, int], float] = {
+        (result["day"], result["part"], result["size"]): result["seconds"]
+        for result in baseline["results"]
+        if result["status"] == "ok"
+    }
+    regressions: t.List[str] = []
+    for result in results:
+        key: t.Tuple[int, int, int] = (result.day, result.part, result.size)
+        if result.status != "ok" or key not in baseline_seconds:
+            continue
+        previous: float = baseline_seconds[key]
+        if (
+            result.seconds > previous * (1 + threshold)
+            and result.seconds - previous > MINIMUM_REGRESSION_SECONDS
+        ):
+            regressions.append(
+                f"Day {result.day:02d} - Part {result.part:02d} - "
+                f"Size {result.size}: {previous:.4f}s -> "
+                f"{result.seconds:.4f}s"
+            )
+    return regressions
+
+
+def format_results(results: t.List[BenchmarkResult]) -> str:
+    """Format benchmark results and complexity fits as a text table.
+
+    Args:
+        results (t.List[BenchmarkResult]): Benchmark results.
+
+    Returns:
+        str: Text table.
+    """
+    solutions: t.Dict[t.Tuple[int, int], t.List[BenchmarkResult]] = {}
+    for result in results:
+        solutions.setdefault((result.day, result.part), []).append(result)
+
+    lines: t.List[str] = []
+    for (day, part), solution_results in sorted(solutions.items()):
+        measured: t.List[BenchmarkResult] = [
+            result for result in solution_results if result.status == "ok"
+        ]
+        fit = fit_complexity(
+            [result.size for result in measured],
+            [result.seconds for result in measured],
+        )
+        fit_text: str = (
+            f"{fit[0]} (n^{fit[1]:.2f})" if fit is not None else "n/a"
+        )
+        timings: str = ", ".join(
+            (
+                f"{result.size}: {result.seconds:.4f}s"
+                if result.status == "ok"
+                else f"{result.size}: {result.status}"
+            )
+            for result in solution_results
+        )
+        lines.append(
+            f"Day {day:02d} - Part {part:02d} | {fit_text} | {timings}"
+        )
+    return "\n".join(lines)
+
+
+def format_speedups(comparisons: t.List[BackendComparison]) -> str:
+    """Format backend comparisons as a text table.
+
+    Args:
+        comparisons (t.List[BackendComparison]): Backend comparisons.
+
+    Returns:
+        str: Text table, one line per day part.
+    """
+    solutions: t.Dict[t.Tuple[int, int], t.List[BackendComparison]] = {}
+    for comparison in comparisons:
+        solutions.setdefault((comparison.day, comparison.part), []).append(
+            comparison
+        )
+
+    return "\n".join(
+        f"Day {day:02d} - Part {part:02d} | "
+        + ", ".join(
+            f"{comparison.size}: {comparison.python_seconds:.4f}s -> "
+            f"{comparison.numpy_seconds:.4f}s (x{comparison.speedup:.2f})"
+            for comparison in solution_comparisons
+        )
+        for (day, part), solution_comparisons in sorted(solutions.items())
+    )
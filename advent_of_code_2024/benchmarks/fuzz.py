@@ -0,0 +1,502 @@
+"""Differential fuzzing of the optimised solutions against references"""
+
+import contextlib
+import io
+import random
+import typing as t
+import warnings
+
+from advent_of_code_2024.benchmarks import BACKEND_SOLUTIONS, SOLVE_ARGUMENTS
+from advent_of_code_2024.benchmarks.oracles import ORACLES
+from advent_of_code_2024.common.backend import (
+    get_backend,
+    is_numpy_available,
+    set_backend,
+)
+from advent_of_code_2024.common.parallel import (
+    get_parallel_mode,
+    get_parallel_workers,
+    set_parallel_mode,
+)
+from advent_of_code_2024.common.parse_cache import (
+    get_parse_cache_directory,
+    set_memory_parse_cache,
+    set_parse_cache_directory,
+)
+from advent_of_code_2024.generators import (
+    available_generator_days,
+    generate_input,
+)
+from advent_of_code_2024.runner.registry import get_default_registry
+
+# Largest generated input size of each day, small enough for the oracles.
+FUZZ_MAX_SIZES: t.Dict[int, int] = {
+    1: 40,
+    2: 40,
+    3: 40,
+    4: 12,
+    5: 12,
+    6: 8,
+    7: 6,
+    8: 12,
+    9: 30,
+    10: 10,
+    11: 5,
+    12: 10,
+    13: 8,
+    14: 40,
+    15: 8,
+    16: 9,
+    17: 4,
+    18: 8,
+    19: 12,
+}
+# Day parts left out: the register A search of day 17 does not end on some
+# generated programs.
+UNFUZZED_SOLUTIONS: t.Tuple[t.Tuple[int, int], ...] = ((17, 2),)
+# Day parts whose independent iterations run in parallel.
+PARALLEL_SOLUTIONS: t.Tuple[t.Tuple[int, int], ...] = (
+    (6, 2),
+    (7, 1),
+    (7, 2),
+    (17, 2),
+    (19, 1),
+    (19, 2),
+)
+FUZZ_THREAD_WORKERS: int = 2
+# Runs of the shrinking of a counterexample, at most.
+MAX_SHRINK_RUNS: int = 500
+
+Solver = t.Callable[[str, t.Dict[str, t.Any]], t.Any]
+
+
+class DifferentialCheck:  # pylint: disable=too-few-public-methods
+    """Differential check class: a candidate solver and its reference.
+
+    Both solvers take a raw input and the solve arguments of its size, and
+    must give the same answer on every input the reference accepts.
+    """
+
+    name: str
+    day: int
+    part: int
+    reference: Solver
+    candidate: Solver
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        name: str,
+        day: int,
+        part: int,
+        reference: Solver,
+        candidate: Solver,
+    ) -> None:
+        self.name = name
+        self.day = day
+        self.part = part
+        self.reference = reference
+        self.candidate = candidate
+
+    def __repr__(self) -> str:
+        return (
+            f"DifferentialCheck(Name: {self.name}, Day: {self.day}, "
+            f"Part: {self.part})"
+        )
+
+
+class Counterexample:  # pylint: disable=too-few-public-methods
+    """Counterexample class: input on which a candidate is wrong."""
+
+    check: DifferentialCheck
+    seed: int
+    size: int
+    raw_input: str
+    expected: str
+    actual: str
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        check: DifferentialCheck,
+        seed: int,
+        size: int,
+        raw_input: str,
+        expected: str,
+        actual: str,
+    ) -> None:
+        self.check = check
+        self.seed = seed
+        self.size = size
+        self.raw_input = raw_input
+        self.expected = expected
+        self.actual = actual
+
+    def __repr__(self) -> str:
+        return (
+            f"Counterexample(Check: {self.check.name}, Seed: {self.seed}, "
+            f"Size: {self.size})"
+        )
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Convert the counterexample to a JSON serializable dictionary.
+
+        Returns:
+            t.Dict[str, t.Any]: Counterexample as a dictionary.
+        """
+        return {
+            "check": self.check.name,
+            "day": self.check.day,
+            "part": self.check.part,
+            "seed": self.seed,
+            "size": self.size,
+            "input": self.raw_input,
+            "expected": self.expected,
+            "actual": self.actual,
+        }
+
+
+@contextlib.contextmanager
+def reference_settings() -> t.Iterator[None]:
+    """Run the solutions in their reference configuration.
+
+    The Python backend runs serially without parse cache, the previous
+    settings are restored on exit.
+
+    Yields:
+        None: Nothing.
+    """
+    backend: str = get_backend()
+    parallel_mode: str = get_parallel_mode()
+    parallel_workers: int = get_parallel_workers()
+    parse_cache_directory: str | None = get_parse_cache_directory()
+    set_backend("python")
+    set_parallel_mode("serial")
+    set_parse_cache_directory(None)
+    set_memory_parse_cache(False)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        set_backend(backend)
+        set_parallel_mode(parallel_mode, parallel_workers)
+        set_parse_cache_directory(parse_cache_directory)
+        set_memory_parse_cache(False)
+
+
+def make_solution_solver(day: int, part: int) -> Solver:
+    """Wrap the solve function of a day part, in the reference settings.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+
+    Returns:
+        Solver: Solver.
+    """
+
+    def solver(raw_input: str, arguments: t.Dict[str, t.Any]) -> t.Any:
+        with reference_settings():
+            return get_default_registry().load(day, part)(
+                raw_input, **arguments
+            )
+
+    return solver
+
+
+def make_oracle_solver(oracle: t.Callable[[str], t.Any]) -> Solver:
+    """Wrap an oracle, which takes no solve arguments.
+
+    Args:
+        oracle (t.Callable[[str], t.Any]): Oracle.
+
+    Returns:
+        Solver: Solver.
+    """
+    return lambda raw_input, _: oracle(raw_input)
+
+
+def make_numpy_solver(day: int, part: int) -> Solver:
+    """Wrap the solve function of a day part, on the NumPy backend.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+
+    Returns:
+        Solver: Solver.
+    """
+
+    def solver(raw_input: str, arguments: t.Dict[str, t.Any]) -> t.Any:
+        with reference_settings():
+            set_backend("numpy")
+            return get_default_registry().load(day, part)(
+                raw_input, **arguments
+            )
+
+    return solver
+
+
+def make_thread_solver(day: int, part: int) -> Solver:
+    """Wrap the solve function of a day part, in parallel threads.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+
+    Returns:
+        Solver: Solver.
+    """
+
+    def solver(raw_input: str, arguments: t.Dict[str, t.Any]) -> t.Any:
+        with reference_settings(), warnings.catch_warnings():
+            # Threads are checked for their answers, not their speedup.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            set_parallel_mode("thread", FUZZ_THREAD_WORKERS)
+            return get_default_registry().load(day, part)(
+                raw_input, **arguments
+            )
+
+    return solver
+
+
+def make_parse_cache_solver(day: int, part: int) -> Solver:
+    """Wrap the solve function of a day part, reading its parsed input back
+    from the in-memory parse cache.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+
+    Returns:
+        Solver: Solver.
+    """
+
+    def solver(raw_input: str, arguments: t.Dict[str, t.Any]) -> t.Any:
+        solve: t.Callable[..., t.Any] = get_default_registry().load(day, part)
+        with reference_settings():
+            set_memory_parse_cache(True)
+            # The first run stores the parsed input, the second one loads it.
+            solve(raw_input, **arguments)
+            return solve(raw_input, **arguments)
+
+    return solver
+
+
+def build_checks(
+    days: t.Collection[int] | None = None,
+    parts: t.Collection[int] | None = None,
+) -> t.List[DifferentialCheck]:
+    """Build the differential checks of the selected day parts.
+
+    The solutions are checked against their oracle, and the NumPy backend,
+    the parallel threads and the parse cache against the plain solutions.
+
+    Args:
+        days (t.Collection[int] | None, optional):
+            Days to keep. Defaults to None (all days).
+        parts (t.Collection[int] | None, optional):
+            Parts to keep. Defaults to None (all parts).
+
+    Returns:
+        t.List[DifferentialCheck]: Checks, by day part.
+    """
+    checks: t.List[DifferentialCheck] = []
+    generator_days: t.List[int] = available_generator_days()
+    for day, part in get_default_registry().select(days, parts):
+        if day not in generator_days or (day, part) in UNFUZZED_SOLUTIONS:
+            continue
+        solution: Solver = make_solution_solver(day, part)
+        if (day, part) in ORACLES:
+            checks.append(
+                DifferentialCheck(
+                    "oracle",
+                    day,
+                    part,
+                    make_oracle_solver(ORACLES[(day, part)]),
+                    solution,
+                )
+            )
+        if (day, part) in BACKEND_SOLUTIONS and is_numpy_available():
+            checks.append(
+                DifferentialCheck(
+                    "numpy", day, part, solution, make_numpy_solver(day, part)
+                )
+            )
+        if (day, part) in PARALLEL_SOLUTIONS:
+            checks.append(
+                DifferentialCheck(
+                    "thread", day, part, solution, make_thread_solver(day, part)
+                )
+            )
+        checks.append(
+            DifferentialCheck(
+                "parse-cache",
+                day,
+                part,
+                solution,
+                make_parse_cache_solver(day, part),
+            )
+        )
+    return checks
+
+
+def get_solve_arguments(day: int, part: int, size: int) -> t.Dict[str, t.Any]:
+    """Get the solve arguments of a generated input size.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        size (int): Input size.
+
+    Returns:
+        t.Dict[str, t.Any]: Solve arguments.
+    """
+    if (day, part) in SOLVE_ARGUMENTS:
+        return SOLVE_ARGUMENTS[(day, part)](size)
+    return {}
+
+
+def find_mismatch(
+    check: DifferentialCheck, raw_input: str, arguments: t.Dict[str, t.Any]
+) -> t.Tuple[str, str] | None:
+    """Run both solvers of a check on an input.
+
+    Args:
+        check (DifferentialCheck): Check.
+        raw_input (str): Raw input.
+        arguments (t.Dict[str, t.Any]): Solve arguments.
+
+    Returns:
+        t.Tuple[str, str] | None: Expected and actual answers, None if they
+            match or if the reference rejects the input.
+    """
+    try:
+        expected: str = str(check.reference(raw_input, arguments))
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+    try:
+        actual: str = str(check.candidate(raw_input, arguments))
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        actual = f"{type(exception).__name__}: {exception}"
+    return None if actual == expected else (expected, actual)
+
+
+def shrink_lines(
+    check: DifferentialCheck, raw_input: str, arguments: t.Dict[str, t.Any]
+) -> t.Tuple[str, t.Tuple[str, str]]:
+    """Remove the lines of a failing input that are not needed to fail.
+
+    Chunks of lines are removed, halving the chunk size down to single
+    lines, as long as the candidate still disagrees with the reference.
+
+    Args:
+        check (DifferentialCheck): Check.
+        raw_input (str): Failing raw input.
+        arguments (t.Dict[str, t.Any]): Solve arguments.
+
+    Returns:
+        t.Tuple[str, t.Tuple[str, str]]: Smallest failing input found, and
+            its expected and actual answers.
+    """
+    lines: t.List[str] = raw_input.splitlines(keepends=True)
+    mismatch: t.Tuple[str, str] = t.cast(
+        t.Tuple[str, str], find_mismatch(check, raw_input, arguments)
+    )
+    runs: int = 0
+    chunk: int = max(len(lines) // 2, 1)
+    while chunk >= 1 and runs < MAX_SHRINK_RUNS:
+        start: int = 0
+        while start < len(lines) and runs < MAX_SHRINK_RUNS:
+            candidate_lines: t.List[str] = (
+                lines[:start] + lines[start + chunk :]
+            )
+            runs += 1
+            candidate_mismatch = find_mismatch(
+                check, "".join(candidate_lines), arguments
+            )
+            if candidate_lines and candidate_mismatch is not None:
+                lines, mismatch = candidate_lines, candidate_mismatch
+            else:
+                start += chunk
+        chunk //= 2
+    return "".join(lines), mismatch
+
+
+def shrink_counterexample(
+    check: DifferentialCheck, seed: int, size: int
+) -> Counterexample:
+    """Shrink a failing generated input.
+
+    The smallest generated size failing with the same seed is searched
+    first, then the lines of its input are removed.
+
+    Args:
+        check (DifferentialCheck): Check.
+        seed (int): Generator seed.
+        size (int): Failing generated size.
+
+    Returns:
+        Counterexample: Shrunk counterexample.
+    """
+    for smaller_size in range(1, size + 1):
+        arguments: t.Dict[str, t.Any] = get_solve_arguments(
+            check.day, check.part, smaller_size
+        )
+        raw_input: str = generate_input(check.day, smaller_size, seed)
+        if find_mismatch(check, raw_input, arguments) is not None:
+            shrunk_input, (expected, actual) = shrink_lines(
+                check, raw_input, arguments
+            )
+            return Counterexample(
+                check, seed, smaller_size, shrunk_input, expected, actual
+            )
+    raise ValueError("The input does not fail anymore.")
+
+
+def fuzz_check(
+    check: DifferentialCheck, runs: int, seed: int = 0
+) -> Counterexample | None:
+    """Compare a candidate with its reference on random generated inputs.
+
+    Args:
+        check (DifferentialCheck): Check.
+        runs (int): Number of inputs.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        Counterexample | None: Shrunk counterexample of the first failing
+            input, None if the solvers always agree.
+    """
+    rng: random.Random = random.Random(f"{seed}:{check.name}:{check.day}")
+    for _ in range(runs):
+        input_seed: int = rng.randrange(2**32)
+        size: int = rng.randint(1, FUZZ_MAX_SIZES.get(check.day, 8))
+        if (
+            find_mismatch(
+                check,
+                generate_input(check.day, size, input_seed),
+                get_solve_arguments(check.day, check.part, size),
+            )
+            is not None
+        ):
+            return shrink_counterexample(check, input_seed, size)
+    return None
+
+
+def format_counterexample(counterexample: Counterexample) -> str:
+    """Format a counterexample for the terminal.
+
+    Args:
+        counterexample (Counterexample): Counterexample.
+
+    Returns:
+        str: Description, followed by the shrunk input.
+    """
+    return (
+        f"Day {counterexample.check.day:02d} - Part "
+        f"{counterexample.check.part:02d} ({counterexample.check.name}): "
+        f"expected {counterexample.expected}, got {counterexample.actual} "
+        f"(size {counterexample.size}, seed {counterexample.seed}) on:\n"
+        + counterexample.raw_input
+    )
@@ -0,0 +1,404 @@
+"""Reference implementations the optimised solutions are checked against
+
+Each oracle is the plainest version of the algorithm of a day part, with
+its own parsing, written for obviousness rather than speed: it only runs
+on the small inputs of the differential fuzz harness. An oracle raises
+ValueError on inputs that are not valid puzzle inputs.
+"""
+
+import collections
+import fractions
+import itertools
+import math
+import re
+import typing as t
+
+INTEGER_REGEX: re.Pattern[str] = re.compile(r"-?\d+")
+# Clockwise directions of the day 6 guard, as (x, y) steps.
+GUARD_DIRECTIONS: t.Dict[str, t.Tuple[int, int]] = {
+    "^": (0, -1),
+    ">": (1, 0),
+    "v": (0, 1),
+    "<": (-1, 0),
+}
+MAX_BUTTON_PRESSES: int = 100
+# Shift of the day 13 prizes in part 2.
+PRIZE_SHIFT: int = 10_000_000_000_000
+
+
+def parse_location_lists(
+    raw_input: str,
+) -> t.Tuple[t.List[int], t.List[int]]:
+    """Parse the two lists of location IDs of day 1.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Raises:
+        ValueError: If a line does not hold two IDs.
+
+    Returns:
+        t.Tuple[t.List[int], t.List[int]]: Left and right lists.
+    """
+    left: t.List[int] = []
+    right: t.List[int] = []
+    for line in raw_input.splitlines():
+        if not line.strip():
+            continue
+        values: t.List[int] = [int(value) for value in line.split()]
+        if len(values) != 2:
+            raise ValueError(f"Invalid line: {line!r}")
+        left.append(values[0])
+        right.append(values[1])
+    return left, right
+
+
+def solve_day_01_part_01(raw_input: str) -> int:
+    """Sum the distances between the sorted location lists.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Returns:
+        int: Total distance.
+    """
+    left, right = parse_location_lists(raw_input)
+    return sum(abs(a - b) for a, b in zip(sorted(left), sorted(right)))
+
+
+def solve_day_01_part_02(raw_input: str) -> int:
+    """Sum the left IDs times their number of occurrences on the right.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Returns:
+        int: Similarity score.
+    """
+    left, right = parse_location_lists(raw_input)
+    occurrences: t.Counter[int] = collections.Counter(right)
+    return sum(value * occurrences[value] for value in left)
+
+
+def parse_guard_map(
+    raw_input: str,
+) -> t.Tuple[t.List[str], t.Tuple[int, int], str]:
+    """Parse the day 6 map and find the guard.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Raises:
+        ValueError: If the map is not rectangular or has no guard.
+
+    Returns:
+        t.Tuple[t.List[str], t.Tuple[int, int], str]:
+            Map rows, guard position and guard direction.
+    """
+    rows: t.List[str] = [line for line in raw_input.splitlines() if line]
+    if not rows or any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError("The map is not rectangular.")
+    for y, row in enumerate(rows):
+        for x, cell in enumerate(row):
+            if cell in GUARD_DIRECTIONS:
+                return rows, (x, y), cell
+    raise ValueError("Guard not found on the map.")
+
+
+def walk_guard(
+    rows: t.List[str],
+    start: t.Tuple[int, int],
+    direction: str,
+    obstruction: t.Tuple[int, int] | None = None,
+) -> t.Set[t.Tuple[int, int]] | None:
+    """Walk the day 6 guard until it leaves the map.
+
+    Args:
+        rows (t.List[str]): Map rows.
+        start (t.Tuple[int, int]): Guard position.
+        direction (str): Guard direction.
+        obstruction (t.Tuple[int, int] | None, optional):
+            Extra obstacle. Defaults to None.
+
+    Returns:
+        t.Set[t.Tuple[int, int]] | None: Visited positions, None if the guard
+            walks in a loop.
+    """
+    turns: t.List[str] = list(GUARD_DIRECTIONS)
+    (x, y) = start
+    seen: t.Set[t.Tuple[int, int, str]] = set()
+    while (x, y, direction) not in seen:
+        seen.add((x, y, direction))
+        step_x, step_y = GUARD_DIRECTIONS[direction]
+        next_x, next_y = x + step_x, y + step_y
+        if not (0 <= next_y < len(rows) and 0 <= next_x < len(rows[0])):
+            return {(x, y) for x, y, _ in seen}
+        if rows[next_y][next_x] == "#" or (next_x, next_y) == obstruction:
+            direction = turns[(turns.index(direction) + 1) % len(turns)]
+        else:
+            x, y = next_x, next_y
+    return None
+
+
+def solve_day_06_part_01(raw_input: str) -> int:
+    """Count the positions visited by the guard.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Raises:
+        ValueError: If the guard never leaves the map.
+
+    Returns:
+        int: Number of distinct positions.
+    """
+    visited: t.Set[t.Tuple[int, int]] | None = walk_guard(
+        *parse_guard_map(raw_input)
+    )
+    if visited is None:
+        raise ValueError("The guard walks in a loop.")
+    return len(visited)
+
+
+def solve_day_06_part_02(raw_input: str) -> int:
+    """Count the empty cells whose obstruction traps the guard in a loop.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Returns:
+        int: Number of obstruction positions.
+    """
+    rows, start, direction = parse_guard_map(raw_input)
+    return sum(
+        walk_guard(rows, start, direction, (x, y)) is None
+        for y, row in enumerate(rows)
+        for x, cell in enumerate(row)
+        if cell == "."
+    )
+
+
+def parse_disk_map(raw_input: str) -> t.List[int | None]:
+    """Expand the day 9 disk map into blocks.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Raises:
+        ValueError: If the disk map holds something else than digits.
+
+    Returns:
+        t.List[int | None]: File ID of each block, None for free blocks.
+    """
+    digits: str = raw_input.strip()
+    if not digits.isdigit():
+        raise ValueError("The disk map must only hold digits.")
+    blocks: t.List[int | None] = []
+    for index, digit in enumerate(digits):
+        blocks.extend([index // 2 if index % 2 == 0 else None] * int(digit))
+    return blocks
+
+
+def compute_checksum(blocks: t.List[int | None]) -> int:
+    """Compute the checksum of day 9 disk blocks.
+
+    Args:
+        blocks (t.List[int | None]): File ID of each block.
+
+    Returns:
+        int: Sum of the block positions times their file ID.
+    """
+    return sum(
+        position * file_id
+        for position, file_id in enumerate(blocks)
+        if file_id is not None
+    )
+
+
+def solve_day_09_part_01(raw_input: str) -> int:
+    """Move the last file block to the first free block, until compact.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Returns:
+        int: Checksum of the compacted disk.
+    """
+    blocks: t.List[int | None] = parse_disk_map(raw_input)
+    while None in blocks:
+        last: int | None = blocks.pop()
+        if last is not None:
+            blocks[blocks.index(None)] = last
+    return compute_checksum(blocks)
+
+
+def solve_day_09_part_02(raw_input: str) -> int:
+    """Move each whole file, highest ID first, to the first free span left
+    of it that fits it.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Returns:
+        int: Checksum of the compacted disk.
+    """
+    blocks: t.List[int | None] = parse_disk_map(raw_input)
+    highest_id: int = max(
+        (file_id for file_id in blocks if file_id is not None), default=-1
+    )
+    for file_id in range(highest_id, -1, -1):
+        start: int = blocks.index(file_id)
+        size: int = blocks.count(file_id)
+        for free_start in range(start - size + 1):
+            if blocks[free_start : free_start + size] == [None] * size:
+                blocks[start : start + size] = [None] * size
+                blocks[free_start : free_start + size] = [file_id] * size
+                break
+    return compute_checksum(blocks)
+
+
+def parse_claw_machines(
+    raw_input: str,
+) -> t.List[t.Tuple[int, int, int, int, int, int]]:
+    """Parse the day 13 claw machines.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Raises:
+        ValueError: If a claw machine does not hold six integers.
+
+    Returns:
+        t.List[t.Tuple[int, int, int, int, int, int]]: Button A shifts,
+            button B shifts and prize position of each machine.
+    """
+    machines: t.List[t.Tuple[int, int, int, int, int, int]] = []
+    for section in raw_input.split("\n\n"):
+        if not section.strip():
+            continue
+        values: t.List[int] = [
+            int(value) for value in INTEGER_REGEX.findall(section)
+        ]
+        if len(values) != 6:
+            raise ValueError(f"Invalid claw machine: {section!r}")
+        a_x, a_y, b_x, b_y, prize_x, prize_y = values
+        machines.append((a_x, a_y, b_x, b_y, prize_x, prize_y))
+    return machines
+
+
+def solve_day_13_part_01(raw_input: str) -> int:
+    """Try every number of presses of the claw machines buttons.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Returns:
+        int: Fewest tokens needed to win all the possible prizes.
+    """
+    return sum(
+        min(
+            (
+                3 * a_presses + b_presses
+                for a_presses, b_presses in itertools.product(
+                    range(MAX_BUTTON_PRESSES + 1), repeat=2
+                )
+                if a_presses * a_x + b_presses * b_x == prize_x
+                and a_presses * a_y + b_presses * b_y == prize_y
+            ),
+            default=0,
+        )
+        for a_x, a_y, b_x, b_y, prize_x, prize_y in parse_claw_machines(
+            raw_input
+        )
+    )
+
+
+def get_collinear_tokens(a_x: int, b_x: int, prize_x: int) -> int:
+    """Find the fewest tokens along X when both buttons move the claw along
+    the same line as the prize.
+
+    The presses of A winning the prize step by b_x / gcd(a_x, b_x), and the
+    tokens are linear in them: the cheapest are the fewest or the most
+    presses of A.
+
+    Args:
+        a_x (int): X shift of the button A.
+        b_x (int): X shift of the button B.
+        prize_x (int): X position of the prize.
+
+    Returns:
+        int: Fewest tokens, 0 if the prize cannot be won.
+    """
+    step: int = b_x // math.gcd(a_x, b_x)
+    most: int = prize_x // a_x
+    a_presses: t.List[int] = [
+        next(
+            (
+                presses
+                for presses in candidates
+                if (prize_x - presses * a_x) % b_x == 0
+            ),
+            -1,
+        )
+        for candidates in (
+            range(min(step, most + 1)),
+            range(most, max(most - step, -1), -1),
+        )
+    ]
+    return min(
+        (
+            3 * presses + (prize_x - presses * a_x) // b_x
+            for presses in a_presses
+            if presses >= 0
+        ),
+        default=0,
+    )
+
+
+def solve_day_13_part_02(raw_input: str) -> int:
+    """Solve the button equations of the shifted prizes by elimination.
+
+    This is the solver of the day before its optimisation, kept as the
+    reference: the same elimination of the A presses, in exact fractions
+    instead of rounded floats, so that only whole presses win.
+
+    Args:
+        raw_input (str): Raw input.
+
+    Returns:
+        int: Fewest tokens needed to win all the possible prizes.
+    """
+    total: int = 0
+    for a_x, a_y, b_x, b_y, prize_x, prize_y in parse_claw_machines(raw_input):
+        prize_x += PRIZE_SHIFT
+        prize_y += PRIZE_SHIFT
+        # B = (Y - ay*X/ax) / (by - ay*bx/ax), then A = (X - bx*B) / ax.
+        divisor: fractions.Fraction = b_y - fractions.Fraction(a_y * b_x, a_x)
+        if not divisor:
+            if a_x * prize_y == a_y * prize_x:
+                total += get_collinear_tokens(a_x, b_x, prize_x)
+            continue
+        b_presses: fractions.Fraction = (
+            prize_y - fractions.Fraction(a_y * prize_x, a_x)
+        ) / divisor
+        a_presses: fractions.Fraction = (prize_x - b_x * b_presses) / a_x
+        if (
+            a_presses.denominator == b_presses.denominator == 1
+            and a_presses >= 0
+            and b_presses >= 0
+        ):
+            total += int(3 * a_presses + b_presses)
+    return total
+
+
+# Oracle of each day part.
+ORACLES: t.Dict[t.Tuple[int, int], t.Callable[[str], t.Any]] = {
+    (1, 1): solve_day_01_part_01,
+    (1, 2): solve_day_01_part_02,
+    (6, 1): solve_day_06_part_01,
+    (6, 2): solve_day_06_part_02,
+    (9, 1): solve_day_09_part_01,
+    (9, 2): solve_day_09_part_02,
+    (13, 1): solve_day_13_part_01,
+    (13, 2): solve_day_13_part_02,
+}
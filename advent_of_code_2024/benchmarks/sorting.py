@@ -0,0 +1,403 @@
+"""Benchmarks of the day 1 sorts over location IDs"""
+
+import functools
+import math
+import os
+import random
+import time
+import typing as t
+from array import array
+
+from advent_of_code_2024.common.integer_sort import counting_sort
+from advent_of_code_2024.common.parallel import (
+    get_configured_parallel_workers,
+    get_parallel_mode,
+    set_parallel_mode,
+)
+
+SORT_BENCHMARK_SIZES: t.List[int] = [
+    1_000,
+    10_000,
+    100_000,
+    1_000_000,
+    10_000_000,
+    100_000_000,
+]
+SCALING_BENCHMARK_SIZES: t.List[int] = [1_000_000, 10_000_000]
+# Location IDs of the generated day 1 inputs.
+LOWEST_LOCATION_ID: int = 10_000
+HIGHEST_LOCATION_ID: int = 99_999
+# Number of IDs generated at once, to bound the memory of the generation.
+GENERATION_CHUNK_SIZE: int = 1 << 20
+
+
+class SortComparison:
+    """Sort comparison class: timings of both sorts on one list."""
+
+    size: int
+    status: str
+    sorted_seconds: float
+    counting_seconds: float
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.status = "pending"
+        self.sorted_seconds = 0.0
+        self.counting_seconds = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"SortComparison(Size: {self.size}, Status: {self.status}, "
+            f"Speedup: {self.speedup:.2f})"
+        )
+
+    @property
+    def speedup(self) -> float:
+        """Speedup of the counting sort over sorted().
+
+        Returns:
+            float: sorted() duration divided by the counting sort duration.
+        """
+        if self.counting_seconds <= 0:
+            return math.inf
+        return self.sorted_seconds / self.counting_seconds
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Convert the comparison to a JSON serializable dictionary.
+
+        Returns:
+            t.Dict[str, t.Any]: Comparison as a dictionary.
+        """
+        return {
+            "size": self.size,
+            "status": self.status,
+            "sorted_seconds": self.sorted_seconds,
+            "counting_seconds": self.counting_seconds,
+            "speedup": self.speedup,
+        }
+
+
+class ScalingResult:
+    """Scaling result class: timing of the parallel distance computation
+    with a number of workers, against the sequential one."""
+
+    size: int
+    workers: int
+    sequential_seconds: float
+    parallel_seconds: float
+
+    def __init__(
+        self,
+        size: int,
+        workers: int,
+        sequential_seconds: float,
+        parallel_seconds: float,
+    ) -> None:
+        self.size = size
+        self.workers = workers
+        self.sequential_seconds = sequential_seconds
+        self.parallel_seconds = parallel_seconds
+
+    def __repr__(self) -> str:
+        return (
+            f"ScalingResult(Size: {self.size}, Workers: {self.workers}, "
+            f"Speedup: {self.speedup:.2f})"
+        )
+
+    @property
+    def speedup(self) -> float:
+        """Speedup of the parallel computation over the sequential one.
+
+        Returns:
+            float: Sequential duration divided by the parallel duration.
+        """
+        if self.parallel_seconds <= 0:
+            return math.inf
+        return self.sequential_seconds / self.parallel_seconds
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Convert the result to a JSON serializable dictionary.
+
+        Returns:
+            t.Dict[str, t.Any]: Result as a dictionary.
+        """
+        return {
+            "size": self.size,
+            "workers": self.workers,
+            "sequential_seconds": self.sequential_seconds,
+            "parallel_seconds": self.parallel_seconds,
+            "speedup": self.speedup,
+        }
+
+
+def generate_location_ids(size: int, seed: int = 0) -> "array[int]":
+    """Generate a list of location IDs, as in the day 1 inputs.
+
+    Args:
+        size (int): Number of IDs.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        array[int]: Location IDs.
+    """
+    rng: random.Random = random.Random(seed)
+    location_ids: range = range(LOWEST_LOCATION_ID, HIGHEST_LOCATION_ID + 1)
+    values: "array[int]" = array("q")
+    for start in range(0, size, GENERATION_CHUNK_SIZE):
+        values.extend(
+            rng.choices(
+                location_ids, k=min(GENERATION_CHUNK_SIZE, size - start)
+            )
+        )
+    return values
+
+
+def time_sort(
+    sort: t.Callable[[t.Sequence[int]], t.Sequence[int]],
+    values: t.Sequence[int],
+    repeats: int,
+) -> t.Tuple[float, t.Sequence[int]]:
+    """Time a sort function, keeping the best of several runs.
+
+    Args:
+        sort (t.Callable[[t.Sequence[int]], t.Sequence[int]]): Sort function.
+        values (t.Sequence[int]): Integers to sort.
+        repeats (int): Number of runs.
+
+    Returns:
+        t.Tuple[float, t.Sequence[int]]: Best wall time, in seconds, and the
+            sorted integers.
+    """
+    best: float = math.inf
+    sorted_values: t.Sequence[int] = []
+    for _ in range(max(repeats, 1)):
+        # The previous result is released before the next run allocates.
+        sorted_values = []
+        start: float = time.perf_counter()
+        sorted_values = sort(values)
+        best = min(best, time.perf_counter() - start)
+    return best, sorted_values
+
+
+def compare_sorts(
+    sizes: t.List[int], **options: t.Any
+) -> t.List[SortComparison]:
+    """Time sorted() and the counting sort over lists of increasing sizes.
+
+    The counting sort runs at every size, even below the density from which
+    sort_integers picks it, to show from which size it overtakes sorted().
+    As in run_benchmark, the sweep stops as soon as a sort takes more
+    than max_seconds, larger sizes are reported as skipped. A size whose
+    sorts disagree is reported as a mismatch.
+
+    Args:
+        sizes (t.List[int]): List sizes.
+        **options (t.Any): seed (generation seed, defaults to 0), repeats
+            (runs per size, defaults to 3) and max_seconds (time limit of a
+            sort, defaults to 10).
+
+    Returns:
+        t.List[SortComparison]: Comparison of each size.
+    """
+    seed: int = options.get("seed", 0)
+    repeats: int = options.get("repeats", 3)
+    max_seconds: float = options.get("max_seconds", 10.0)
+    comparisons: t.List[SortComparison] = [
+        SortComparison(size) for size in sorted(sizes)
+    ]
+    too_slow: bool = False
+    for comparison in comparisons:
+        if too_slow:
+            comparison.status = "skipped"
+            continue
+        values: "array[int]" = generate_location_ids(comparison.size, seed)
+        comparison.sorted_seconds, expected = time_sort(sorted, values, repeats)
+        # The lists are compared as arrays, without a second list of ints.
+        expected = array("q", expected)
+        comparison.counting_seconds, actual = time_sort(
+            functools.partial(
+                counting_sort,
+                lowest=LOWEST_LOCATION_ID,
+                highest=HIGHEST_LOCATION_ID,
+            ),
+            values,
+            repeats,
+        )
+        comparison.status = "ok" if actual == expected else "mismatch"
+        too_slow = (
+            comparison.status != "ok"
+            or max(comparison.sorted_seconds, comparison.counting_seconds)
+            > max_seconds
+        )
+    return comparisons
+
+
+def format_sort_comparisons(comparisons: t.List[SortComparison]) -> str:
+    """Format sort comparisons as a text table.
+
+    Args:
+        comparisons (t.List[SortComparison]): Sort comparisons.
+
+    Returns:
+        str: Text table, one line per size.
+    """
+    return "\n".join(
+        (
+            f"Size {comparison.size}: {comparison.sorted_seconds:.4f}s -> "
+            f"{comparison.counting_seconds:.4f}s (x{comparison.speedup:.2f})"
+            if comparison.status == "ok"
+            else f"Size {comparison.size}: {comparison.status}"
+        )
+        for comparison in comparisons
+    )
+
+
+def get_worker_counts() -> t.List[int]:
+    """List the numbers of workers the scaling is measured with.
+
+    Returns:
+        t.List[int]: Powers of two below the number of CPUs, and the
+            number of CPUs.
+    """
+    cpu_count: int = os.cpu_count() or 1
+    return sorted(
+        {
+            *(1 << power for power in range(cpu_count.bit_length())),
+            cpu_count,
+        }
+    )
+
+
+def time_distance(
+    compute: t.Callable[[t.Sequence[int], t.Sequence[int]], int],
+    lists: t.Tuple[t.Sequence[int], t.Sequence[int]],
+    repeats: int,
+) -> t.Tuple[float, int]:
+    """Time a total distance computation, keeping the best of several runs.
+
+    Args:
+        compute (t.Callable[[t.Sequence[int], t.Sequence[int]], int]):
+            Total distance function.
+        lists (t.Tuple[t.Sequence[int], t.Sequence[int]]): Both lists.
+        repeats (int): Number of runs.
+
+    Returns:
+        t.Tuple[float, int]: Best wall time, in seconds, and the distance.
+    """
+    best: float = math.inf
+    distance: int = 0
+    for _ in range(max(repeats, 1)):
+        start: float = time.perf_counter()
+        distance = compute(*lists)
+        best = min(best, time.perf_counter() - start)
+    return best, distance
+
+
+def measure_scaling(
+    size: int, seed: int, repeats: int, worker_counts: t.List[int]
+) -> t.List[ScalingResult]:
+    """Time the parallel total distance of one size, in process mode.
+
+    Args:
+        size (int): List size.
+        seed (int): Generation seed.
+        repeats (int): Runs per number of workers.
+        worker_counts (t.List[int]): Numbers of workers.
+
+    Raises:
+        ValueError: If a parallel distance differs from the sequential one.
+
+    Returns:
+        t.List[ScalingResult]: Result of each number of workers.
+    """
+    # The solver is imported here, as the command line imports this module
+    # for every command.
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2024.day_01.part_01.main import (
+        compute_total_distance,
+        compute_total_distance_parallel,
+    )
+
+    lists: t.Tuple["array[int]", "array[int]"] = (
+        generate_location_ids(size, seed),
+        generate_location_ids(size, seed + 1),
+    )
+    sequential_seconds, expected = time_distance(
+        compute_total_distance, lists, repeats
+    )
+    results: t.List[ScalingResult] = []
+    for workers in worker_counts:
+        set_parallel_mode("process", workers)
+        parallel_seconds, distance = time_distance(
+            compute_total_distance_parallel, lists, repeats
+        )
+        if distance != expected:
+            raise ValueError(
+                f"Parallel distance {distance} differs from "
+                f"{expected} with {workers} workers."
+            )
+        results.append(
+            ScalingResult(size, workers, sequential_seconds, parallel_seconds)
+        )
+    return results
+
+
+def compare_workers(
+    sizes: t.List[int],
+    *,
+    seed: int = 0,
+    repeats: int = 3,
+    worker_counts: t.List[int] | None = None,
+) -> t.List[ScalingResult]:
+    """Time the parallel total distance against the sequential one-liner.
+
+    The parallel computation runs in process mode with 1, 2, 4, ... workers
+    up to the number of CPUs, one shard per worker. The previous parallel
+    settings are restored on exit.
+
+    Args:
+        sizes (t.List[int]): List sizes.
+        seed (int, optional): Generation seed. Defaults to 0.
+        repeats (int, optional): Runs per size and number of workers.
+            Defaults to 3.
+        worker_counts (t.List[int] | None, optional): Numbers of workers.
+            Defaults to None (get_worker_counts()).
+
+    Returns:
+        t.List[ScalingResult]: Result of each size and number of workers.
+    """
+    counts: t.List[int] = (
+        worker_counts if worker_counts is not None else get_worker_counts()
+    )
+    parallel_mode: str = get_parallel_mode()
+    parallel_workers: int | None = get_configured_parallel_workers()
+    results: t.List[ScalingResult] = []
+    try:
+        for size in sorted(sizes):
+            results.extend(measure_scaling(size, seed, repeats, counts))
+    finally:
+        set_parallel_mode(parallel_mode, parallel_workers)
+    return results
+
+
+def format_scaling(results: t.List[ScalingResult]) -> str:
+    """Format scaling results as a text table.
+
+    Args:
+        results (t.List[ScalingResult]): Scaling results.
+
+    Returns:
+        str: Text table, one line per size.
+    """
+    sizes: t.Dict[int, t.List[ScalingResult]] = {}
+    for result in results:
+        sizes.setdefault(result.size, []).append(result)
+    return "\n".join(
+        f"Size {size}: sequential {size_results[0].sequential_seconds:.4f}s | "
+        + ", ".join(
+            f"{result.workers} workers: {result.parallel_seconds:.4f}s "
+            f"(x{result.speedup:.2f})"
+            for result in size_results
+        )
+        for size, size_results in sorted(sizes.items())
+    )
@@ -0,0 +1,217 @@
+"""Common methods shared by all the days"""
+
+import contextlib
+import mmap
+import os
+import re
+import typing as t
+from array import array
+
+Buffer = t.Union[bytes, bytearray, mmap.mmap]
+RawInput = t.Union[str, Buffer]
+
+ASCII_ZERO: int = ord("0")
+
+INT_REGEX: re.Pattern[bytes] = re.compile(rb"-?\d+")
+INT_OR_NEWLINE_REGEX: re.Pattern[bytes] = re.compile(rb"-?\d+|\n")
+LINE_REGEX: re.Pattern[bytes] = re.compile(rb"[^\r\n]+")
+SECTION_SEPARATOR_REGEX: re.Pattern[bytes] = re.compile(rb"\r?\n[ \t]*\r?\n")
+
+
+def get_input_path(file_name: str, from_file: str) -> str:
+    """Get the absolute path of an input file stored next to a module.
+
+    Args:
+        file_name (str): Input file name.
+        from_file (str): File from where the method is called.
+
+    Returns:
+        str: Absolute path to the input file.
+    """
+    return os.path.realpath(
+        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
+    )
+
+
+@contextlib.contextmanager
+def map_input(path: str) -> t.Iterator[Buffer]:
+    """Memory-map an input file in read-only mode.
+
+    The mapping is only valid inside the context, parsed values must
+    not keep references to it.
+
+    Args:
+        path (str): Path to the input file.
+
+    Yields:
+        Buffer: Content of the file (empty bytes for an empty file).
+    """
+    with open(path, "rb") as file_descriptor:
+        if os.fstat(file_descriptor.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(
+            file_descriptor.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped_file:
+            yield mapped_file
+
+
+def map_input_file(file_name: str, from_file: str) -> t.ContextManager[Buffer]:
+    """Memory-map an input file stored next to a module.
+
+    Args:
+        file_name (str): Input file name.
+        from_file (str): File from where the method is called.
+
+    Returns:
+        t.ContextManager[Buffer]: Context holding the content of the file.
+    """
+    return map_input(get_input_path(file_name, from_file))
+
+
+def to_buffer(raw_input: RawInput) -> Buffer:
+    """Get a bytes-like view of a raw input.
+
+    Args:
+        raw_input (RawInput): Raw input as text, bytes or memory map.
+
+    Returns:
+        Buffer: Raw input as a bytes-like object.
+    """
+    if isinstance(raw_input, str):
+        return raw_input.encode("utf-8")
+    return raw_input
+
+
+def decode_raw_input(raw_input: RawInput) -> str:
+    """Decode a raw input to text.
+
+    Args:
+        raw_input (RawInput): Raw input as text, bytes or memory map.
+
+    Returns:
+        str: Raw input as text.
+    """
+    if isinstance(raw_input, str):
+        return raw_input
+    return bytes(raw_input).decode("utf-8")
+
+
+def iter_lines(raw_input: RawInput) -> t.Iterator[bytes]:
+    """Iterate over the non-empty lines of a raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Yields:
+        bytes: Line without its line terminator.
+    """
+    for line_match in LINE_REGEX.finditer(to_buffer(raw_input)):
+        yield line_match.group()
+
+
+def split_sections(raw_input: RawInput) -> t.List[bytes]:
+    """Split a raw input on its blank lines.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        t.List[bytes]: Non-empty sections.
+    """
+    return [
+        section.strip()
+        for section in SECTION_SEPARATOR_REGEX.split(to_buffer(raw_input))
+        if section.strip()
+    ]
+
+
+def extract_ints(raw_input: RawInput) -> "array[int]":
+    """Extract all the (signed) integers of a raw input in a single pass.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        array[int]: 64 bits integers, in order of appearance.
+    """
+    return array(
+        "q",
+        (
+            int(int_match.group())
+            for int_match in INT_REGEX.finditer(to_buffer(raw_input))
+        ),
+    )
+
+
+def extract_ints_per_line(raw_input: RawInput) -> t.List[t.List[int]]:
+    """Extract the (signed) integers of each line of a raw input.
+
+    Lines without any integer are skipped.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        t.List[t.List[int]]: Integers of each line.
+    """
+    lines: t.List[t.List[int]] = []
+    line: t.List[int] = []
+    for token_match in INT_OR_NEWLINE_REGEX.finditer(to_buffer(raw_input)):
+        token: bytes = token_match.group()
+        if token == b"\n":
+            if line:
+                lines.append(line)
+                line = []
+        else:
+            line.append(int(token))
+    if line:
+        lines.append(line)
+    return lines
+
+
+def parse_grid(raw_input: RawInput) -> t.Tuple[bytes, int, int]:
+    """Parse a rectangular grid of characters.
+
+    Args:
+        raw_input (RawInput): Raw input, one row per line.
+
+    Raises:
+        ValueError: If the rows do not have the same width.
+
+    Returns:
+        t.Tuple[bytes, int, int]: Flat cells (row major), width and height.
+    """
+    content: bytes = bytes(to_buffer(raw_input)).replace(b"\r", b"")
+    content = content.strip(b"\n")
+    if not content:
+        return b"", 0, 0
+    width: int = content.find(b"\n")
+    if width == -1:
+        width = len(content)
+    height: int = (len(content) + 1) // (width + 1)
+    # Every row but the last ends with a newline right after its width
+    # cells, and there is no other newline.
+    if (
+        len(content) != height * (width + 1) - 1
+        or content.count(b"\n") != height - 1
+        or content[width :: width + 1] != b"\n" * (height - 1)
+    ):
+        raise ValueError("Grid rows must have the same width.")
+    return content.replace(b"\n", b""), width, height
+
+
+def parse_char_rows(raw_input: RawInput) -> t.List[t.List[str]]:
+    """Parse a rectangular grid of characters as a list of rows.
+
+    Args:
+        raw_input (RawInput): Raw input, one row per line.
+
+    Returns:
+        t.List[t.List[str]]: Grid rows.
+    """
+    cells, width, height = parse_grid(raw_input)
+    text: str = cells.decode("ascii")
+    return [
+        list(text[row * width : (row + 1) * width]) for row in range(height)
+    ]
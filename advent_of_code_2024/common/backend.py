@@ -0,0 +1,100 @@
+"""Selection of the optional NumPy backend of the vectorisable solutions"""
+
+import functools
+import importlib.util
+import os
+import typing as t
+import warnings
+
+BACKEND_ENV: str = "AOC_BACKEND"
+BACKENDS: t.Tuple[str, ...] = ("python", "numpy", "auto")
+# Exclusive bound of the values the NumPy backend computes in int64.
+INT64_LIMIT: int = 2**63
+
+# pylint: disable-next=invalid-name
+_backend: str = os.environ.get(BACKEND_ENV) or "auto"
+# pylint: disable-next=invalid-name
+_numpy_warning_emitted: bool = False
+
+
+@functools.cache
+def is_numpy_available() -> bool:
+    """Check whether NumPy can be imported, without importing it.
+
+    Returns:
+        bool: True if NumPy is installed.
+    """
+    return importlib.util.find_spec("numpy") is not None
+
+
+def set_backend(backend: str) -> None:
+    """Set the backend of the vectorisable solutions.
+
+    Args:
+        backend (str): "python" (the reference implementations), "numpy" or
+            "auto" (NumPy when it is installed, Python otherwise).
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    global _backend  # pylint: disable=global-statement
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    _backend = backend
+
+
+def get_backend() -> str:
+    """Get the configured backend.
+
+    Returns:
+        str: Backend, as given to set_backend.
+    """
+    return _backend
+
+
+def get_effective_backend() -> str:
+    """Get the backend actually used.
+
+    The NumPy backend falls back to Python when NumPy is not installed, a
+    warning is emitted once when it was explicitly requested.
+
+    Returns:
+        str: "python" or "numpy".
+    """
+    global _numpy_warning_emitted  # pylint: disable=global-statement
+    if _backend == "python":
+        return "python"
+    if is_numpy_available():
+        return "numpy"
+    if _backend == "numpy" and not _numpy_warning_emitted:
+        _numpy_warning_emitted = True
+        warnings.warn(
+            "NumPy is not installed: the Python backend is used",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+    return "python"
+
+
+def use_numpy() -> bool:
+    """Check whether the solutions run their NumPy implementation.
+
+    Returns:
+        bool: True if the effective backend is NumPy.
+    """
+    return get_effective_backend() == "numpy"
+
+
+def fits_int64(bound: int) -> bool:
+    """Check whether values up to a bound can be computed in int64.
+
+    The NumPy implementations only run when their intermediate values fit,
+    so that they give the same answers as the Python ones.
+
+    Args:
+        bound (int): Largest absolute value of the computation.
+
+    Returns:
+        bool: True if the values cannot overflow.
+    """
+    return bound < INT64_LIMIT
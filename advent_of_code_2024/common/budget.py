@@ -0,0 +1,335 @@
+"""Time and memory budgets of the solutions, with progress reporting"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import typing as t
+
+# Seconds between two checks of the budget by a progress tracker.
+CHECK_INTERVAL: float = 0.1
+# Seconds between two progress reports.
+DEFAULT_REPORT_INTERVAL: float = 1.0
+# Memory statistics of the process on Linux, in pages.
+PROC_STATM_PATH: str = "/proc/self/statm"
+
+
+class ProgressReport:  # pylint: disable=too-few-public-methods
+    """Progress report class: snapshot of a long-running loop."""
+
+    name: str
+    done: int
+    total: int | None
+    elapsed: float
+    memory: int
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        name: str,
+        done: int,
+        total: int | None,
+        elapsed: float,
+        memory: int,
+    ) -> None:
+        self.name = name
+        self.done = done
+        self.total = total
+        self.elapsed = elapsed
+        self.memory = memory
+
+    def __repr__(self) -> str:
+        return (
+            f"ProgressReport(Name: {self.name}, Done: {self.done}, "
+            f"Total: {self.total})"
+        )
+
+    def __str__(self) -> str:
+        fraction: float | None = self.fraction
+        return (
+            f"{self.name}: {self.done}"
+            + (
+                f"/{self.total} ({fraction:.1%})"
+                if fraction is not None
+                else ""
+            )
+            + f", {self.items_per_second:.1f} items/s, {self.elapsed:.1f}s"
+        )
+
+    @property
+    def fraction(self) -> float | None:
+        """Fraction of the items done.
+
+        Returns:
+            float | None: Fraction between 0 and 1, None if the total is
+                unknown.
+        """
+        if not self.total:
+            return None
+        return min(self.done / self.total, 1.0)
+
+    @property
+    def items_per_second(self) -> float:
+        """Items done per second.
+
+        Returns:
+            float: Rate since the loop started.
+        """
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Convert the report to a JSON serializable dictionary.
+
+        Returns:
+            t.Dict[str, t.Any]: Report as a dictionary.
+        """
+        return {
+            "name": self.name,
+            "done": self.done,
+            "total": self.total,
+            "fraction": self.fraction,
+            "items_per_second": self.items_per_second,
+            "elapsed": self.elapsed,
+            "memory": self.memory,
+        }
+
+
+class BudgetExceededError(Exception):
+    """Budget exceeded error: a solution ran out of time or memory.
+
+    The progress of the loop that exceeded the budget is attached, so that
+    an aborted run still reports how far it went.
+    """
+
+    progress: ProgressReport
+
+    def __init__(self, message: str, progress: ProgressReport) -> None:
+        super().__init__(message)
+        self.progress = progress
+
+
+class Budget:
+    """Budget class: limits of the current solution run.
+
+    The clock starts and the memory baseline is taken when the budget is
+    reset, at the start of each run: the memory budget bounds the memory
+    a run adds to the process, not the memory left by the previous ones.
+    """
+
+    max_seconds: float | None
+    max_memory: int | None
+    report_interval: float
+    reporter: t.Callable[[ProgressReport], None] | None
+    start: float
+    memory_baseline: int
+
+    def __init__(
+        self,
+        max_seconds: float | None = None,
+        max_memory: int | None = None,
+        reporter: t.Callable[[ProgressReport], None] | None = None,
+        report_interval: float = DEFAULT_REPORT_INTERVAL,
+    ) -> None:
+        self.max_seconds = max_seconds
+        self.max_memory = max_memory
+        self.reporter = reporter
+        self.report_interval = report_interval
+        self.start = time.perf_counter()
+        self.memory_baseline = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"Budget(Seconds: {self.max_seconds}, "
+            f"Memory: {self.max_memory})"
+        )
+
+    def get_used_memory(self) -> int:
+        """Get the memory the run added to the process.
+
+        Returns:
+            int: Memory used since the baseline, in bytes.
+        """
+        return max(get_memory_usage() - self.memory_baseline, 0)
+
+    def get_remaining_memory(self) -> int | None:
+        """Get the memory the run may still use.
+
+        Returns:
+            int | None: Memory budget minus the memory used by the run, in
+                bytes, None without memory budget.
+        """
+        if self.max_memory is None:
+            return None
+        return max(self.max_memory - self.get_used_memory(), 0)
+
+    def check(self, progress: ProgressReport) -> None:
+        """Check that a loop is within the budget.
+
+        Args:
+            progress (ProgressReport): Progress of the loop.
+
+        Raises:
+            BudgetExceededError: If the time or the memory budget is
+                exceeded.
+        """
+        elapsed: float = time.perf_counter() - self.start
+        if self.max_seconds is not None and elapsed > self.max_seconds:
+            raise BudgetExceededError(
+                f"Time budget of {self.max_seconds}s exceeded "
+                f"in {progress.name}",
+                progress,
+            )
+        if self.max_memory is not None and progress.memory > self.max_memory:
+            raise BudgetExceededError(
+                f"Memory budget of {self.max_memory} bytes exceeded "
+                f"in {progress.name}",
+                progress,
+            )
+
+
+def print_progress(progress: ProgressReport) -> None:
+    """Report progress on the standard error, one line per report.
+
+    Args:
+        progress (ProgressReport): Progress to report.
+    """
+    sys.stderr.write(f"{progress}\n")
+    sys.stderr.flush()
+
+
+# Budget of the current run, None when the runs are unbounded and silent.
+# pylint: disable-next=invalid-name
+_budget: Budget | None = None
+_budget_lock: threading.Lock = threading.Lock()
+
+
+def set_budget(budget: Budget | None) -> None:
+    """Set the budget of the next runs.
+
+    Args:
+        budget (Budget | None): Budget, None for unbounded silent runs.
+    """
+    global _budget  # pylint: disable=global-statement
+    _budget = budget
+
+
+def get_budget() -> Budget | None:
+    """Get the budget of the runs.
+
+    Returns:
+        Budget | None: Budget, None when the runs are unbounded and silent.
+    """
+    return _budget
+
+
+def reset_budget() -> None:
+    """Restart the clock of the budget and take its memory baseline, at the
+    start of a run, once the memory is measured as during the run."""
+    if _budget is not None:
+        _budget.start = time.perf_counter()
+        _budget.memory_baseline = get_memory_usage()
+
+
+def get_memory_usage() -> int:
+    """Get the memory currently used by the process.
+
+    Returns:
+        int: Memory traced by tracemalloc when it runs (as in the runner),
+            resident set size otherwise, 0 when it is unknown (outside of
+            Linux).
+    """
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    try:
+        with open(PROC_STATM_PATH, "r", encoding="utf-8") as statm_file:
+            resident_pages: int = int(statm_file.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class ProgressTracker:
+    """Progress tracker class: progress of a loop of a solution.
+
+    Solutions advance the tracker as they go: every CHECK_INTERVAL seconds,
+    it checks the budget and, every report interval, reports the progress.
+    Without budget, advancing only increments a counter.
+    """
+
+    name: str
+    total: int | None
+    done: int
+    start: float
+    next_check: float
+    next_report: float
+    budget: Budget | None
+
+    def __init__(self, name: str, total: int | None = None) -> None:
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.budget = _budget
+        self.start = time.perf_counter()
+        self.next_check = self.start + CHECK_INTERVAL
+        self.next_report = self.start + (
+            self.budget.report_interval if self.budget is not None else 0.0
+        )
+
+    def __repr__(self) -> str:
+        return f"ProgressTracker(Name: {self.name}, Done: {self.done})"
+
+    def snapshot(self) -> ProgressReport:
+        """Take a snapshot of the progress.
+
+        Returns:
+            ProgressReport: Progress so far.
+        """
+        return ProgressReport(
+            self.name,
+            self.done,
+            self.total,
+            time.perf_counter() - self.start,
+            (
+                self.budget.get_used_memory()
+                if self.budget is not None
+                else get_memory_usage()
+            ),
+        )
+
+    def advance(self, amount: int = 1) -> None:
+        """Record items done, and check the budget when it is time to.
+
+        Args:
+            amount (int, optional): Number of items done. Defaults to 1.
+
+        Raises:
+            BudgetExceededError: If the budget is exceeded.
+        """
+        self.done += amount
+        if self.budget is None:
+            return
+        now: float = time.perf_counter()
+        if now < self.next_check:
+            return
+        self.next_check = now + CHECK_INTERVAL
+        progress: ProgressReport = self.snapshot()
+        if self.budget.reporter is not None and now >= self.next_report:
+            self.next_report = now + self.budget.report_interval
+            with _budget_lock:
+                self.budget.reporter(progress)
+        self.budget.check(progress)
+
+
+def track_progress(name: str, total: int | None = None) -> ProgressTracker:
+    """Start tracking the progress of a loop, against the current budget.
+
+    Args:
+        name (str): Name of the loop, shown in the reports.
+        total (int | None, optional): Number of items of the loop.
+            Defaults to None (unknown).
+
+    Returns:
+        ProgressTracker: Tracker to advance as items are done.
+    """
+    return ProgressTracker(name, total)
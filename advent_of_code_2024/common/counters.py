@@ -0,0 +1,63 @@
+"""Counters of the domain metrics reported by the solutions"""
+
+import threading
+import typing as t
+
+# Counters of the current run, None when counting is disabled.
+# pylint: disable-next=invalid-name
+_counters: t.Dict[str, int] | None = None
+_counters_lock: threading.Lock = threading.Lock()
+
+
+def set_counters_enabled(enabled: bool) -> None:
+    """Enable or disable the counters, their values are reset.
+
+    Args:
+        enabled (bool): Whether the solutions counters are recorded.
+    """
+    global _counters  # pylint: disable=global-statement
+    _counters = {} if enabled else None
+
+
+def are_counters_enabled() -> bool:
+    """Check whether the counters are recorded.
+
+    Returns:
+        bool: True if the counters are enabled.
+    """
+    return _counters is not None
+
+
+def reset_counters() -> None:
+    """Reset the counters values, if they are enabled."""
+    if _counters is not None:
+        with _counters_lock:
+            _counters.clear()
+
+
+def add_count(name: str, amount: int) -> None:
+    """Add an amount to a counter.
+
+    Solutions count in local variables and call this function once per
+    search or walk, so that a disabled counter only costs a function call.
+
+    Args:
+        name (str): Counter name.
+        amount (int): Amount to add.
+    """
+    if _counters is None:
+        return
+    with _counters_lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def get_counters() -> t.Dict[str, int]:
+    """Get the counters values.
+
+    Returns:
+        t.Dict[str, int]: Value of each counter, empty when disabled.
+    """
+    if _counters is None:
+        return {}
+    with _counters_lock:
+        return dict(_counters)
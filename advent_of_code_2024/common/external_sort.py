@@ -0,0 +1,210 @@
+"""External sort of integers that do not fit in memory"""
+
+import contextlib
+import heapq
+import os
+import shutil
+import tempfile
+import typing as t
+from array import array
+
+# Memory taken by an integer being sorted in memory: its slots in the typed
+# buffer, in the copy of the spilled run, in the sorted list and in the
+# written array, and the integer object itself.
+SORT_BYTES_PER_ITEM: int = 64
+# Most runs merged at once: more runs are first merged in passes into
+# intermediate runs, so that the open files and the read blocks do not grow
+# with the number of runs.
+MAX_MERGE_FAN_IN: int = 64
+
+
+def iter_run(path: str, block_items: int) -> t.Iterator[int]:
+    """Iterate over the integers of a sorted run file, one block at a time.
+
+    Args:
+        path (str): Path to the run file.
+        block_items (int): Number of integers read at once.
+
+    Yields:
+        int: Integers of the run, in order.
+    """
+    with open(path, "rb") as run_file:
+        while True:
+            block: "array[int]" = array("q")
+            try:
+                block.fromfile(run_file, block_items)
+            except EOFError:
+                # The last block is shorter, what was read is kept.
+                yield from block
+                return
+            yield from block
+
+
+class ExternalSorter:
+    """External sorter class: sorts more integers than memory can hold.
+
+    Integers are buffered in memory until the memory limit is reached,
+    then the buffer is sorted and spilled to a run file of a temporary
+    directory. Sorted integers are produced by a k-way merge of the runs,
+    reading each of them in blocks. Beyond MAX_MERGE_FAN_IN runs, the
+    oldest ones are first merged by groups into new runs, so that a merge
+    opens at most MAX_MERGE_FAN_IN files and its blocks together stay
+    within the memory limit. The runs are numbered in order, only the
+    first and the next numbers are kept: the memory does not depend on the
+    input size. Without any spilled run, the sort stays in memory. The
+    temporary directory is removed when the sorter is closed.
+    """
+
+    max_items: int
+    directory: str | None
+    buffer: "array[int]"
+    run_directory: str | None
+    first_run: int
+    next_run: int
+
+    def __init__(self, max_memory: int, directory: str | None = None) -> None:
+        """Initialize the external sorter.
+
+        Args:
+            max_memory (int): Memory the sorter may use, in bytes.
+            directory (str | None, optional): Directory of the run files.
+                Defaults to None (the system temporary directory).
+
+        Raises:
+            ValueError: If the memory cannot hold any integer.
+        """
+        if max_memory < SORT_BYTES_PER_ITEM:
+            raise ValueError(f"Memory too small to sort: {max_memory} bytes")
+        self.max_items = max_memory // SORT_BYTES_PER_ITEM
+        self.directory = directory
+        self.buffer = array("q")
+        self.run_directory = None
+        self.first_run = 0
+        self.next_run = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ExternalSorter(Max items: {self.max_items}, "
+            f"Runs: {self.run_count})"
+        )
+
+    def __enter__(self) -> "ExternalSorter":
+        return self
+
+    def __exit__(self, *_: t.Any) -> None:
+        self.close()
+
+    @property
+    def run_count(self) -> int:
+        """Number of runs not merged yet.
+
+        Returns:
+            int: Number of run files.
+        """
+        return self.next_run - self.first_run
+
+    def get_run_path(self, run: int) -> str:
+        """Get the path of a run file.
+
+        Args:
+            run (int): Run number.
+
+        Returns:
+            str: Path to the run file.
+        """
+        return os.path.join(t.cast(str, self.run_directory), f"{run}.run")
+
+    def extend(self, values: t.Iterable[int]) -> None:
+        """Add integers to sort, spilling a run whenever memory is full.
+
+        Args:
+            values (t.Iterable[int]): Integers.
+        """
+        self.buffer.extend(values)
+        while len(self.buffer) >= self.max_items:
+            self.spill(self.buffer[: self.max_items])
+            del self.buffer[: self.max_items]
+
+    def create_run(self) -> t.BinaryIO:
+        """Create the next run file, removed when the sorter is closed.
+
+        Returns:
+            t.BinaryIO: Run file, open for writing.
+        """
+        if self.run_directory is None:
+            self.run_directory = tempfile.mkdtemp(
+                prefix="aoc_sort_", dir=self.directory
+            )
+        self.next_run += 1
+        return open(self.get_run_path(self.next_run - 1), "wb")
+
+    def spill(self, values: "array[int]") -> None:
+        """Sort integers and write them to a new run file.
+
+        Args:
+            values (array[int]): Integers of the run.
+        """
+        with self.create_run() as run_file:
+            array("q", sorted(values)).tofile(run_file)
+
+    def merge_runs(self, run_count: int, block_items: int) -> None:
+        """Merge the oldest runs into a new run file, then remove them.
+
+        Args:
+            run_count (int): Number of runs to merge.
+            block_items (int): Number of integers read from each run, and
+                written to the new one, at once.
+        """
+        runs: range = range(self.first_run, self.first_run + run_count)
+        self.first_run += run_count
+        try:
+            with self.create_run() as run_file:
+                block: "array[int]" = array("q")
+                for value in heapq.merge(
+                    *(
+                        iter_run(self.get_run_path(run), block_items)
+                        for run in runs
+                    )
+                ):
+                    block.append(value)
+                    if len(block) >= block_items:
+                        block.tofile(run_file)
+                        block = array("q")
+                block.tofile(run_file)
+        finally:
+            for run in runs:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(self.get_run_path(run))
+
+    def sorted(self) -> t.Iterator[int]:
+        """Merge the integers added so far, in ascending order.
+
+        Returns:
+            t.Iterator[int]: Sorted integers.
+        """
+        if not self.run_count:
+            return iter(sorted(self.buffer))
+        if self.buffer:
+            self.spill(self.buffer)
+            self.buffer = array("q")
+        # The blocks read from the runs, and the written one, are together
+        # at most as large as the buffer.
+        pass_block_items: int = max(self.max_items // (MAX_MERGE_FAN_IN + 1), 1)
+        while self.run_count > MAX_MERGE_FAN_IN:
+            self.merge_runs(MAX_MERGE_FAN_IN, pass_block_items)
+        block_items: int = max(self.max_items // self.run_count, 1)
+        return heapq.merge(
+            *(
+                iter_run(self.get_run_path(run), block_items)
+                for run in range(self.first_run, self.next_run)
+            )
+        )
+
+    def close(self) -> None:
+        """Remove the run files."""
+        if self.run_directory is not None:
+            shutil.rmtree(self.run_directory, ignore_errors=True)
+        self.run_directory = None
+        self.first_run = 0
+        self.next_run = 0
+        self.buffer = array("q")
@@ -0,0 +1,220 @@
+"""Compact grid of byte cells shared by the grid days"""
+
+import copy
+import typing as t
+
+from advent_of_code_2024.common import RawInput, parse_grid
+
+
+class Grid:
+    """Grid class: rectangular grid of byte cells in a single bytearray.
+
+    Cells are stored row after row, rows being `stride` cells apart: the
+    cell at (x, y) is at index `offset + y * stride + x`, and its neighbours
+    are at the indexes given by `neighbour_offsets`.
+
+    A grid with a border is surrounded by a ring of border cells: the
+    neighbours of every inner cell are valid indexes, so walks stop on the
+    border value instead of checking the coordinates.
+    """
+
+    cells: bytearray
+    width: int
+    height: int
+    border: int | None
+    stride: int
+    offset: int
+    # Offsets of the north, east, south and west neighbours, clockwise.
+    neighbour_offsets: t.Tuple[int, int, int, int]
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        fill: int = ord("."),
+        border: int | None = None,
+    ) -> None:
+        padding: int = 0 if border is None else 1
+        self.width = width
+        self.height = height
+        self.border = border
+        self.stride = width + 2 * padding
+        self.offset = padding * (self.stride + 1)
+        self.neighbour_offsets = (-self.stride, 1, self.stride, -1)
+        self.cells = bytearray([fill]) * (self.stride * (height + 2 * padding))
+        if border is not None:
+            self.cells[: self.stride] = bytes([border]) * self.stride
+            self.cells[-self.stride :] = bytes([border]) * self.stride
+            self.cells[:: self.stride] = bytes([border]) * (height + 2)
+            self.cells[self.stride - 1 :: self.stride] = bytes([border]) * (
+                height + 2
+            )
+
+    def __repr__(self) -> str:
+        return f"Grid(Width: {self.width}, Height: {self.height})"
+
+    def __str__(self) -> str:
+        return "\n".join(
+            bytes(self.row(y)).decode("latin-1") for y in range(self.height)
+        )
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    @classmethod
+    def from_cells(
+        cls,
+        cells: bytes,
+        width: int,
+        height: int,
+        border: int | None = None,
+    ) -> "Grid":
+        """Build a grid from flat cells holding no border.
+
+        Args:
+            cells (bytes): Flat cells, row major.
+            width (int): Grid width.
+            height (int): Grid height.
+            border (int | None, optional):
+                Border cells value. Defaults to None (no border).
+
+        Returns:
+            Grid: Grid.
+        """
+        grid: Grid = cls(width, height, border=border)
+        if border is None:
+            grid.cells[:] = cells
+            return grid
+        for y in range(height):
+            start: int = grid.index(0, y)
+            grid.cells[start : start + width] = cells[
+                y * width : (y + 1) * width
+            ]
+        return grid
+
+    @classmethod
+    def parse(cls, raw_input: RawInput, border: int | None = None) -> "Grid":
+        """Parse a grid of characters from a raw input.
+
+        Args:
+            raw_input (RawInput): Raw input, one row per line.
+            border (int | None, optional):
+                Border cells value. Defaults to None (no border).
+
+        Returns:
+            Grid: Grid.
+        """
+        cells, width, height = parse_grid(raw_input)
+        return cls.from_cells(cells, width, height, border)
+
+    def index(self, x: int, y: int) -> int:
+        """Get the index of a cell.
+
+        Args:
+            x (int): Column.
+            y (int): Row.
+
+        Returns:
+            int: Cell index.
+        """
+        return self.offset + y * self.stride + x
+
+    def position(self, index: int) -> t.Tuple[int, int]:
+        """Get the position of a cell.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            t.Tuple[int, int]: Column and row.
+        """
+        y, x = divmod(index - self.offset, self.stride)
+        return x, y
+
+    def contains(self, x: int, y: int) -> bool:
+        """Check if a position is inside the grid, border excluded.
+
+        Args:
+            x (int): Column.
+            y (int): Row.
+
+        Returns:
+            bool: True if the position is inside the grid.
+        """
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def row(self, y: int) -> memoryview:
+        """Get a row without copying it.
+
+        Args:
+            y (int): Row.
+
+        Returns:
+            memoryview: View of the row cells.
+        """
+        start: int = self.index(0, y)
+        return memoryview(self.cells)[start : start + self.width]
+
+    def indexes(self) -> t.Iterator[int]:
+        """Iterate over the indexes of the cells, border excluded.
+
+        Yields:
+            int: Cell index, row after row.
+        """
+        for y in range(self.height):
+            start: int = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find_all(self, value: int) -> t.List[int]:
+        """Find the cells holding a value, border excluded.
+
+        Args:
+            value (int): Cell value.
+
+        Returns:
+            t.List[int]: Cell indexes, row after row.
+        """
+        return [index for index in self.indexes() if self.cells[index] == value]
+
+    def find(self, value: int) -> int:
+        """Find the first cell holding a value, border excluded.
+
+        Args:
+            value (int): Cell value.
+
+        Returns:
+            int: Cell index, -1 if no cell holds the value.
+        """
+        for y in range(self.height):
+            start: int = self.index(0, y)
+            index: int = self.cells.find(value, start, start + self.width)
+            if index != -1:
+                return index
+        return -1
+
+    def count(self, value: int) -> int:
+        """Count the cells holding a value, border excluded.
+
+        Args:
+            value (int): Cell value.
+
+        Returns:
+            int: Number of cells.
+        """
+        count: int = self.cells.count(value)
+        if value == self.border:
+            count -= len(self.cells) - self.width * self.height
+        return count
+
+    def copy(self) -> "Grid":
+        """Copy the grid.
+
+        Returns:
+            Grid: Grid with a copy of the cells.
+        """
+        grid: Grid = copy.copy(self)
+        grid.cells = bytearray(self.cells)
+        return grid
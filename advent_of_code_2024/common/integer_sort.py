@@ -0,0 +1,101 @@
+"""Linear-time sorts of integers bounded by a small value range"""
+
+import itertools
+import typing as t
+from array import array
+from collections import Counter
+
+# Fewest items per value of the range for the counting sort to beat the
+# comparison sort: below, sorted() in C wins over the walk of the range.
+COUNTING_SORT_MIN_DENSITY: int = 3
+
+
+def get_value_range(values: t.Sequence[int]) -> t.Tuple[int, int] | None:
+    """Get the lowest and the highest of integers.
+
+    Args:
+        values (t.Sequence[int]): Integers, such as an array.
+
+    Returns:
+        t.Tuple[int, int] | None: Lowest and highest integers, None if there
+            is none.
+    """
+    if not values:
+        return None
+    return min(values), max(values)
+
+
+def is_dense(length: int, lowest: int, highest: int) -> bool:
+    """Check whether integers are dense enough to be sorted by counting.
+
+    Args:
+        length (int): Number of integers.
+        lowest (int): Lowest integer.
+        highest (int): Highest integer.
+
+    Returns:
+        bool: True if there are COUNTING_SORT_MIN_DENSITY integers or more
+            per value of the range.
+    """
+    return length >= COUNTING_SORT_MIN_DENSITY * (highest - lowest + 1)
+
+
+def count_values(
+    values: t.Sequence[int], lowest: int, highest: int
+) -> t.Tuple[t.List[int], t.List[int]]:
+    """Count the occurrences of integers, in ascending order.
+
+    The integers are counted in C by a Counter, then the range is walked
+    once: the cost is linear in the number of integers plus the range.
+
+    Args:
+        values (t.Sequence[int]): Integers, such as an array.
+        lowest (int): Lowest integer.
+        highest (int): Highest integer.
+
+    Returns:
+        t.Tuple[t.List[int], t.List[int]]: Distinct integers, ascending,
+            and the number of occurrences of each of them.
+    """
+    counts: Counter[int] = Counter(values)
+    distinct_values: t.List[int] = [
+        value for value in range(lowest, highest + 1) if value in counts
+    ]
+    return distinct_values, [counts[value] for value in distinct_values]
+
+
+def counting_sort(
+    values: t.Sequence[int], lowest: int, highest: int
+) -> "array[int]":
+    """Sort integers by counting their occurrences.
+
+    Args:
+        values (t.Sequence[int]): Integers fitting in int64.
+        lowest (int): Lowest integer.
+        highest (int): Highest integer.
+
+    Returns:
+        array[int]: Sorted integers.
+    """
+    distinct_values, counts = count_values(values, lowest, highest)
+    return array(
+        "q",
+        itertools.chain.from_iterable(
+            map(itertools.repeat, distinct_values, counts)
+        ),
+    )
+
+
+def sort_integers(values: t.Sequence[int]) -> "array[int]":
+    """Sort integers, by counting them when their range is small enough.
+
+    Args:
+        values (t.Sequence[int]): Integers fitting in int64.
+
+    Returns:
+        array[int]: Sorted integers.
+    """
+    value_range: t.Tuple[int, int] | None = get_value_range(values)
+    if value_range is not None and is_dense(len(values), *value_range):
+        return counting_sort(values, *value_range)
+    return array("q", sorted(values))
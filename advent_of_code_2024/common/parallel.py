@@ -0,0 +1,236 @@
+"""Parallel execution of the independent iterations of the solutions"""
+
+import os
+import sys
+import sysconfig
+import typing as t
+import warnings
+
+if t.TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+    from advent_of_code_2024.common.budget import ProgressTracker
+
+PARALLEL_MODE_ENV: str = "AOC_PARALLEL"
+PARALLEL_WORKERS_ENV: str = "AOC_PARALLEL_WORKERS"
+PARALLEL_MODES: t.Tuple[str, ...] = ("serial", "thread", "process", "auto")
+# Number of chunks given to each worker by the process executor, to balance
+# the load without sending each item on its own.
+CHUNKS_PER_WORKER: int = 4
+# Number of chunks given to each worker when the progress is tracked: finer
+# chunks report more often, and leave less work running once cancelled.
+PROGRESS_CHUNKS_PER_WORKER: int = 64
+# Seconds between two progress checks while waiting for a chunk.
+PROGRESS_POLL_INTERVAL: float = 0.1
+
+T = t.TypeVar("T")
+R = t.TypeVar("R")
+
+# pylint: disable-next=invalid-name
+_parallel_mode: str = os.environ.get(PARALLEL_MODE_ENV) or "serial"
+# pylint: disable-next=invalid-name
+_parallel_workers: int | None = (
+    int(os.environ[PARALLEL_WORKERS_ENV])
+    if os.environ.get(PARALLEL_WORKERS_ENV)
+    else None
+)
+# pylint: disable-next=invalid-name
+_gil_warning_emitted: bool = False
+
+
+def is_free_threaded() -> bool:
+    """Check whether threads run Python code in parallel.
+
+    Returns:
+        bool: True on a free-threaded build running with the GIL disabled.
+    """
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return False
+    is_gil_enabled: t.Callable[[], bool] | None = getattr(
+        sys, "_is_gil_enabled", None
+    )
+    return is_gil_enabled is None or not is_gil_enabled()
+
+
+def set_parallel_mode(mode: str, workers: int | None = None) -> None:
+    """Set how the independent iterations of the solutions are run.
+
+    Args:
+        mode (str): "serial", "thread", "process" or "auto" (threads on a
+            free-threaded interpreter, serial otherwise).
+        workers (int | None, optional):
+            Number of workers. Defaults to None (number of CPUs).
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    global _parallel_mode, _parallel_workers  # pylint: disable=global-statement
+    if mode not in PARALLEL_MODES:
+        raise ValueError(f"Unknown parallel mode: {mode}")
+    _parallel_mode = mode
+    _parallel_workers = workers
+
+
+def get_parallel_mode() -> str:
+    """Get the configured parallel mode.
+
+    Returns:
+        str: Parallel mode, as given to set_parallel_mode.
+    """
+    return _parallel_mode
+
+
+def get_configured_parallel_workers() -> int | None:
+    """Get the configured number of workers.
+
+    Returns:
+        int | None: Number of workers, as given to set_parallel_mode, None
+            for the number of CPUs.
+    """
+    return _parallel_workers
+
+
+def get_effective_parallel_mode() -> str:
+    """Get the parallel mode actually used.
+
+    Returns:
+        str: "serial", "thread" or "process".
+    """
+    if _parallel_mode == "auto":
+        return "thread" if is_free_threaded() else "serial"
+    return _parallel_mode
+
+
+def get_parallel_workers() -> int:
+    """Get the number of workers actually used.
+
+    Returns:
+        int: Number of workers, 1 when running serially.
+    """
+    if get_effective_parallel_mode() == "serial":
+        return 1
+    return max(_parallel_workers or os.cpu_count() or 1, 1)
+
+
+def create_executor(mode: str, workers: int) -> "Executor":
+    """Create the executor of a parallel mode.
+
+    Threads only run Python code in parallel on a free-threaded interpreter,
+    a warning is emitted once when they are requested on a GIL build. The
+    executors are imported here, as most runs never create one.
+
+    Args:
+        mode (str): "thread" or "process".
+        workers (int): Number of workers.
+
+    Returns:
+        Executor: Executor.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    global _gil_warning_emitted  # pylint: disable=global-statement
+    if mode == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    if not is_free_threaded() and not _gil_warning_emitted:
+        _gil_warning_emitted = True
+        warnings.warn(
+            "Thread mode on an interpreter with the GIL: no speedup expected",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def map_chunk(function: t.Callable[[T], R], chunk: t.Sequence[T]) -> t.List[R]:
+    """Apply a function to a chunk of items, in a worker.
+
+    Args:
+        function (t.Callable[[T], R]): Function to apply.
+        chunk (t.Sequence[T]): Items of the chunk.
+
+    Returns:
+        t.List[R]: Results, in the order of the items.
+    """
+    return [function(item) for item in chunk]
+
+
+def wait_for_chunk(
+    future: "Future[t.List[R]]", progress: "ProgressTracker"
+) -> t.List[R]:
+    """Wait for the results of a chunk, advancing the progress meanwhile.
+
+    Args:
+        future (Future[t.List[R]]): Future results of the chunk.
+        progress (ProgressTracker): Tracker, checked while waiting so that
+            a budget is enforced even when a chunk takes long.
+
+    Returns:
+        t.List[R]: Results of the chunk.
+    """
+    while True:
+        try:
+            results: t.List[R] = future.result(timeout=PROGRESS_POLL_INTERVAL)
+        except TimeoutError:
+            progress.advance(0)
+            continue
+        progress.advance(len(results))
+        return results
+
+
+def parallel_map(
+    function: t.Callable[[T], R],
+    items: t.Sequence[T],
+    progress: "ProgressTracker | None" = None,
+) -> t.List[R]:
+    """Apply a function to independent items, in the configured mode.
+
+    In process mode the function and the items are pickled: use a module
+    level function, or a functools.partial of one.
+
+    Args:
+        function (t.Callable[[T], R]): Function to apply.
+        items (t.Sequence[T]): Items.
+        progress (ProgressTracker | None, optional): Tracker advanced as
+            the results arrive. When it raises, the items not started yet
+            are cancelled. Defaults to None.
+
+    Returns:
+        t.List[R]: Results, in the order of the items.
+    """
+    mode: str = get_effective_parallel_mode()
+    workers: int = min(get_parallel_workers(), len(items))
+    if mode == "serial" or workers < 2:
+        if progress is None:
+            return [function(item) for item in items]
+        results: t.List[R] = []
+        for item in items:
+            results.append(function(item))
+            progress.advance()
+        return results
+
+    chunk_size: int
+    if progress is None:
+        chunk_size = max(len(items) // (workers * CHUNKS_PER_WORKER), 1)
+        with create_executor(mode, workers) as executor:
+            return list(executor.map(function, items, chunksize=chunk_size))
+
+    chunk_size = max(len(items) // (workers * PROGRESS_CHUNKS_PER_WORKER), 1)
+    executor = create_executor(mode, workers)
+    futures: t.List["Future[t.List[R]]"] = [
+        executor.submit(map_chunk, function, items[start : start + chunk_size])
+        for start in range(0, len(items), chunk_size)
+    ]
+    try:
+        results = []
+        for future in futures:
+            results.extend(wait_for_chunk(future, progress))
+    except BaseException:
+        # The futures are cancelled here rather than by the shutdown, which
+        # skips them once the executor is garbage collected.
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+        raise
+    executor.shutdown()
+    return results
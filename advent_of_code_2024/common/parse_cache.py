@@ -0,0 +1,223 @@
+"""Persistent cache of the parsed inputs"""
+
+import collections
+import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+import typing as t
+from functools import wraps
+
+from advent_of_code_2024.common import RawInput, to_buffer
+
+PARSE_CACHE_DIRECTORY_ENV: str = "AOC_PARSE_CACHE_DIR"
+PARSE_CACHE_EXTENSION: str = ".pickle"
+
+P = t.ParamSpec("P")
+R = t.TypeVar("R")
+
+_parse_cache_directory: str | None = (
+    os.environ.get(PARSE_CACHE_DIRECTORY_ENV) or None
+)
+# Pickled parsed inputs shared by the solutions run in the same process,
+# least recently used first.
+# pylint: disable-next=invalid-name
+_memory_parse_cache: t.OrderedDict[str, bytes] | None = None
+# pylint: disable-next=invalid-name
+_memory_parse_cache_entries: int | None = None
+
+
+def set_parse_cache_directory(directory: str | None) -> None:
+    """Enable the parse cache in a directory, or disable it.
+
+    Args:
+        directory (str | None): Cache directory, None to disable the cache.
+    """
+    global _parse_cache_directory  # pylint: disable=global-statement
+    _parse_cache_directory = directory
+
+
+def get_parse_cache_directory() -> str | None:
+    """Get the parse cache directory.
+
+    Returns:
+        str | None: Cache directory, None when the cache is disabled.
+    """
+    return _parse_cache_directory
+
+
+def set_memory_parse_cache(
+    enabled: bool, max_entries: int | None = None
+) -> None:
+    """Enable or disable the in-process parse cache.
+
+    Values are kept pickled, so that each solution gets its own copy of the
+    parsed input and may modify it. Disabling the cache frees its content.
+
+    Args:
+        enabled (bool): Whether parsed inputs are kept in memory.
+        max_entries (int | None, optional): Number of parsed inputs kept,
+            the least recently used ones are evicted first. Defaults to None
+            (unbounded).
+    """
+    global _memory_parse_cache  # pylint: disable=global-statement
+    global _memory_parse_cache_entries  # pylint: disable=global-statement
+    _memory_parse_cache = collections.OrderedDict() if enabled else None
+    _memory_parse_cache_entries = max_entries
+
+
+def remember_parsed_input(key: str, data: bytes) -> None:
+    """Keep a pickled parsed input in the in-process parse cache.
+
+    Args:
+        key (str): Cache key.
+        data (bytes): Pickled parsed input.
+    """
+    if _memory_parse_cache is None:
+        return
+    _memory_parse_cache[key] = data
+    _memory_parse_cache.move_to_end(key)
+    if _memory_parse_cache_entries is not None:
+        while len(_memory_parse_cache) > _memory_parse_cache_entries:
+            _memory_parse_cache.popitem(last=False)
+
+
+def compute_parse_key(
+    parser: t.Callable[..., t.Any],
+    version: int,
+    raw_input: RawInput,
+    arguments: t.Tuple[t.Any, ...],
+    keyword_arguments: t.Dict[str, t.Any],
+) -> str:
+    """Compute the cache key of a parser call.
+
+    Args:
+        parser (t.Callable[..., t.Any]): Parser function.
+        version (int): Parser version.
+        raw_input (RawInput): Raw input given to the parser.
+        arguments (t.Tuple[t.Any, ...]): Other positional arguments.
+        keyword_arguments (t.Dict[str, t.Any]): Keyword arguments.
+
+    Returns:
+        str: SHA-256 hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        f"{parser.__module__}.{parser.__qualname__}:{version}:"
+        f"{arguments!r}:{sorted(keyword_arguments.items())!r}\n".encode()
+    )
+    digest.update(to_buffer(raw_input))
+    return digest.hexdigest()
+
+
+def load_parsed_input(key: str) -> t.Tuple[bool, t.Any]:
+    """Load a parsed input from the memory or the disk cache.
+
+    Args:
+        key (str): Cache key.
+
+    Returns:
+        t.Tuple[bool, t.Any]: Whether a usable value was found and the value.
+    """
+    data: bytes | None = None
+    if _memory_parse_cache is not None:
+        data = _memory_parse_cache.get(key)
+        if data is not None:
+            _memory_parse_cache.move_to_end(key)
+    if data is None and _parse_cache_directory is not None:
+        try:
+            with open(
+                os.path.join(
+                    _parse_cache_directory, key + PARSE_CACHE_EXTENSION
+                ),
+                "rb",
+            ) as file_descriptor:
+                data = file_descriptor.read()
+        except OSError:
+            return False, None
+        remember_parsed_input(key, data)
+    if data is None:
+        return False, None
+    try:
+        return True, pickle.loads(data)
+    except Exception:  # pylint: disable=broad-exception-caught
+        # Truncated file or classes changed without a parser version bump.
+        return False, None
+
+
+def store_parsed_input(key: str, value: t.Any) -> None:
+    """Store a parsed input in the memory and the disk cache.
+
+    Files are written atomically, failures only disable the caching of
+    this value.
+
+    Args:
+        key (str): Cache key.
+        value (t.Any): Parsed input.
+    """
+    try:
+        data: bytes = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return
+    remember_parsed_input(key, data)
+    if _parse_cache_directory is None:
+        return
+    try:
+        os.makedirs(_parse_cache_directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=_parse_cache_directory, suffix=".tmp"
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(file_descriptor, "wb") as temporary_file:
+            temporary_file.write(data)
+        os.replace(
+            temporary_path,
+            os.path.join(_parse_cache_directory, key + PARSE_CACHE_EXTENSION),
+        )
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(temporary_path)
+
+
+def cached_parser(
+    version: int,
+) -> t.Callable[[t.Callable[P, R]], t.Callable[P, R]]:
+    """Cache the result of a parser, when a parse cache is enabled.
+
+    The first argument of the parser must be the raw input. The cache key
+    is the SHA-256 of the raw input, the parser name, the parser version
+    and the other arguments: bump the version whenever the parsed
+    structure changes.
+
+    Args:
+        version (int): Parser version.
+
+    Returns:
+        t.Callable[[t.Callable[P, R]], t.Callable[P, R]]: Decorator.
+    """
+
+    def decorator(parser: t.Callable[P, R]) -> t.Callable[P, R]:
+        @wraps(parser)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not args or (
+                _parse_cache_directory is None and _memory_parse_cache is None
+            ):
+                return parser(*args, **kwargs)
+
+            key: str = compute_parse_key(
+                parser, version, t.cast(RawInput, args[0]), args[1:], kwargs
+            )
+            found, value = load_parsed_input(key)
+            if found:
+                return t.cast(R, value)
+
+            result: R = parser(*args, **kwargs)
+            store_parsed_input(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,130 @@
+"""Rendering of the debug output of the solutions, quiet by default"""
+
+import os
+import sys
+import typing as t
+
+from advent_of_code_2024.common.grid import Grid
+
+VERBOSITY_ENV: str = "AOC_VERBOSE"
+# Verbosity at which the grids and the debug lines are rendered.
+DEBUG_VERBOSITY: int = 1
+
+# pylint: disable-next=invalid-name
+_verbosity: int = int(os.environ.get(VERBOSITY_ENV) or 0)
+
+
+def set_verbosity(verbosity: int) -> None:
+    """Set the verbosity of the solutions debug output.
+
+    Args:
+        verbosity (int): Verbosity, 0 renders nothing.
+
+    Raises:
+        ValueError: If the verbosity is negative.
+    """
+    global _verbosity  # pylint: disable=global-statement
+    if verbosity < 0:
+        raise ValueError(f"Invalid verbosity: {verbosity}")
+    _verbosity = verbosity
+
+
+def get_verbosity() -> int:
+    """Get the verbosity of the solutions debug output.
+
+    Returns:
+        int: Verbosity, 0 when the output is disabled.
+    """
+    return _verbosity
+
+
+def is_verbose(level: int = DEBUG_VERBOSITY) -> bool:
+    """Check whether the output of a verbosity level is rendered.
+
+    The solutions check it before building their output, so that a quiet
+    run pays nothing for it.
+
+    Args:
+        level (int, optional): Verbosity level of the output.
+            Defaults to DEBUG_VERBOSITY.
+
+    Returns:
+        bool: True if the output is rendered.
+    """
+    return _verbosity >= level
+
+
+def emit(text: str, level: int = DEBUG_VERBOSITY) -> None:
+    """Write rendered output with a single call, if verbose enough.
+
+    The standard output is looked up on each call, so the output follows
+    its redirections (the runner sends it to the standard error).
+
+    Args:
+        text (str): Output, without its final newline.
+        level (int, optional): Verbosity level of the output.
+            Defaults to DEBUG_VERBOSITY.
+    """
+    if _verbosity >= level:
+        sys.stdout.write(text + "\n")
+
+
+def debug(*values: t.Any, level: int = DEBUG_VERBOSITY) -> None:
+    """Render a debug line of values separated by spaces, if verbose enough.
+
+    Args:
+        *values (t.Any): Values of the line.
+        level (int, optional): Verbosity level of the line.
+            Defaults to DEBUG_VERBOSITY.
+    """
+    if _verbosity >= level:
+        emit(" ".join(map(str, values)), level)
+
+
+def render_grid(grid: Grid, overlays: t.Mapping[int, int] | None = None) -> str:
+    """Render a grid, some cells replaced by other values.
+
+    The cells are copied once and the overlays are written in the copy, so
+    rendering is linear in the grid size plus the number of overlays.
+
+    Args:
+        grid (Grid): Grid to render, border excluded.
+        overlays (t.Mapping[int, int] | None, optional):
+            Value to render of some cells, by cell index. Defaults to None.
+
+    Returns:
+        str: Grid rows, separated by newlines.
+    """
+    cells: bytearray = bytearray(grid.cells)
+    for index, value in (overlays or {}).items():
+        cells[index] = value
+    return "\n".join(
+        cells[start : start + grid.width].decode("latin-1")
+        for start in range(
+            grid.offset, grid.offset + grid.height * grid.stride, grid.stride
+        )
+    )
+
+
+def render_counts(
+    counts: t.Sequence[int], width: int, height: int, empty_char: str = "."
+) -> str:
+    """Render a grid of counts, one digit per cell.
+
+    Args:
+        counts (t.Sequence[int]): Flat counts, row major.
+        width (int): Grid width.
+        height (int): Grid height.
+        empty_char (str, optional): Character of the cells counting 0.
+            Defaults to ".".
+
+    Returns:
+        str: Grid rows, separated by newlines. Counts above 9 are rendered
+            as "+", so that the columns stay aligned.
+    """
+    digits: bytes = (empty_char + "123456789").encode("latin-1")
+    grid: Grid = Grid(width, height)
+    grid.cells[:] = bytes(
+        digits[count] if count < len(digits) else ord("+") for count in counts
+    )
+    return render_grid(grid)
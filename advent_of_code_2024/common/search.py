@@ -0,0 +1,199 @@
+"""Graph searches over integer-encoded states"""
+
+import heapq
+import typing as t
+
+# Distance of the states not reached yet, and parent of the start states.
+UNREACHED: int = -1
+# Goal returned by the searches that did not reach any goal state.
+NOT_FOUND: int = -1
+
+
+class SearchState:
+    """Search state class: array-backed storage of the graph searches.
+
+    States are integers between 0 and `state_count` (excluded), such as
+    grid cell indexes, or cell indexes times the number of directions plus
+    a direction. The visited flags, distances and parents accumulate over
+    the searches run with the same state, so that several searches can
+    share them (one flood fill per region, for instance), while `order`
+    only holds the states reached by the last search.
+
+    Distances and parents are preallocated lists rather than `array`
+    instances: reading an array item boxes a new integer, which made the
+    searches measurably slower.
+    """
+
+    visited: bytearray
+    distances: t.List[int]
+    parents: t.List[int] | None
+    order: t.List[int]
+
+    def __init__(self, state_count: int, track_parents: bool = False) -> None:
+        self.visited = bytearray(state_count)
+        self.distances = [UNREACHED] * state_count
+        self.parents = [UNREACHED] * state_count if track_parents else None
+        self.order = []
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchState(States: {len(self.visited)}, "
+            f"Reached: {len(self.order)})"
+        )
+
+    def reset(self) -> None:
+        """Forget the states reached by the last search.
+
+        Only these states are cleared, so that a state can be reused by
+        many small searches without reallocating its arrays.
+        """
+        for state in self.order:
+            self.visited[state] = False
+            self.distances[state] = UNREACHED
+            if self.parents is not None:
+                self.parents[state] = UNREACHED
+        self.order = []
+
+    def path(self, state: int) -> t.List[int]:
+        """Build the path from a start state to a reached state.
+
+        Args:
+            state (int): Reached state.
+
+        Raises:
+            ValueError: If the parents are not tracked.
+
+        Returns:
+            t.List[int]: States of the path, start state first.
+        """
+        parents: t.List[int] | None = self.parents
+        if parents is None:
+            raise ValueError("Parents are not tracked by this search state.")
+        path: t.List[int] = [state]
+        while parents[path[-1]] != UNREACHED:
+            path.append(parents[path[-1]])
+        return path[::-1]
+
+
+def breadth_first_search(
+    search: SearchState,
+    starts: t.Iterable[int],
+    neighbours: t.Callable[[int], t.Iterable[int]],
+    is_goal: t.Callable[[int], bool] | None = None,
+) -> int:
+    """Run a breadth-first search, every move costing 1.
+
+    Start states already visited by a previous search are skipped. The
+    states reached are left in `search.order`, by increasing distance.
+
+    Args:
+        search (SearchState): Search state, updated in place.
+        starts (t.Iterable[int]): Start states.
+        neighbours (t.Callable[[int], t.Iterable[int]]):
+            States reachable in one move from a state.
+        is_goal (t.Callable[[int], bool] | None, optional):
+            Stop the search once a goal state is expanded. Defaults to None
+            (expand every reachable state).
+
+    Returns:
+        int: Goal state reached, NOT_FOUND if none.
+    """
+    visited: bytearray = search.visited
+    distances: t.List[int] = search.distances
+    parents: t.List[int] | None = search.parents
+    # The reached states are the queue: the states before the head are
+    # expanded, the ones after it wait in order.
+    order: t.List[int] = []
+    for start in starts:
+        if not visited[start]:
+            visited[start] = True
+            distances[start] = 0
+            order.append(start)
+    search.order = order
+
+    head: int = 0
+    while head < len(order):
+        state: int = order[head]
+        head += 1
+        if is_goal is not None and is_goal(state):
+            return state
+        distance: int = distances[state] + 1
+        for neighbour in neighbours(state):
+            if not visited[neighbour]:
+                visited[neighbour] = True
+                distances[neighbour] = distance
+                if parents is not None:
+                    parents[neighbour] = state
+                order.append(neighbour)
+    return NOT_FOUND
+
+
+def shortest_path_search(  # pylint: disable=too-many-locals
+    search: SearchState,
+    starts: t.Iterable[int],
+    neighbours: t.Callable[[int], t.Iterable[t.Tuple[int, int]]],
+    is_goal: t.Callable[[int], bool] | None = None,
+    heuristic: t.Callable[[int], float] | None = None,
+) -> int:
+    """Run a Dijkstra search, or an A* search when given a heuristic.
+
+    The heuristic must never overestimate the remaining cost, so that the
+    first goal state expanded is a closest one.
+
+    Args:
+        search (SearchState): Search state, updated in place.
+        starts (t.Iterable[int]): Start states.
+        neighbours (t.Callable[[int], t.Iterable[t.Tuple[int, int]]]):
+            States reachable in one move from a state, with the move cost.
+        is_goal (t.Callable[[int], bool] | None, optional):
+            Stop the search once a goal state is expanded. Defaults to None
+            (expand every reachable state).
+        heuristic (t.Callable[[int], float] | None, optional):
+            Estimated cost from a state to the goal. Defaults to None.
+
+    Returns:
+        int: Goal state reached, NOT_FOUND if none.
+    """
+    visited: bytearray = search.visited
+    distances: t.List[int] = search.distances
+    parents: t.List[int] | None = search.parents
+    order: t.List[int] = []
+    open_list: t.List[t.Tuple[float, int]] = []
+    for start in starts:
+        if not visited[start]:
+            if distances[start] == UNREACHED:
+                order.append(start)
+            distances[start] = 0
+            heapq.heappush(
+                open_list, (heuristic(start) if heuristic else 0, start)
+            )
+    search.order = order
+
+    while open_list:
+        _, state = heapq.heappop(open_list)
+        if visited[state]:
+            # Stale entry, the state was reached again with a lower cost.
+            continue
+        visited[state] = True
+        if is_goal is not None and is_goal(state):
+            return state
+        distance: int = distances[state]
+        for neighbour, cost in neighbours(state):
+            new_distance: int = distance + cost
+            if visited[neighbour]:
+                continue
+            if distances[neighbour] == UNREACHED:
+                order.append(neighbour)
+            elif new_distance >= distances[neighbour]:
+                continue
+            distances[neighbour] = new_distance
+            if parents is not None:
+                parents[neighbour] = state
+            heapq.heappush(
+                open_list,
+                (
+                    new_distance + (heuristic(neighbour) if heuristic else 0),
+                    neighbour,
+                ),
+            )
+    return NOT_FOUND
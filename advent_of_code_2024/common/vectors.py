@@ -0,0 +1,27 @@
+"""Compact value types shared by the solutions"""
+
+import typing as t
+
+
+class Vector(t.NamedTuple):
+    """Vector class: integer 2D position, shift or velocity.
+
+    Vectors are tuples: they take no per-instance dictionary, and their
+    hashing and equality run in C, plain (x, y) tuples comparing equal to
+    them. They are immutable, a moved vector is a new one.
+    """
+
+    x: int
+    y: int
+
+    def shifted(self, x_shift: int, y_shift: int) -> "Vector":
+        """Build the vector shifted by offsets.
+
+        Args:
+            x_shift (int): X offset.
+            y_shift (int): Y offset.
+
+        Returns:
+            Vector: Shifted vector.
+        """
+        return Vector(self.x + x_shift, self.y + y_shift)
@@ -1,24 +1,731 @@
 """Common methods for the Day 01"""
 
-import json
-import os
+import bisect
+import itertools
+import math
+import operator
+import re
 import typing as t
+from array import array
+from collections import Counter
 
+from advent_of_code_2024.common import (
+    RawInput,
+    get_input_path,
+    map_input,
+    to_buffer,
+)
+from advent_of_code_2024.common.parse_cache import cached_parser
 
-def read_int_list_from_file(file_name: str, from_file: str) -> t.List[int]:
-    """Read a list of integers from a file.
+# Bytes of input parsed at once: the streaming parsers only hold the values
+# of one chunk as Python integers, whatever the input size.
+PARSE_CHUNK_SIZE: int = 1 << 20
+# Memory taken by the parse of a chunk, per byte of the chunk: its copies,
+# its tokens and their integers.
+PARSE_BYTES_PER_CHUNK_BYTE: int = 16
+# Separators a chunk may end on, so that no value is cut in two.
+SEPARATOR_REGEX: re.Pattern[bytes] = re.compile(rb"[\s,]")
+# JSON list punctuation, turned into spaces so that values split on them.
+JSON_PUNCTUATION_TABLE: bytes = bytes.maketrans(b"[],", b"   ")
+# Fewest known location IDs per block of a LocationIndex.
+MIN_LOCATION_BLOCK_SIZE: int = 16
+
+
+def iter_int_chunks(
+    raw_input: RawInput, chunk_size: int = PARSE_CHUNK_SIZE
+) -> t.Iterator[t.List[int]]:
+    """Iterate over the integers of a raw input, one chunk at a time.
+
+    Values are separated by whitespace, or by JSON list punctuation, so
+    that both the two columns text inputs and JSON lists can be streamed.
 
     Args:
-        file_name (str): File name.
-        from_file (str): Path to the file that calls this function.
+        raw_input (RawInput): Raw input.
+        chunk_size (int, optional): Bytes of input parsed at once.
+            Defaults to PARSE_CHUNK_SIZE.
+
+    Raises:
+        ValueError: If a value is not an integer.
+
+    Yields:
+        t.List[int]: Integers of each chunk, in order of appearance.
+    """
+    buffer = to_buffer(raw_input)
+    start: int = 0
+    while start < len(buffer):
+        separator = SEPARATOR_REGEX.search(
+            buffer, min(start + chunk_size, len(buffer))
+        )
+        end: int = separator.end() if separator is not None else len(buffer)
+        yield [
+            int(token)
+            for token in buffer[start:end]
+            .translate(JSON_PUNCTUATION_TABLE)
+            .split()
+        ]
+        start = end
+
+
+def read_int_array_from_file(path: str) -> "array[int]":
+    """Read a list of integers from a file, such as a JSON list.
+
+    The file is memory-mapped and streamed: the integers are stored in a
+    typed array, 8 bytes each, without building a list of them.
+
+    Args:
+        path (str): Path to the file.
 
     Returns:
-        t.List[int]: List of integers.
+        array[int]: 64 bits integers, in order of appearance.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
+    values: "array[int]" = array("q")
+    with map_input(path) as raw_input:
+        for chunk in iter_int_chunks(raw_input):
+            values.extend(chunk)
+    return values
+
+
+def iter_location_chunks(
+    raw_input: RawInput, chunk_size: int = PARSE_CHUNK_SIZE
+) -> t.Iterator[t.Tuple[t.List[int], t.List[int]]]:
+    """Stream a two columns input, one chunk of location IDs at a time.
+
+    Args:
+        raw_input (RawInput): Raw input, one pair of location IDs per line.
+        chunk_size (int, optional): Bytes of input parsed at once.
+            Defaults to PARSE_CHUNK_SIZE.
+
+    Raises:
+        ValueError: If the location IDs do not come in pairs.
+
+    Yields:
+        t.Tuple[t.List[int], t.List[int]]: IDs of the first and second
+            lists found in each chunk.
+    """
+    # 1 when the previous chunk ended between the two IDs of a line.
+    pending: int = 0
+    for chunk in iter_int_chunks(raw_input, chunk_size):
+        yield chunk[pending::2], chunk[1 - pending :: 2]
+        pending = (pending + len(chunk)) % 2
+    if pending:
+        raise ValueError("Each line must hold a pair of location IDs.")
+
+
+def split_location_lists(
+    raw_input: RawInput,
+) -> t.Tuple["array[int]", "array[int]"]:
+    """Stream a two columns input into the two lists of location IDs.
+
+    Args:
+        raw_input (RawInput): Raw input, one pair of location IDs per line.
+
+    Returns:
+        t.Tuple[array[int], array[int]]: First and second lists, as 64 bits
+            integers arrays.
+    """
+    list_1: "array[int]" = array("q")
+    list_2: "array[int]" = array("q")
+    for chunk_1, chunk_2 in iter_location_chunks(raw_input):
+        list_1.extend(chunk_1)
+        list_2.extend(chunk_2)
+    return list_1, list_2
+
+
+def load_location_lists(
+    path: str, second_path: str | None = None
+) -> t.Tuple["array[int]", "array[int]"]:
+    """Load the two lists of location IDs from files, in a single pass.
+
+    Args:
+        path (str): Path to the two columns input, or to the first list
+            (such as a JSON list) when a second path is given.
+        second_path (str | None, optional): Path to the second list.
+            Defaults to None (both lists are in the first file).
+
+    Returns:
+        t.Tuple[array[int], array[int]]: First and second lists, as 64 bits
+            integers arrays.
+    """
+    if second_path is not None:
+        return read_int_array_from_file(path), read_int_array_from_file(
+            second_path
+        )
+    with map_input(path) as raw_input:
+        return split_location_lists(raw_input)
+
+
+def load_json_location_lists(
+    from_file: str,
+) -> t.Tuple["array[int]", "array[int]"]:
+    """Load the list_1.json and list_2.json lists stored next to a module.
+
+    Args:
+        from_file (str): File from where the method is called.
+
+    Returns:
+        t.Tuple[array[int], array[int]]: First and second lists.
+    """
+    return load_location_lists(
+        get_input_path("list_1.json", from_file),
+        get_input_path("list_2.json", from_file),
     )
-    res: t.List[int] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        res = json.load(file_descriptor)
-    return res
+
+
+@cached_parser(version=2)
+def parse_location_lists(
+    raw_input: RawInput,
+) -> t.Tuple["array[int]", "array[int]"]:
+    """Parse the two lists of location IDs from a two columns input.
+
+    Args:
+        raw_input (RawInput): Raw input, one pair of location IDs per line.
+
+    Returns:
+        t.Tuple[array[int], array[int]]: First and second lists, as 64 bits
+            integers arrays.
+    """
+    return split_location_lists(raw_input)
+
+
+class SuffixAbsoluteSum:
+    """Suffix absolute sum class: weighted sum of absolute differences, under
+    increments and decrements of suffixes of the differences.
+
+    The differences are stored without a shared offset. Shifting all of
+    them only moves the offset: the weight of each stored difference is
+    kept, so the weight of the ones crossing zero is known in O(1). Shifting
+    a suffix walks at most half of the n differences, in O(n), while
+    insertions and weight changes run in O(1).
+    """
+
+    weights: t.List[int]
+    differences: t.List[int]
+    offset: int
+    difference_weights: t.Dict[int, int]
+    total_weight: int
+    non_negative_weight: int
+    total: int
+
+    def __init__(self, weights: t.List[int], differences: t.List[int]) -> None:
+        """Initialize the sum.
+
+        Args:
+            weights (t.List[int]): Non-negative weight of each difference.
+            differences (t.List[int]): Initial differences.
+        """
+        self.weights = weights
+        self.differences = differences
+        self.offset = 0
+        self.difference_weights = {}
+        self.total_weight = 0
+        self.non_negative_weight = 0
+        self.total = 0
+        for index in range(len(weights)):
+            self.account(index, 1)
+
+    def __repr__(self) -> str:
+        return (
+            f"SuffixAbsoluteSum(Size: {len(self.weights)}, "
+            f"Total: {self.total})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def get_difference(self, index: int) -> int:
+        """Get a difference.
+
+        Args:
+            index (int): Index of the difference.
+
+        Returns:
+            int: Difference, offset included.
+        """
+        return self.differences[index] + self.offset
+
+    def account(self, index: int, sign: int) -> None:
+        """Add a difference to the sums, or take it back.
+
+        Args:
+            index (int): Index of the difference.
+            sign (int): 1 to add it, -1 to take it back.
+        """
+        weight: int = sign * self.weights[index]
+        stored: int = self.differences[index]
+        difference: int = stored + self.offset
+        self.difference_weights[stored] = (
+            self.difference_weights.get(stored, 0) + weight
+        )
+        if not self.difference_weights[stored]:
+            del self.difference_weights[stored]
+        self.total_weight += weight
+        if difference >= 0:
+            self.non_negative_weight += weight
+        self.total += weight * abs(difference)
+
+    def shift_all(self, step: int) -> None:
+        """Add a step to all the differences, in O(1).
+
+        Args:
+            step (int): 1 or -1.
+        """
+        if step > 0:
+            # The non negative differences grow, the negative ones shrink,
+            # and the ones at -1 become non negative.
+            self.total += 2 * self.non_negative_weight - self.total_weight
+            self.non_negative_weight += self.difference_weights.get(
+                -self.offset - 1, 0
+            )
+        else:
+            # The positive differences shrink, the others grow, and the ones
+            # at 0 become negative.
+            zero_weight: int = self.difference_weights.get(-self.offset, 0)
+            self.total += self.total_weight - 2 * (
+                self.non_negative_weight - zero_weight
+            )
+            self.non_negative_weight -= zero_weight
+        self.offset += step
+
+    def shift_items(self, start: int, end: int, step: int) -> None:
+        """Add a step to the differences of a range, one by one.
+
+        Args:
+            start (int): Index of the first difference to shift.
+            end (int): Excluded index of the last difference to shift.
+            step (int): 1 or -1.
+        """
+        for index in range(start, end):
+            self.account(index, -1)
+            self.differences[index] += step
+            self.account(index, 1)
+
+    def shift_suffix(self, start: int, step: int) -> None:
+        """Add a step to the differences from an index onwards.
+
+        Either the suffix is shifted item by item, or the whole sum is
+        shifted in O(1) and the prefix is shifted back: the shorter of both
+        is walked.
+
+        Args:
+            start (int): Index of the first difference to shift.
+            step (int): 1 or -1.
+        """
+        if 2 * start > len(self.weights):
+            self.shift_items(start, len(self.weights), step)
+            return
+        self.shift_all(step)
+        self.shift_items(0, start, -step)
+
+    def insert(self, index: int, weight: int, difference: int) -> None:
+        """Insert a difference.
+
+        Args:
+            index (int): Index of the new difference.
+            weight (int): Non-negative weight of the difference.
+            difference (int): Difference.
+        """
+        self.weights.insert(index, weight)
+        self.differences.insert(index, difference - self.offset)
+        self.account(index, 1)
+
+    def set_weight(self, index: int, weight: int) -> None:
+        """Change the weight of a difference.
+
+        Args:
+            index (int): Index of the difference.
+            weight (int): Non-negative weight.
+        """
+        self.account(index, -1)
+        self.weights[index] = weight
+        self.account(index, 1)
+
+    def split(self, index: int) -> "SuffixAbsoluteSum":
+        """Move the differences from an index onwards to a new sum.
+
+        Args:
+            index (int): Index of the first difference to move.
+
+        Returns:
+            SuffixAbsoluteSum: Sum of the moved differences.
+        """
+        moved: SuffixAbsoluteSum = SuffixAbsoluteSum(
+            self.weights[index:],
+            [
+                difference + self.offset
+                for difference in self.differences[index:]
+            ],
+        )
+        for moved_index in range(index, len(self.weights)):
+            self.account(moved_index, -1)
+        del self.weights[index:]
+        del self.differences[index:]
+        return moved
+
+
+class LocationBlock:
+    """Location block class: consecutive known location IDs of an index,
+    with their occurrences in both lists."""
+
+    location_ids: t.List[int]
+    occurrences: t.Tuple[t.List[int], t.List[int]]
+    lengths: t.List[int]
+    sums: t.List[int]
+    distances: SuffixAbsoluteSum
+
+    def __init__(
+        self,
+        location_ids: t.List[int],
+        occurrences: t.Tuple[t.List[int], t.List[int]],
+        distances: SuffixAbsoluteSum,
+    ) -> None:
+        self.location_ids = location_ids
+        self.occurrences = occurrences
+        self.lengths = [sum(occurrences[0]), sum(occurrences[1])]
+        self.sums = [
+            sum(map(operator.mul, location_ids, occurrences[0])),
+            sum(map(operator.mul, location_ids, occurrences[1])),
+        ]
+        self.distances = distances
+
+    def __repr__(self) -> str:
+        return (
+            f"LocationBlock(IDs: {self.location_ids[0]}.."
+            f"{self.location_ids[-1]}, Lengths: {self.lengths})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.location_ids)
+
+    def insert(
+        self, index: int, location_id: int, weight: int, difference: int
+    ) -> None:
+        """Insert a location ID, with no occurrence.
+
+        Args:
+            index (int): Index of the ID in the block.
+            location_id (int): Location ID.
+            weight (int): Width of the gap after the ID.
+            difference (int): Difference between the numbers of IDs of both
+                lists up to the gap.
+        """
+        self.location_ids.insert(index, location_id)
+        self.occurrences[0].insert(index, 0)
+        self.occurrences[1].insert(index, 0)
+        self.distances.insert(index, weight, difference)
+
+    def split(self) -> "LocationBlock":
+        """Move the upper half of the block to a new block.
+
+        Returns:
+            LocationBlock: Block of the moved location IDs.
+        """
+        middle: int = len(self.location_ids) // 2
+        moved: LocationBlock = LocationBlock(
+            self.location_ids[middle:],
+            (self.occurrences[0][middle:], self.occurrences[1][middle:]),
+            self.distances.split(middle),
+        )
+        del self.location_ids[middle:]
+        del self.occurrences[0][middle:]
+        del self.occurrences[1][middle:]
+        for side in (0, 1):
+            self.lengths[side] -= moved.lengths[side]
+            self.sums[side] -= moved.sums[side]
+        return moved
+
+
+class LocationIndex:  # pylint: disable=too-many-instance-attributes
+    """Location index class: total distance and similarity score of two
+    lists of location IDs, kept up to date as IDs are added and removed.
+
+    Written as an integral over the IDs, the total distance of two lists of
+    the same length sums, over each gap between two consecutive known IDs,
+    the gap width times the difference between the numbers of IDs of both
+    lists up to the gap. Adding an ID shifts these differences from it
+    onwards. The known IDs are kept sorted in blocks of about sqrt(n) of
+    them, each with a SuffixAbsoluteSum of its gaps: the block of the ID
+    shifts a suffix item by item, the next blocks shift as a whole in O(1).
+    When the lengths differ, the extra largest IDs of the longer list are
+    left out of the pairing: their contribution is taken back with the
+    occurrences and the sums of the IDs of each block. The similarity score
+    only depends on the occurrences of the added or removed ID, found in the
+    Counter of the other list.
+
+    With n known IDs, adding or removing an ID runs in O(sqrt(n)), unknown
+    IDs included: a new ID is inserted in its block, a block twice as large
+    as the others is split in two, and once the blocks doubled in number,
+    after at least n new IDs, they are rebuilt in O(n), or O(1) amortised
+    per new ID. The similarity score is read in O(1), and so is the total
+    distance of lists of the same length, O(sqrt(n)) otherwise.
+    """
+
+    counters: t.Tuple[Counter[int], Counter[int]]
+    blocks: t.List[LocationBlock]
+    first_location_ids: t.List[int]
+    block_size: int
+    list_lengths: t.List[int]
+    list_sums: t.List[int]
+    distance_total: int
+    similarity_score: int
+
+    def __init__(
+        self,
+        list_1: t.Iterable[int] = (),
+        list_2: t.Iterable[int] = (),
+        location_ids: t.Iterable[int] = (),
+    ) -> None:
+        """Index two lists of location IDs.
+
+        Args:
+            list_1 (t.Iterable[int], optional): First list. Defaults to ().
+            list_2 (t.Iterable[int], optional): Second list. Defaults to ().
+            location_ids (t.Iterable[int], optional): Other IDs that may be
+                added later, to index them up front. Defaults to ().
+        """
+        self.counters = Counter(list_1), Counter(list_2)
+        counter_1, counter_2 = self.counters
+        self.list_lengths = [counter_1.total(), counter_2.total()]
+        self.list_sums = [
+            sum(location_id * count for location_id, count in counter.items())
+            for counter in self.counters
+        ]
+        self.similarity_score = sum(
+            location_id * count * counter_2.get(location_id, 0)
+            for location_id, count in counter_1.items()
+        )
+        self.build(sorted({*counter_1, *counter_2, *location_ids}))
+
+    def __repr__(self) -> str:
+        return (
+            f"LocationIndex(Lengths: {self.lengths}, "
+            f"Blocks: {len(self.blocks)})"
+        )
+
+    @property
+    def lengths(self) -> t.Tuple[int, int]:
+        """Lengths of both lists.
+
+        Returns:
+            t.Tuple[int, int]: Number of IDs of the first and second lists.
+        """
+        return self.list_lengths[0], self.list_lengths[1]
+
+    @property
+    def total_distance(self) -> int:
+        """Total distance between the two lists.
+
+        Returns:
+            int: Total distance, as computed by compute_total_distance.
+        """
+        length_1, length_2 = self.lengths
+        length: int = min(length_1, length_2)
+        if not length or length_1 == length_2:
+            return self.distance_total if length else 0
+        longer: int = 0 if length_1 > length_2 else 1
+        # The IDs of the longer list left out of the pairing are the ones
+        # ranked after the length of the shorter one.
+        paired_count: int = 0
+        paired_sum: int = 0
+        for block in self.blocks:
+            if paired_count + block.lengths[longer] < length:
+                paired_count += block.lengths[longer]
+                paired_sum += block.sums[longer]
+                continue
+            for location_id, count in zip(
+                block.location_ids, block.occurrences[longer]
+            ):
+                paired_sum += min(count, length - paired_count) * location_id
+                paired_count = min(paired_count + count, length)
+            break
+        extra_count: int = max(length_1, length_2) - length
+        extra_sum: int = self.list_sums[longer] - paired_sum
+        return self.distance_total - (
+            extra_count * self.blocks[-1].location_ids[-1] - extra_sum
+        )
+
+    def build(self, location_ids: t.List[int]) -> None:
+        """Split the known location IDs into blocks, in O(n).
+
+        Args:
+            location_ids (t.List[int]): Sorted known IDs, including the ones
+                of both lists.
+        """
+        counter_1, counter_2 = self.counters
+        self.block_size = max(
+            math.isqrt(len(location_ids)), MIN_LOCATION_BLOCK_SIZE
+        )
+        occurrences_1: t.List[int] = [
+            counter_1.get(location_id, 0) for location_id in location_ids
+        ]
+        occurrences_2: t.List[int] = [
+            counter_2.get(location_id, 0) for location_id in location_ids
+        ]
+        # The gap after the last ID is empty.
+        weights: t.List[int] = [
+            *map(operator.sub, location_ids[1:], location_ids),
+            0,
+        ]
+        differences: t.List[int] = list(
+            itertools.accumulate(
+                map(operator.sub, occurrences_1, occurrences_2)
+            )
+        )
+        self.blocks = [
+            LocationBlock(
+                location_ids[start : start + self.block_size],
+                (
+                    occurrences_1[start : start + self.block_size],
+                    occurrences_2[start : start + self.block_size],
+                ),
+                SuffixAbsoluteSum(
+                    weights[start : start + self.block_size],
+                    differences[start : start + self.block_size],
+                ),
+            )
+            for start in range(0, len(location_ids), self.block_size)
+        ]
+        self.first_location_ids = [
+            block.location_ids[0] for block in self.blocks
+        ]
+        self.distance_total = sum(
+            block.distances.total for block in self.blocks
+        )
+
+    def locate(self, location_id: int) -> t.Tuple[int, int]:
+        """Find where a location ID is, or would be inserted.
+
+        Args:
+            location_id (int): Location ID.
+
+        Returns:
+            t.Tuple[int, int]: Index of its block, and its index in the
+                block.
+        """
+        block_index: int = max(
+            bisect.bisect_right(self.first_location_ids, location_id) - 1, 0
+        )
+        return block_index, bisect.bisect_left(
+            self.blocks[block_index].location_ids, location_id
+        )
+
+    def insert(self, location_id: int) -> t.Tuple[int, int]:
+        """Insert an unknown location ID, with no occurrence.
+
+        The new ID splits the gap after the previous known ID: the upper
+        part of the gap keeps its difference, as no ID was added in it.
+
+        Args:
+            location_id (int): Location ID.
+
+        Returns:
+            t.Tuple[int, int]: Index of its block, and its index in the
+                block.
+        """
+        if not self.blocks:
+            self.build([location_id])
+            return 0, 0
+        block_index, index = self.locate(location_id)
+        block: LocationBlock = self.blocks[block_index]
+        difference: int = 0
+        # Only an ID below all the known ones starts a block, the first one.
+        if index:
+            difference = block.distances.get_difference(index - 1)
+            self.distance_total -= block.distances.total
+            block.distances.set_weight(
+                index - 1, location_id - block.location_ids[index - 1]
+            )
+            self.distance_total += block.distances.total
+        next_location_id: int = location_id
+        if index < len(block):
+            next_location_id = block.location_ids[index]
+        elif block_index + 1 < len(self.blocks):
+            next_location_id = self.first_location_ids[block_index + 1]
+        self.distance_total -= block.distances.total
+        block.insert(
+            index, location_id, next_location_id - location_id, difference
+        )
+        self.distance_total += block.distances.total
+        self.first_location_ids[block_index] = block.location_ids[0]
+        if len(block) > 2 * self.block_size:
+            self.blocks.insert(block_index + 1, block.split())
+            self.first_location_ids.insert(
+                block_index + 1, self.blocks[block_index + 1].location_ids[0]
+            )
+            if index >= len(block):
+                block_index, index = block_index + 1, index - len(block)
+        if len(self.blocks) > 2 * self.block_size:
+            self.build(
+                [
+                    known_id
+                    for known_block in self.blocks
+                    for known_id in known_block.location_ids
+                ]
+            )
+            return self.locate(location_id)
+        return block_index, index
+
+    def update(self, list_number: int, location_id: int, step: int) -> None:
+        """Add or remove one occurrence of a location ID.
+
+        Args:
+            list_number (int): 1 or 2.
+            location_id (int): Location ID.
+            step (int): 1 to add it, -1 to remove it.
+
+        Raises:
+            ValueError: If the list number is not 1 or 2, or if the removed
+                ID is not in the list.
+        """
+        if list_number not in (1, 2):
+            raise ValueError(f"Unknown list number: {list_number}")
+        side: int = list_number - 1
+        counter: Counter[int] = self.counters[side]
+        if step < 0 and not counter.get(location_id):
+            raise ValueError(
+                f"Location ID {location_id} not in list {list_number}"
+            )
+        block_index, index = self.locate(location_id) if self.blocks else (0, 0)
+        if (
+            not self.blocks
+            or index == len(self.blocks[block_index])
+            or self.blocks[block_index].location_ids[index] != location_id
+        ):
+            block_index, index = self.insert(location_id)
+        self.similarity_score += (
+            step * location_id * self.counters[1 - side].get(location_id, 0)
+        )
+        counter[location_id] += step
+        if not counter[location_id]:
+            del counter[location_id]
+        self.list_lengths[side] += step
+        self.list_sums[side] += step * location_id
+        block: LocationBlock = self.blocks[block_index]
+        block.occurrences[side][index] += step
+        block.lengths[side] += step
+        block.sums[side] += step * location_id
+        shift: int = step if side == 0 else -step
+        self.distance_total -= block.distances.total
+        block.distances.shift_suffix(index, shift)
+        self.distance_total += block.distances.total
+        for next_block in itertools.islice(self.blocks, block_index + 1, None):
+            self.distance_total -= next_block.distances.total
+            next_block.distances.shift_all(shift)
+            self.distance_total += next_block.distances.total
+
+    def add(self, list_number: int, location_id: int) -> None:
+        """Add a location ID to a list.
+
+        Args:
+            list_number (int): 1 or 2.
+            location_id (int): Location ID.
+        """
+        self.update(list_number, location_id, 1)
+
+    def remove(self, list_number: int, location_id: int) -> None:
+        """Remove one occurrence of a location ID from a list.
+
+        Args:
+            list_number (int): 1 or 2.
+            location_id (int): Location ID.
+        """
+        self.update(list_number, location_id, -1)
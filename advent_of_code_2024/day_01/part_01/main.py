@@ -1,16 +1,52 @@
 """Advent of code - Day 01 - Part 01"""
 
+import bisect
+import contextlib
+import itertools
 import typing as t
+from array import array
+from multiprocessing.shared_memory import SharedMemory
 
-from advent_of_code_2024.day_01.common import read_int_list_from_file
+from advent_of_code_2024.common import RawInput
+from advent_of_code_2024.common.backend import fits_int64, use_numpy
+from advent_of_code_2024.common.budget import Budget, get_budget
+from advent_of_code_2024.common.external_sort import ExternalSorter
+from advent_of_code_2024.common.integer_sort import count_values, is_dense
+from advent_of_code_2024.common.parallel import (
+    get_effective_parallel_mode,
+    get_parallel_workers,
+    parallel_map,
+)
+from advent_of_code_2024.day_01.common import (
+    PARSE_BYTES_PER_CHUNK_BYTE,
+    iter_location_chunks,
+    load_json_location_lists,
+    parse_location_lists,
+)
 
+# Fewest bytes of input parsed at once by the out of core computation.
+MIN_PARSE_CHUNK_SIZE: int = 4096
+# Memory taken by the in memory computation, per byte of input: the arrays
+# of both lists and their sorted copies (4 to 5 bytes measured, whatever
+# the path).
+IN_MEMORY_BYTES_PER_INPUT_BYTE: int = 8
+# Fraction of the remaining memory budget given to the out of core sorts,
+# the rest being left to the merge of their runs and to the interpreter.
+BUDGET_SORT_MEMORY_FRACTION: float = 0.5
+# Fewest IDs per list for the parallel computation to pay for its workers.
+PARALLEL_MIN_ITEMS: int = 1 << 18
+# A shard is a range of indexes of a shared list: (start, end).
+Shard: t.TypeAlias = t.Tuple[int, int]
 
-def compute_total_distance(list_1: t.List[int], list_2: t.List[int]) -> int:
+
+def compute_total_distance(
+    list_1: t.Sequence[int], list_2: t.Sequence[int]
+) -> int:
     """Compute the total distance between two lists (with a one liner).
 
     Args:
-        list_1 (t.List[int]): First list.
-        list_2 (t.List[int]): Second list.
+        list_1 (t.Sequence[int]): First list, such as an array.
+        list_2 (t.Sequence[int]): Second list.
 
     Returns:
         int: Total distance between the two lists.
@@ -21,17 +57,429 @@ def compute_total_distance(list_1: t.List[int], list_2: t.List[int]) -> int:
     )
 
 
+def compute_total_distance_counting(
+    list_1: t.Sequence[int], list_2: t.Sequence[int], lowest: int, highest: int
+) -> int:
+    """Compute the total distance between two lists by counting their IDs.
+
+    Both lists are counted over their value range instead of being sorted,
+    then the runs of equal IDs are paired: each pair of runs adds its
+    distance times the length of its overlap, without ever building the
+    sorted lists.
+
+    Args:
+        list_1 (t.Sequence[int]): First list, such as an array.
+        list_2 (t.Sequence[int]): Second list.
+        lowest (int): Lowest ID of both lists.
+        highest (int): Highest ID of both lists.
+
+    Returns:
+        int: Total distance between the two lists.
+    """
+    if not list_1 or not list_2:
+        return 0
+    values_1, counts_1 = count_values(list_1, lowest, highest)
+    values_2, counts_2 = count_values(list_2, lowest, highest)
+    total_distance: int = 0
+    index_1: int = 0
+    index_2: int = 0
+    remaining_1: int = counts_1[0]
+    remaining_2: int = counts_2[0]
+    while True:
+        overlap: int = min(remaining_1, remaining_2)
+        total_distance += abs(values_1[index_1] - values_2[index_2]) * overlap
+        remaining_1 -= overlap
+        remaining_2 -= overlap
+        if not remaining_1:
+            index_1 += 1
+            if index_1 == len(values_1):
+                return total_distance
+            remaining_1 = counts_1[index_1]
+        if not remaining_2:
+            index_2 += 1
+            if index_2 == len(values_2):
+                return total_distance
+            remaining_2 = counts_2[index_2]
+
+
+def compute_total_distance_numpy(
+    list_1: t.Sequence[int],
+    list_2: t.Sequence[int],
+    value_range: t.Tuple[int, int] | None = None,
+) -> int:
+    """Compute the total distance between two lists with NumPy.
+
+    Args:
+        list_1 (t.Sequence[int]): First list, such as an array.
+        list_2 (t.Sequence[int]): Second list.
+        value_range (t.Tuple[int, int] | None, optional): Lowest and highest
+            IDs of both lists, to sort them by counting. Defaults to None
+            (comparison sort).
+
+    Returns:
+        int: Total distance between the two lists.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    length: int = min(len(list_1), len(list_2))
+    items_1 = np.asarray(list_1, dtype=np.int64)
+    items_2 = np.asarray(list_2, dtype=np.int64)
+    if value_range is None:
+        sorted_1 = np.sort(items_1)[:length]
+        sorted_2 = np.sort(items_2)[:length]
+    else:
+        lowest, highest = value_range
+        values = np.arange(lowest, highest + 1, dtype=np.int64)
+        span: int = highest - lowest + 1
+        sorted_1 = np.repeat(
+            values, np.bincount(items_1 - lowest, minlength=span)
+        )[:length]
+        sorted_2 = np.repeat(
+            values, np.bincount(items_2 - lowest, minlength=span)
+        )[:length]
+    return int(np.abs(sorted_1 - sorted_2).sum())
+
+
+def compute_total_distance_external(
+    raw_input: RawInput, max_memory: int, directory: str | None = None
+) -> int:
+    """Compute the total distance between two lists larger than memory.
+
+    The input is streamed, half of the memory going to the parse of its
+    chunks, into two external sorters sharing the other half, which spill
+    sorted runs to temporary files. Their merged streams are then consumed
+    side by side, the distance being summed on the fly.
+
+    Args:
+        raw_input (RawInput): Raw input, one pair of location IDs per line,
+            such as a memory-mapped file.
+        max_memory (int): Memory of the sorts, in bytes.
+        directory (str | None, optional): Directory of the temporary runs.
+            Defaults to None (the system temporary directory).
+
+    Returns:
+        int: Total distance between the two lists.
+    """
+    chunk_size: int = max(
+        max_memory // (2 * PARSE_BYTES_PER_CHUNK_BYTE), MIN_PARSE_CHUNK_SIZE
+    )
+    with ExternalSorter(max_memory // 4, directory) as sorter_1:
+        with ExternalSorter(max_memory // 4, directory) as sorter_2:
+            for chunk_1, chunk_2 in iter_location_chunks(raw_input, chunk_size):
+                sorter_1.extend(chunk_1)
+                sorter_2.extend(chunk_2)
+            return sum(
+                abs(item_1 - item_2)
+                for item_1, item_2 in zip(sorter_1.sorted(), sorter_2.sorted())
+            )
+
+
+def split_shards(length: int, count: int) -> t.List[Shard]:
+    """Split a range of indexes into shards of about the same length.
+
+    Args:
+        length (int): Number of indexes.
+        count (int): Number of shards.
+
+    Returns:
+        t.List[Shard]: Non-empty shards, in order.
+    """
+    bounds: t.List[int] = [
+        length * shard // count for shard in range(count + 1)
+    ]
+    return [
+        (start, end) for start, end in itertools.pairwise(bounds) if start < end
+    ]
+
+
+@contextlib.contextmanager
+def share_int_array(values: t.Sequence[int]) -> t.Iterator[SharedMemory]:
+    """Copy integers to a shared memory block, unlinked on exit.
+
+    Args:
+        values (t.Sequence[int]): Integers fitting in int64.
+
+    Yields:
+        SharedMemory: Shared memory block holding the integers.
+    """
+    shared_memory: SharedMemory = SharedMemory(
+        create=True, size=max(len(values), 1) * 8
+    )
+    try:
+        view: memoryview = t.cast(memoryview, shared_memory.buf).cast("q")
+        view[: len(values)] = (
+            values
+            if isinstance(values, array) and values.typecode == "q"
+            else array("q", values)
+        )
+        view.release()
+        yield shared_memory
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+@contextlib.contextmanager
+def attach_int_array(name: str) -> t.Iterator[memoryview]:
+    """Attach to a shared memory block of integers, from a worker.
+
+    Args:
+        name (str): Name of the shared memory block.
+
+    Yields:
+        memoryview: Integers of the block, the view is released on exit.
+    """
+    # The block belongs to the process that created it: attaching does not
+    # register it, so that no worker unlinks it on exit.
+    shared_memory: SharedMemory = SharedMemory(name=name, track=False)
+    view: memoryview = t.cast(memoryview, shared_memory.buf).cast("q")
+    try:
+        yield view
+    finally:
+        view.release()
+        shared_memory.close()
+
+
+def sort_shard(task: t.Tuple[str, Shard]) -> None:
+    """Sort a shard of a shared list in place.
+
+    Args:
+        task (t.Tuple[str, Shard]): Name of the shared memory block of the
+            list, and shard to sort.
+    """
+    name, (start, end) = task
+    with attach_int_array(name) as view:
+        view[start:end] = array("q", sorted(view[start:end]))
+
+
+def select_rank(view: memoryview, shards: t.List[Shard], rank: int) -> int:
+    """Find the value of a rank in the merge of sorted shards.
+
+    The value is searched by bisection over the values, counting the items
+    up to each candidate in every shard.
+
+    Args:
+        view (memoryview): Integers of the list.
+        shards (t.List[Shard]): Sorted shards of the list.
+        rank (int): Rank, from 0.
+
+    Returns:
+        int: Value of the item of this rank once the shards are merged.
+    """
+    low: int = min(view[start] for start, _ in shards)
+    high: int = max(view[end - 1] for _, end in shards)
+    while low < high:
+        middle: int = (low + high) // 2
+        if (
+            sum(
+                bisect.bisect_right(view, middle, start, end) - start
+                for start, end in shards
+            )
+            > rank
+        ):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def merge_rank_range(
+    view: memoryview, shards: t.List[Shard], start_rank: int, end_rank: int
+) -> t.List[int]:
+    """Merge the items of a range of ranks from sorted shards.
+
+    Only the items between the values of the first and last ranks are
+    merged, copies of these two values filling the ends of the range, so
+    that the ranges are merged independently of each other.
+
+    Args:
+        view (memoryview): Integers of the list.
+        shards (t.List[Shard]): Sorted shards of the list.
+        start_rank (int): First rank of the range.
+        end_rank (int): Excluded end rank of the range.
+
+    Returns:
+        t.List[int]: Items of the ranks of the range, in order.
+    """
+    first: int = select_rank(view, shards, start_rank)
+    last: int = select_rank(view, shards, end_rank - 1)
+    if first == last:
+        return [first] * (end_rank - start_rank)
+    middle_bounds: t.List[Shard] = [
+        (
+            bisect.bisect_right(view, first, start, end),
+            bisect.bisect_left(view, last, start, end),
+        )
+        for start, end in shards
+    ]
+    through_first: int = sum(
+        middle_start - start
+        for (start, _), (middle_start, _) in zip(shards, middle_bounds)
+    )
+    below_last: int = sum(
+        middle_end - start
+        for (start, _), (_, middle_end) in zip(shards, middle_bounds)
+    )
+    # The concatenated shards are sorted runs, that sorted() merges in C.
+    middle: t.List[int] = sorted(
+        itertools.chain.from_iterable(
+            view[middle_start:middle_end]
+            for middle_start, middle_end in middle_bounds
+        )
+    )
+    return (
+        [first] * (through_first - start_rank)
+        + middle
+        + [last] * (end_rank - below_last)
+    )
+
+
+def sum_distance_slice(
+    task: t.Tuple[str, t.List[Shard], str, t.List[Shard], Shard],
+) -> int:
+    """Sum the distances between the items of a range of ranks of two
+    shared lists whose shards are sorted.
+
+    Args:
+        task (t.Tuple[str, t.List[Shard], str, t.List[Shard], Shard]):
+            Name of the shared memory block and shards of each list, and
+            range of ranks.
+
+    Returns:
+        int: Sum of the distances of the range.
+    """
+    name_1, shards_1, name_2, shards_2, (start_rank, end_rank) = task
+    with attach_int_array(name_1) as view_1:
+        items_1: t.List[int] = merge_rank_range(
+            view_1, shards_1, start_rank, end_rank
+        )
+    with attach_int_array(name_2) as view_2:
+        items_2: t.List[int] = merge_rank_range(
+            view_2, shards_2, start_rank, end_rank
+        )
+    return sum(abs(item_1 - item_2) for item_1, item_2 in zip(items_1, items_2))
+
+
+def compute_total_distance_parallel(
+    list_1: t.Sequence[int],
+    list_2: t.Sequence[int],
+    shard_count: int | None = None,
+) -> int:
+    """Compute the total distance between two lists, in parallel.
+
+    Both lists are copied to shared memory blocks, that the workers attach
+    to instead of receiving pickled copies. Each list is split into shards
+    sorted in place by the workers. The ranks of the pairs are then split
+    into slices: each worker merges the items of its slice from the sorted
+    shards of both lists, and sums their distances. The sum is the one of
+    compute_total_distance, in any parallel mode.
+
+    Args:
+        list_1 (t.Sequence[int]): First list, such as an array.
+        list_2 (t.Sequence[int]): Second list.
+        shard_count (int | None, optional): Number of shards per list and of
+            slices. Defaults to None (the number of parallel workers).
+
+    Returns:
+        int: Total distance between the two lists.
+    """
+    length: int = min(len(list_1), len(list_2))
+    if not length:
+        return 0
+    count: int = shard_count or get_parallel_workers()
+    shards_1: t.List[Shard] = split_shards(len(list_1), count)
+    shards_2: t.List[Shard] = split_shards(len(list_2), count)
+    with share_int_array(list_1) as shared_1, share_int_array(
+        list_2
+    ) as shared_2:
+        parallel_map(
+            sort_shard,
+            [(shared_1.name, shard) for shard in shards_1]
+            + [(shared_2.name, shard) for shard in shards_2],
+        )
+        return sum(
+            parallel_map(
+                sum_distance_slice,
+                [
+                    (shared_1.name, shards_1, shared_2.name, shards_2, ranks)
+                    for ranks in split_shards(length, count)
+                ],
+            )
+        )
+
+
+def get_budget_sort_memory(input_size: int) -> int | None:
+    """Get the memory of the out of core sorts set by the memory budget.
+
+    Args:
+        input_size (int): Size of the input, in bytes.
+
+    Returns:
+        int | None: BUDGET_SORT_MEMORY_FRACTION of the memory the run may
+            still use, None without memory budget or when the in memory
+            computation fits in it.
+    """
+    budget: Budget | None = get_budget()
+    remaining_memory: int | None = (
+        budget.get_remaining_memory() if budget is not None else None
+    )
+    if (
+        remaining_memory is None
+        or input_size * IN_MEMORY_BYTES_PER_INPUT_BYTE <= remaining_memory
+    ):
+        return None
+    return int(remaining_memory * BUDGET_SORT_MEMORY_FRACTION)
+
+
+def solve(raw_input: RawInput, max_memory: int | None = None) -> int:
+    """Solve the puzzle from its raw input.
+
+    With a memory limit, the lists are sorted out of core, within that
+    limit. Under the memory budget of the run, they only are when the
+    input would not fit in memory: the sorts then get a fraction of the
+    remaining budget, see get_budget_sort_memory.
+
+    Args:
+        raw_input (RawInput): Raw input, one pair of location IDs per line.
+        max_memory (int | None, optional): Memory of the sorts, in bytes.
+            Defaults to None (the lists are sorted in memory, unless the
+            memory budget of the run is too small for them).
+
+    Returns:
+        int: Total distance between the two lists.
+    """
+    if max_memory is None:
+        max_memory = get_budget_sort_memory(len(raw_input))
+    if max_memory is not None:
+        return compute_total_distance_external(raw_input, max_memory)
+    list_1, list_2 = parse_location_lists(raw_input)
+    if not list_1 or not list_2:
+        return 0
+    lowest: int = min(map(min, (list_1, list_2)))
+    highest: int = max(map(max, (list_1, list_2)))
+    # Lists with many IDs per value of their range are sorted by counting.
+    dense: bool = is_dense(min(len(list_1), len(list_2)), lowest, highest)
+    if use_numpy() and fits_int64(
+        2 * max(abs(lowest), abs(highest)) * len(list_1)
+    ):
+        return compute_total_distance_numpy(
+            list_1, list_2, (lowest, highest) if dense else None
+        )
+    if (
+        get_effective_parallel_mode() != "serial"
+        and get_parallel_workers() > 1
+        and min(len(list_1), len(list_2)) >= PARALLEL_MIN_ITEMS
+    ):
+        return compute_total_distance_parallel(list_1, list_2)
+    if dense:
+        return compute_total_distance_counting(list_1, list_2, lowest, highest)
+    return compute_total_distance(list_1, list_2)
+
+
 def main() -> None:
     """Main function."""
     total_distance: int = compute_total_distance(
-        read_int_list_from_file(
-            file_name="list_1.json",
-            from_file=__file__,
-        ),
-        read_int_list_from_file(
-            file_name="list_2.json",
-            from_file=__file__,
-        ),
+        *load_json_location_lists(__file__)
     )
     print(total_distance)
 
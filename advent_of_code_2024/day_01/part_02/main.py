@@ -3,15 +3,22 @@
 import typing as t
 from collections import Counter
 
-from advent_of_code_2024.day_01.common import read_int_list_from_file
+from advent_of_code_2024.common import RawInput
+from advent_of_code_2024.common.backend import fits_int64, use_numpy
+from advent_of_code_2024.day_01.common import (
+    load_json_location_lists,
+    parse_location_lists,
+)
 
 
-def compute_similarity_score(list_1: t.List[int], list_2: t.List[int]) -> int:
+def compute_similarity_score(
+    list_1: t.Sequence[int], list_2: t.Sequence[int]
+) -> int:
     """Compute the similarity score between two lists.
 
     Args:
-        list_1 (t.List[int]): First list.
-        list_2 (t.List[int]): Second list.
+        list_1 (t.Sequence[int]): First list, such as an array.
+        list_2 (t.Sequence[int]): Second list.
 
     Returns:
         int: Similarity score.
@@ -20,17 +27,50 @@ def compute_similarity_score(list_1: t.List[int], list_2: t.List[int]) -> int:
     return sum(item_1 * list_2_counts.get(item_1, 0) for item_1 in list_1)
 
 
+def compute_similarity_score_numpy(
+    list_1: t.Sequence[int], list_2: t.Sequence[int]
+) -> int:
+    """Compute the similarity score between two lists with NumPy.
+
+    Args:
+        list_1 (t.Sequence[int]): First list, such as an array.
+        list_2 (t.Sequence[int]): Second list.
+
+    Returns:
+        int: Similarity score.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    items_1 = np.asarray(list_1, dtype=np.int64)
+    values_2, counts_2 = np.unique(
+        np.asarray(list_2, dtype=np.int64), return_counts=True
+    )
+    indexes = np.minimum(np.searchsorted(values_2, items_1), len(values_2) - 1)
+    counts = np.where(values_2[indexes] == items_1, counts_2[indexes], 0)
+    return int((items_1 * counts).sum())
+
+
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input, one pair of location IDs per line.
+
+    Returns:
+        int: Similarity score between the two lists.
+    """
+    list_1, list_2 = parse_location_lists(raw_input)
+    if use_numpy() and list_1 and list_2:
+        largest: int = max(abs(min(list_1)), abs(max(list_1)))
+        if fits_int64(largest * len(list_1) * len(list_2)):
+            return compute_similarity_score_numpy(list_1, list_2)
+    return compute_similarity_score(list_1, list_2)
+
+
 def main() -> None:
     """Main function."""
     similarity_score: int = compute_similarity_score(
-        read_int_list_from_file(
-            file_name="list_1.json",
-            from_file=__file__,
-        ),
-        read_int_list_from_file(
-            file_name="list_2.json",
-            from_file=__file__,
-        ),
+        *load_json_location_lists(__file__)
     )
     print(similarity_score)
 
@@ -1,26 +1,31 @@
 """Common methods for the Day 02"""
 
 import json
-import os
 import typing as t
 
+from advent_of_code_2024.common import (
+    RawInput,
+    extract_ints_per_line,
+    to_buffer,
+)
+from advent_of_code_2024.common.parse_cache import cached_parser
 
-def read_reports_from_files(
-    file_name: str, from_file: str
-) -> t.List[t.List[int]]:
-    """Read reports from files.
+
+@cached_parser(version=1)
+def parse_reports(raw_input: RawInput) -> t.List[t.List[int]]:
+    """Parse reports from a raw input.
+
+    The raw input is either a JSON list of reports
+    or one report per line with space separated levels.
 
     Args:
-        file_name (str): File name.
-        from_file (str): Path to the file that calls this function.
+        raw_input (RawInput): Raw input.
 
     Returns:
         t.List[t.List[int]]: List of reports.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-    res: t.List[t.List[int]] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        res = json.load(file_descriptor)
-    return res
+    buffer = to_buffer(raw_input)
+    if bytes(buffer[:64]).lstrip().startswith(b"["):
+        reports: t.List[t.List[int]] = json.loads(bytes(buffer))
+        return reports
+    return extract_ints_per_line(buffer)
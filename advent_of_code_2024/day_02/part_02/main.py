@@ -4,7 +4,9 @@ import enum
 import typing as t
 from copy import deepcopy
 
-from advent_of_code_2024.day_02.common import read_reports_from_files
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.backend import fits_int64, use_numpy
+from advent_of_code_2024.day_02.common import parse_reports
 
 
 class SideEnum(enum.IntEnum):
@@ -82,15 +84,63 @@ def count_safe_reports(reports: t.List[t.List[int]]) -> int:
     return len(reports) - len(reports_to_retry) + fixed_reports_count
 
 
+def count_safe_reports_numpy(reports: t.List[t.List[int]]) -> int:
+    """Count safe reports with NumPy, with the problem dampener.
+
+    Reports are grouped in one level matrix per length, a report is safe
+    if it is safe as is or once one of its levels is removed.
+
+    Args:
+        reports (t.List[t.List[int]]): List of reports.
+
+    Returns:
+        int: Number of safe reports, with the problem dampener.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    reports_by_length: t.Dict[int, t.List[t.List[int]]] = {}
+    for report in reports:
+        reports_by_length.setdefault(len(report), []).append(report)
+
+    count: int = 0
+    for length, same_length_reports in reports_by_length.items():
+        levels = np.asarray(same_length_reports, dtype=np.int64)
+        candidates = [levels] + [
+            np.delete(levels, index, axis=1) for index in range(length)
+        ]
+        safe = np.zeros(len(levels), dtype=bool)
+        for candidate in candidates:
+            differences = np.diff(candidate, axis=1)
+            safe |= np.all(
+                (differences >= 1) & (differences <= 3), axis=1
+            ) | np.all((differences >= -3) & (differences <= -1), axis=1)
+        count += int(safe.sum())
+    return count
+
+
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Number of safe reports, with the problem dampener.
+    """
+    reports: t.List[t.List[int]] = parse_reports(raw_input)
+    if use_numpy():
+        largest_level: int = max(
+            (abs(level) for report in reports for level in report), default=0
+        )
+        if fits_int64(2 * largest_level):
+            return count_safe_reports_numpy(reports)
+    return count_safe_reports(reports)
+
+
 def main() -> None:
     """Main function."""
-    safe_reports: int = count_safe_reports(
-        read_reports_from_files(
-            file_name="lists.json",
-            from_file=__file__,
-        )
-    )
-    print(safe_reports)
+    with map_input_file("lists.json", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
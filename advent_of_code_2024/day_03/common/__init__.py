@@ -1,22 +1,15 @@
 """Common methods for the Day 03"""
 
-import os
+from advent_of_code_2024.common import RawInput, decode_raw_input
 
 
-def read_expression_from_file(file_name: str, from_file: str) -> str:
-    """Read a raw expression from a file.
+def parse_expression(raw_input: RawInput) -> str:
+    """Parse a raw expression.
 
     Args:
-        file_name (str): File name.
-        from_file (str): Path to the file that calls this function.
+        raw_input (RawInput): Raw input.
 
     Returns:
         str: Raw expression.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-    res: str = ""
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        res = file_descriptor.read()
-    return res
+    return decode_raw_input(raw_input)
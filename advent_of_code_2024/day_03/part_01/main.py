@@ -2,7 +2,8 @@
 
 import re
 
-from advent_of_code_2024.day_03.common import read_expression_from_file
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.day_03.common import parse_expression
 
 
 def fix_expression(corrupted_expression: str) -> str:
@@ -23,12 +24,24 @@ def fix_expression(corrupted_expression: str) -> str:
     return fixed_expression
 
 
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Result of the fixed expression.
+    """
+    fixed_expression: str = fix_expression(parse_expression(raw_input))
+    result: int = eval(fixed_expression)  # pylint: disable=eval-used
+    return result
+
+
 def main() -> None:
     """Main function."""
-    corrupted_expression: str = read_expression_from_file("input.txt", __file__)
-    fixed_expression: str = fix_expression(corrupted_expression)
-    result: int = eval(fixed_expression)  # pylint: disable=eval-used
-    print(result)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -2,7 +2,8 @@
 
 import re
 
-from advent_of_code_2024.day_03.common import read_expression_from_file
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.day_03.common import parse_expression
 
 
 def compute_less_corrupted_expression(corrupted_expression: str) -> int:
@@ -57,11 +58,22 @@ def compute_fully_corrupted_expression(corrupted_expression: str) -> int:
     return result
 
 
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Result of the enabled multiplications.
+    """
+    return compute_fully_corrupted_expression(parse_expression(raw_input))
+
+
 def main() -> None:
     """Main function."""
-    corrupted_expression: str = read_expression_from_file("input.txt", __file__)
-    result: int = compute_fully_corrupted_expression(corrupted_expression)
-    print(result)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
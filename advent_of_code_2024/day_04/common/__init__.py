@@ -1,23 +1,21 @@
 """Common methods for the Day 04"""
 
-import os
-import typing as t
+from advent_of_code_2024.common import RawInput
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.common.parse_cache import cached_parser
 
+# Border cells value, breaking the words at the edges of the board.
+BORDER: int = ord(".")
 
-def read_board(file_name: str, from_file: str) -> t.List[t.List[str]]:
-    """Read a board from a txt file.
+
+@cached_parser(version=2)
+def parse_board(raw_input: RawInput) -> Grid:
+    """Parse a board from a raw input.
 
     Args:
-        file_name (str): File name.
-        from_file (str): Path to the file that calls this function.
+        raw_input (RawInput): Raw input.
 
     Returns:
-        t.List[t.List[str]]: List of lines.
+        Grid: Board, surrounded by a border.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-    board: t.List[t.List[str]] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        board = [list(line) for line in file_descriptor]
-    return board
+    return Grid.parse(raw_input, border=BORDER)
@@ -3,93 +3,90 @@
 import re
 import typing as t
 
-from advent_of_code_2024.day_04.common import read_board
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.day_04.common import parse_board
 
 
-def horizontal_walk(board: t.List[t.List[str]]) -> t.Generator[t.List[str]]:
-    """Horizontal walk through the board.
+def strided_walk(board: Grid, step: int) -> t.Generator[bytearray, None, None]:
+    """Walk through the board cells taken every step cells.
+
+    Border cells separate the lines of the board in every direction, so the
+    walk never joins the end of a line to the start of the next one.
 
     Args:
-        board (t.List[t.List[str]]): Board.
+        board (Grid): Board, surrounded by a border.
+        step (int): Index offset between two consecutive cells.
+
+    Yields:
+        bytearray: Cells of the lines, separated by border cells.
+    """
+    for start in range(step):
+        yield board.cells[start::step]
 
-    Returns:
-        t.Generator[t.List[str]]: Generator of lines.
+
+def horizontal_walk(board: Grid) -> t.Generator[bytearray, None, None]:
+    """Horizontal walk through the board.
+
+    Args:
+        board (Grid): Board.
 
     Yields:
-        Iterator[t.Generator[t.List[str]]]: Line.
+        bytearray: Lines.
     """
-    for line in board:
-        yield line
+    yield from strided_walk(board, 1)
 
 
-def vertical_walk(board: t.List[t.List[str]]) -> t.Generator[t.List[str]]:
+def vertical_walk(board: Grid) -> t.Generator[bytearray, None, None]:
     """Vertical walk through the board.
 
     Args:
-        board (t.List[t.List[str]]): Board.
-
-    Returns:
-        t.Generator[t.List[str]]: Generator of lines.
+        board (Grid): Board.
 
     Yields:
-        Iterator[t.Generator[t.List[str]]]: Line.
+        bytearray: Lines.
     """
-    for line in zip(*board):
-        yield list(line)
+    yield from strided_walk(board, board.stride)
 
 
-def diagonal_walk(board: t.List[t.List[str]]) -> t.Generator[t.List[str]]:
+def diagonal_walk(board: Grid) -> t.Generator[bytearray, None, None]:
     """Diagonal walk through the board.
 
     Args:
-        board (t.List[t.List[str]]): Board.
-
-    Returns:
-        t.Generator[t.List[str]]: Generator of lines.
+        board (Grid): Board.
 
     Yields:
-        Iterator[t.Generator[t.List[str]]]: Line.
+        bytearray: Lines.
     """
-    # Bottom left to top right
-    for i in range(len(board)):
-        yield [board[i + j][j] for j in range(len(board) - i)]
-    for i in range(1, len(board)):
-        yield [board[j][i + j] for j in range(len(board) - i)]
-
     # Top left to bottom right
-    for i in range(len(board)):
-        yield [board[i - j][j] for j in range(i + 1)]
-    for i in range(1, len(board)):
-        yield [board[len(board) - 1 - j][i + j] for j in range(len(board) - i)]
+    yield from strided_walk(board, board.stride + 1)
+    # Top right to bottom left
+    yield from strided_walk(board, board.stride - 1)
 
 
 def count_occurences_in_line(
-    board: t.List[t.List[str]],
-    walk_method: t.Callable[
-        [t.List[t.List[str]]], t.Generator[list[str], None, None]
-    ],
+    board: Grid,
+    walk_method: t.Callable[[Grid], t.Generator[bytearray, None, None]],
 ) -> int:
     """Count the occurrences of the patterns in the board
     using a specific walk through method.
 
     Args:
-        board (t.List[t.List[str]]): Board.
+        board (Grid): Board.
         walk_method (t.Callable[]): Walk through method.
 
     Returns:
         int: Number of occurrences.
     """
-    regex: re.Pattern[str] = re.compile(r"(?=(XMAS))|(?=(SAMX))")
-    return sum(
-        len(re.findall(regex, "".join(line))) for line in walk_method(board)
-    )
+    regex: re.Pattern[bytes] = re.compile(rb"(?=(XMAS))|(?=(SAMX))")
+    return sum(len(regex.findall(line)) for line in walk_method(board))
 
 
-def count_occurrences_in_board(board: t.List[t.List[str]]) -> int:
+def count_occurrences_in_board(board: Grid) -> int:
     """Count the occurrences of the patterns in the board.
 
     Args:
-        board (t.List[t.List[str]]): Board.
+        board (Grid): Board.
 
     Returns:
         int: Number of occurrences.
@@ -101,11 +98,22 @@ def count_occurrences_in_board(board: t.List[t.List[str]]) -> int:
     return occurrences
 
 
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Number of occurrences of XMAS.
+    """
+    return count_occurrences_in_board(parse_board(raw_input))
+
+
 def main() -> None:
     """Main function."""
-    board: t.List[t.List[str]] = read_board("input.txt", __file__)
-    occurrences: int = count_occurrences_in_board(board)
-    print(occurrences)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -2,57 +2,61 @@
 
 import typing as t
 
-from advent_of_code_2024.day_04.common import read_board
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.day_04.common import parse_board
 
+# Letters at both ends of a diagonal of a X-MAS pattern.
+DIAGONAL_ENDS: t.Set[int] = {ord("M"), ord("S")}
 
-def generate_patterns() -> t.List[t.List[t.List[str]]]:
-    """Generate patterns.
 
-    Returns:
-        t.List[t.List[t.List[str]]]: List of patterns.
-    """
-    return [
-        [["M", ".", "S"], [".", "A", "."], ["M", ".", "S"]],
-        [["M", ".", "M"], [".", "A", "."], ["S", ".", "S"]],
-        [["S", ".", "S"], [".", "A", "."], ["M", ".", "M"]],
-        [["S", ".", "M"], [".", "A", "."], ["S", ".", "M"]],
-    ]
-
-
-def count_occurences(board: t.List[t.List[str]]) -> int:
+def count_occurences(board: Grid) -> int:
     """Count the number of occurences of the patterns in the board.
 
+    Each pattern is centered on an "A" whose diagonals both read MAS or
+    SAM. The border of the board gives every cell four diagonal
+    neighbours.
+
     Args:
-        board (t.List[t.List[str]]): Board.
+        board (Grid): Board, surrounded by a border.
 
     Returns:
         int: Count of occurences.
     """
-    rows, cols = len(board), len(board[0])
+    cells: bytearray = board.cells
+    diagonal: int = board.stride + 1
+    anti_diagonal: int = board.stride - 1
     count: int = 0
-    for pattern in generate_patterns():
-        p_rows, p_cols = len(pattern), len(pattern[0])
-        for i in range(rows - p_rows + 1):
-            for j in range(cols - p_cols + 1):
-                match = True
-                # Check if the sub-board matches the pattern
-                for pi in range(p_rows):
-                    for pj in range(p_cols):
-                        if pattern[pi][pj] == ".":
-                            continue
-                        if board[i + pi][j + pj] != pattern[pi][pj]:
-                            match = False
-                            break
-                if match:
-                    count += 1
+    for index in board.find_all(ord("A")):
+        diagonal_ends: t.Set[int] = {
+            cells[index - diagonal],
+            cells[index + diagonal],
+        }
+        anti_diagonal_ends: t.Set[int] = {
+            cells[index - anti_diagonal],
+            cells[index + anti_diagonal],
+        }
+        if diagonal_ends == anti_diagonal_ends == DIAGONAL_ENDS:
+            count += 1
     return count
 
 
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Number of occurrences of the X-MAS patterns.
+    """
+    return count_occurences(parse_board(raw_input))
+
+
 def main() -> None:
     """Main function."""
-    board: t.List[t.List[str]] = read_board("input.txt", __file__)
-    count: int = count_occurences(board)
-    print(count)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,41 +1,36 @@
 """Common methods for the Day 05"""
 
-import os
 import typing as t
 
+from advent_of_code_2024.common import (
+    RawInput,
+    extract_ints_per_line,
+    split_sections,
+)
+from advent_of_code_2024.common.parse_cache import cached_parser
 
-def read_input_file(
-    file_name: str,
-    from_file: str,
+
+@cached_parser(version=1)
+def parse_input(
+    raw_input: RawInput,
 ) -> t.Tuple[t.Dict[int, t.List[int]], t.List[t.List[int]]]:
-    """Read the input file and return the page ordering rules and updates.
+    """Parse the raw input and return the page ordering rules and updates.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
         t.Tuple[t.Dict[int, t.List[int]], t.List[t.List[int]]]:
             Page ordering rules and updates.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-
     page_ordering_rules: t.Dict[int, t.List[int]] = {}
     updates: t.List[t.List[int]] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        for line in file_descriptor.readlines():
-            if "|" in line:
-                if page_ordering_rules.get(int(line.split("|")[0])) is None:
-                    page_ordering_rules[int(line.split("|")[0])] = []
-                page_ordering_rules[int(line.split("|")[0])].append(
-                    int(line.split("|")[1])
-                )
-            elif len(line.replace("\n", "")) > 0:
-                updates.append(
-                    [int(num) for num in line.split(",") if num != "\n"]
-                )
+    sections: t.List[bytes] = split_sections(raw_input)
+    if sections:
+        for before, after in extract_ints_per_line(sections[0]):
+            page_ordering_rules.setdefault(before, []).append(after)
+    for section in sections[1:]:
+        updates.extend(extract_ints_per_line(section))
 
     return page_ordering_rules, updates
 
@@ -2,12 +2,20 @@
 
 import typing as t
 
-from advent_of_code_2024.day_05.common import is_valid_update, read_input_file
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.day_05.common import is_valid_update, parse_input
 
 
-def main() -> None:
-    """Main function."""
-    page_ordering_rules, updates = read_input_file("input.txt", __file__)
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Sum of the middle pages of the valid updates.
+    """
+    page_ordering_rules, updates = parse_input(raw_input)
 
     valid_updates: t.List[t.List[int]] = [
         update
@@ -15,7 +23,13 @@ def main() -> None:
         if is_valid_update(page_ordering_rules, update)
     ]
 
-    print(sum(update[(int(len(update) // 2))] for update in valid_updates))
+    return sum(update[(int(len(update) // 2))] for update in valid_updates)
+
+
+def main() -> None:
+    """Main function."""
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -3,12 +3,20 @@
 import typing as t
 from functools import cmp_to_key
 
-from advent_of_code_2024.day_05.common import is_valid_update, read_input_file
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.day_05.common import is_valid_update, parse_input
 
 
-def main() -> None:
-    """Main function."""
-    page_ordering_rules, updates = read_input_file("input.txt", __file__)
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Sum of the middle pages of the fixed invalid updates.
+    """
+    page_ordering_rules, updates = parse_input(raw_input)
     invalid_updates: t.List[t.List[int]] = [
         update
         for update in updates
@@ -24,7 +32,13 @@ def main() -> None:
             )
         )
 
-    print(sum(update[(int(len(update) // 2))] for update in invalid_updates))
+    return sum(update[(int(len(update) // 2))] for update in invalid_updates)
+
+
+def main() -> None:
+    """Main function."""
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
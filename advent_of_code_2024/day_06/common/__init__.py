@@ -1,31 +1,22 @@
 """Common methods for the Day 06"""
 
-import os
-import typing as t
+from advent_of_code_2024.common import RawInput
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.common.parse_cache import cached_parser
 
+# Border cells value, the guard leaves the board when reaching it.
+OUTSIDE: int = ord(" ")
+OBSTACLE: int = ord("#")
 
-def read_board(
-    file_name: str,
-    from_file: str,
-) -> t.List[t.List[str]]:
-    """Read the input file and return the board.
+
+@cached_parser(version=2)
+def parse_board(raw_input: RawInput) -> Grid:
+    """Parse the raw input and return the board.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
-        t.List[t.List[str]]: The board.
+        Grid: The board, surrounded by a border of OUTSIDE cells.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-
-    board: t.List[t.List[str]] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        board = [
-            list(line.replace("\n", ""))
-            for line in file_descriptor
-            if len(line.replace("\n", "")) > 0
-        ]
-    return board
+    return Grid.parse(raw_input, border=OUTSIDE)
@@ -3,7 +3,10 @@
 import typing as t
 from enum import Enum
 
-from advent_of_code_2024.day_06.common import read_board
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.counters import add_count
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.day_06.common import OBSTACLE, OUTSIDE, parse_board
 
 
 class AlreadyVisitedException(Exception):
@@ -19,13 +22,22 @@ class DirectionEnum(Enum):
     RIGHT = ">"
 
 
+# Index of each direction in the clockwise grid neighbour offsets.
+DIRECTION_INDEXES: t.Dict[DirectionEnum, int] = {
+    DirectionEnum.UP: 0,
+    DirectionEnum.RIGHT: 1,
+    DirectionEnum.DOWN: 2,
+    DirectionEnum.LEFT: 3,
+}
+
+
 class Board:
     """Board class."""
 
-    value: t.List[t.List[str]]
+    value: Grid
 
-    def __init__(self, raw_board: t.List[t.List[str]]) -> None:
-        self.value = raw_board
+    def __init__(self, grid: Grid) -> None:
+        self.value = grid
 
     def __str__(self) -> str:
         """Return the board as a string.
@@ -33,11 +45,7 @@ class Board:
         Returns:
             str: The board as a string.
         """
-        str_board: str = ""
-        for line in self.value:
-            str_board += "".join(line) + "\n"
-        str_board += "\n"
-        return str_board
+        return f"{self.value}\n\n"
 
     def count_unique_positions(self, position_chars: t.List[str]) -> int:
         """Count the number of unique positions in the board.
@@ -49,38 +57,43 @@ class Board:
         Returns:
             int: The number of unique positions in the board.
         """
-        unique_positions: int = 0
-        for row in self.value:
-            for cell in row:
-                if cell in position_chars:
-                    unique_positions += 1
-        return unique_positions
+        return sum(self.value.count(ord(char)) for char in position_chars)
 
 
 class Guard:
     """Guard class."""
 
-    pos_x: int
-    pos_y: int
+    position: int
     board: Board
     direction: DirectionEnum
-    already_visited_positions: t.Dict[str, t.List[str]]
+    # Bit mask of the directions the guard had on each cell.
+    already_visited_positions: bytearray
 
     def __init__(self, board: Board) -> None:
         """Initialize the guard object.
 
         Args:
-            board (t.List[t.List[str]]): The board.
+            board (Board): The board.
+
+        Raises:
+            ValueError: If the guard is not on the board.
         """
-        self.already_visited_positions = {}
         self.board = board
-        for y, row in enumerate(self.board.value):
-            for x, cell in enumerate(row):
-                if cell in [direction.value for direction in DirectionEnum]:
-                    self.pos_x = x
-                    self.pos_y = y
-                    self.direction = DirectionEnum(cell)
-                    return
+        self.already_visited_positions = bytearray(len(board.value.cells))
+        guard_positions: t.List[t.Tuple[int, DirectionEnum]] = [
+            (board.value.find(ord(direction.value)), direction)
+            for direction in DirectionEnum
+        ]
+        found_positions: t.List[t.Tuple[int, DirectionEnum]] = [
+            guard_position
+            for guard_position in guard_positions
+            if guard_position[0] != -1
+        ]
+        if not found_positions:
+            raise ValueError("Guard not found on the board.")
+        self.position, self.direction = min(
+            found_positions, key=lambda guard_position: guard_position[0]
+        )
 
     def update_direction(self) -> None:
         """Update the guard direction after hitting an obstacle.
@@ -98,29 +111,25 @@ class Guard:
             case DirectionEnum.LEFT:
                 self.direction = DirectionEnum.UP
 
+    def get_step_offset(self) -> int:
+        """Get the index offset of a step in the guard direction.
+
+        Returns:
+            int: Index offset.
+        """
+        return self.board.value.neighbour_offsets[
+            DIRECTION_INDEXES[self.direction]
+        ]
+
     def is_in_front_of_obstacle(self) -> bool:
         """Check if the guard is in front of an obstacle.
 
         Returns:
             bool: True if the guard is in front of an obstacle, False otherwise.
         """
-        match self.direction:
-            case DirectionEnum.UP:
-                if self.pos_y == 0:
-                    return False
-                return self.board.value[self.pos_y - 1][self.pos_x] == "#"
-            case DirectionEnum.RIGHT:
-                if self.pos_x == len(self.board.value[self.pos_y]) - 1:
-                    return False
-                return self.board.value[self.pos_y][self.pos_x + 1] == "#"
-            case DirectionEnum.DOWN:
-                if self.pos_y == len(self.board.value) - 1:
-                    return False
-                return self.board.value[self.pos_y + 1][self.pos_x] == "#"
-            case DirectionEnum.LEFT:
-                if self.pos_x == 0:
-                    return False
-                return self.board.value[self.pos_y][self.pos_x - 1] == "#"
+        return (
+            self.board.value[self.position + self.get_step_offset()] == OBSTACLE
+        )
 
     def is_out_of_board(self) -> bool:
         """Check if the guard is out of the board.
@@ -128,40 +137,22 @@ class Guard:
         Returns:
             bool: True if the guard is out of the board, False otherwise.
         """
-        if self.pos_y < 0 or self.pos_y >= len(self.board.value):
-            return True
-
-        if self.pos_x < 0 or self.pos_x >= len(self.board.value[self.pos_y]):
-            return True
-
-        return False
+        return self.board.value[self.position] == OUTSIDE
 
     def step_forward(self) -> None:
         """Move the guard one step forward."""
-        self.board.value[self.pos_y][self.pos_x] = self.direction.value
-        match self.direction:
-            case DirectionEnum.UP:
-                self.pos_y -= 1
-            case DirectionEnum.RIGHT:
-                self.pos_x += 1
-            case DirectionEnum.DOWN:
-                self.pos_y += 1
-            case DirectionEnum.LEFT:
-                self.pos_x -= 1
+        self.board.value[self.position] = ord(self.direction.value)
+        self.position += self.get_step_offset()
         if self.is_out_of_board():
             return
         if self.already_visited_new_position():
             raise AlreadyVisitedException(
-                f"Guard already visited position ({self.pos_x}, {self.pos_y})"
+                "Guard already visited position "
+                f"{self.board.value.position(self.position)}"
             )
-        self.board.value[self.pos_y][self.pos_x] = self.direction.value
-        if (
-            self.already_visited_positions.get(f"{self.pos_x},{self.pos_y}")
-            is None
-        ):
-            self.already_visited_positions[f"{self.pos_x},{self.pos_y}"] = []
-        self.already_visited_positions[f"{self.pos_x},{self.pos_y}"].append(
-            self.direction.value
+        self.board.value[self.position] = ord(self.direction.value)
+        self.already_visited_positions[self.position] |= 1 << (
+            DIRECTION_INDEXES[self.direction]
         )
 
     def already_visited_new_position(self) -> bool:
@@ -170,31 +161,46 @@ class Guard:
         Returns:
             bool: True if the guard has already visited the new position.
         """
-        return self.direction.value in self.already_visited_positions.get(
-            f"{self.pos_x},{self.pos_y}", []
+        return bool(
+            self.already_visited_positions[self.position]
+            & 1 << DIRECTION_INDEXES[self.direction]
         )
 
     def walk(self) -> None:
         """Walk the guard through the board."""
-        while not self.is_out_of_board():
-            if self.is_in_front_of_obstacle():
-                self.update_direction()
-            else:
-                self.step_forward()
+        steps: int = 0
+        try:
+            while not self.is_out_of_board():
+                if self.is_in_front_of_obstacle():
+                    self.update_direction()
+                else:
+                    steps += 1
+                    self.step_forward()
+        finally:
+            add_count("guard_steps", steps)
+
+
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Number of distinct positions visited by the guard.
+    """
+    board: Board = Board(parse_board(raw_input))
+    guard: Guard = Guard(board)
+    guard.walk()
+    return guard.board.count_unique_positions(
+        position_chars=[direction.value for direction in DirectionEnum]
+    )
 
 
 def main() -> None:
     """Main function."""
-    raw_board: t.List[t.List[str]] = read_board("input.txt", __file__)
-    board: Board = Board(raw_board)
-    guard: Guard = Guard(board)
-    guard.walk()
-    print(guard.board)
-    print(
-        guard.board.count_unique_positions(
-            position_chars=[direction.value for direction in DirectionEnum]
-        )
-    )
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
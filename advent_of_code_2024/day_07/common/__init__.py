@@ -1,44 +1,28 @@
 """Common methods for the Day 07"""
 
-import os
 import re
 import typing as t
 from enum import Enum
 from itertools import product
 
+from advent_of_code_2024.common import RawInput, extract_ints_per_line
+from advent_of_code_2024.common.parse_cache import cached_parser
 
-def read_equations(
-    file_name: str,
-    from_file: str,
-) -> t.List[t.Tuple[int, t.List[int]]]:
-    """Read equations from a file.
+
+@cached_parser(version=1)
+def parse_equations(raw_input: RawInput) -> t.List[t.Tuple[int, t.List[int]]]:
+    """Parse equations from a raw input.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
         t.List[t.Tuple[int, t.List[int]]]: List of equations.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-
-    equations: t.List[t.Tuple[int, t.List[int]]] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        for line in file_descriptor:
-            line = line.strip()
-            if line:
-                equation: t.Tuple[int, t.List[int]] = (
-                    int(line.split(":")[0]),
-                    [
-                        int(num.replace(" ", ""))
-                        for num in line.split(":")[1].split(" ")
-                        if len(num.replace(" ", ""))
-                    ],
-                )
-                equations.append(equation)
-    return equations
+    return [
+        (numbers[0], numbers[1:])
+        for numbers in extract_ints_per_line(raw_input)
+    ]
 
 
 class OperatorsEnum(Enum):
@@ -121,3 +105,18 @@ def is_equation_valid(
         if compute_equation(str_equation, operators) == expected_result:
             return True
     return False
+
+
+def is_calibrated_equation(
+    operators: t.List[str], equation: t.Tuple[int, t.List[int]]
+) -> bool:
+    """Check if an equation can be made true, as a parallel_map item.
+
+    Args:
+        operators (t.List[str]): List of available operators.
+        equation (t.Tuple[int, t.List[int]]): Expected result and numbers.
+
+    Returns:
+        bool: True if the equation is valid, False otherwise.
+    """
+    return is_equation_valid(equation[0], equation[1], operators)
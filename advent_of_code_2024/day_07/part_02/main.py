@@ -1,25 +1,41 @@
 """Advent of code - Day 07 - Part 02"""
 
 import typing as t
+from functools import partial
 
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.parallel import parallel_map
 from advent_of_code_2024.day_07.common import (
     OperatorsEnum,
-    is_equation_valid,
-    read_equations,
+    is_calibrated_equation,
+    parse_equations,
 )
 
 
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Total calibration result of the equations
+            that can be made true with all the operators.
+    """
+    equations: t.List[t.Tuple[int, t.List[int]]] = parse_equations(raw_input)
+    operators: t.List[str] = [operator.value for operator in OperatorsEnum]
+    valid: t.List[bool] = parallel_map(
+        partial(is_calibrated_equation, operators), equations
+    )
+    return sum(
+        equation[0] for equation, is_valid in zip(equations, valid) if is_valid
+    )
+
+
 def main() -> None:
     """Main function."""
-    equations: t.List[t.Tuple[int, t.List[int]]] = read_equations(
-        "input.txt", __file__
-    )
-    operators: t.List[str] = [operator.value for operator in OperatorsEnum]
-    valid_equations: t.List[t.Tuple[int, t.List[int]]] = []
-    for equation in equations:
-        if is_equation_valid(equation[0], equation[1], operators):
-            valid_equations.append(equation)
-    print(sum(equation[0] for equation in valid_equations))
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,50 +1,16 @@
 """Common methods for the Day 08"""
 
-import os
 import string
 import typing as t
 
+from advent_of_code_2024.common import RawInput, parse_grid
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.common.parse_cache import cached_parser
+from advent_of_code_2024.common.render import emit, is_verbose, render_grid
+from advent_of_code_2024.common.vectors import Vector
 
-class Position:
-    """Position class."""
-
-    x: int
-    y: int
-
-    def __init__(self, pos_x: int, pos_y: int):
-        self.x = pos_x
-        self.y = pos_y
-
-    def __repr__(self) -> str:
-        """Representation method.
-
-        Returns:
-            str: Representation string.
-        """
-        return f"Position({self.x}, {self.y})"
-
-    def __eq__(self, other: t.Any) -> bool:
-        """Equality operator.
-
-        Args:
-            other (t.Any): Other object to compare.
-
-        Returns:
-            bool: True if the objects are equal, False otherwise.
-        """
-        if isinstance(other, Position):
-            return self.x == other.x and self.y == other.y
-        if isinstance(other, tuple) and len(other) == 2:
-            return (self.x, self.y) == other
-        return False
-
-    def __hash__(self) -> int:
-        """Hash method.
-
-        Returns:
-            int: Hash value.
-        """
-        return hash((self.x, self.y))
+# Antennas and antinodes positions.
+Position: t.TypeAlias = Vector
 
 
 class Board:
@@ -106,8 +72,7 @@ class Board:
                     dy = position_2.y - position_1.y
 
                     new_position = Position(
-                        pos_x=position_2.x + dx,
-                        pos_y=position_2.y + dy,
+                        position_2.x + dx, position_2.y + dy
                     )
 
                     if new_position not in self.antennas[antenna]:
@@ -146,27 +111,15 @@ class Board:
                     dx = position_2.x - position_1.x
                     dy = position_2.y - position_1.y
 
-                    new_pos_position: Position = Position(
-                        pos_x=position_2.x + dx,
-                        pos_y=position_2.y + dy,
-                    )
+                    new_pos_position: Position = position_2.shifted(dx, dy)
                     while not self.is_out_of_board(new_pos_position):
                         antinodes_positions.add(new_pos_position)
-                        new_pos_position = Position(
-                            pos_x=new_pos_position.x + dx,
-                            pos_y=new_pos_position.y + dy,
-                        )
-
-                    new_neg_position: Position = Position(
-                        pos_x=position_1.x + dx,
-                        pos_y=position_1.y + dy,
-                    )
+                        new_pos_position = new_pos_position.shifted(dx, dy)
+
+                    new_neg_position: Position = position_1.shifted(dx, dy)
                     while not self.is_out_of_board(new_neg_position):
                         antinodes_positions.add(new_neg_position)
-                        new_neg_position = Position(
-                            pos_x=new_neg_position.x - dx,
-                            pos_y=new_neg_position.y - dy,
-                        )
+                        new_neg_position = new_neg_position.shifted(-dx, -dy)
 
         return antinodes_positions
 
@@ -184,63 +137,49 @@ class Board:
         return antinodes_positions
 
     def print_board(self, antinodes: t.Set[Position] = set()) -> None:
-        """Print the board.
+        """Print the board, when the debug output is enabled.
 
         Args:
             antinodes (t.Set[Position], optional):
                 Antinodes positions.
                 Defaults to None.
         """
-        for pos_x in range(self.size_x + 1):
-            for pos_y in range(self.size_y + 1):
-                if any(
-                    Position(pos_x, pos_y) in positions
-                    for positions in self.antennas.values()
-                ):
-                    for name, positions in self.antennas.items():
-                        if Position(pos_x, pos_y) in positions:
-                            print(name, end="")
-                            break
-
-                elif Position(pos_x, pos_y) in antinodes:
-                    print("#", end="")
-
-                else:
-                    print(".", end="")
-
-            print("")
-
-
-def read_antennas_positions(
-    file_name: str,
-    from_file: str,
-) -> Board:
-    """Read antennas positions from a txt file.
+        if not is_verbose():
+            return
+        # Rows are x positions and columns are y positions.
+        grid: Grid = Grid(self.size_y + 1, self.size_x + 1)
+        overlays: t.Dict[int, int] = {
+            grid.index(antinode.y, antinode.x): ord("#")
+            for antinode in antinodes
+            if not self.is_out_of_board(antinode)
+        }
+        # The first antenna registered on a position is the one rendered.
+        for name, positions in reversed(self.antennas.items()):
+            for position in positions:
+                overlays[grid.index(position.y, position.x)] = ord(name)
+        emit(render_grid(grid, overlays))
+
+
+@cached_parser(version=2)
+def parse_antennas_positions(raw_input: RawInput) -> Board:
+    """Parse antennas positions from a raw input.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
         Board: The board with the antennas positions.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-
-    antennas_chars: t.List[str] = list(
+    antennas_chars: bytes = (
         string.ascii_uppercase + string.ascii_lowercase + string.digits
-    )
+    ).encode("ascii")
     board: Board = Board()
-    lines: t.List[str] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        lines = file_descriptor.readlines()
-
-    board.size_x = len(lines) - 1
-    board.size_y = len(lines[0].strip()) - 1
-    for pos_x, line in enumerate(lines):
-        for pos_y, char in enumerate(line):
-            if char in antennas_chars:
-                board.register_antenna(char, pos_x, pos_y)
+    cells, width, height = parse_grid(raw_input)
+
+    board.size_x = height - 1
+    board.size_y = width - 1
+    for index, char in enumerate(cells):
+        if char in antennas_chars:
+            board.register_antenna(chr(char), index // width, index % width)
 
     return board
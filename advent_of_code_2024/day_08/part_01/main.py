@@ -2,19 +2,32 @@
 
 import typing as t
 
+from advent_of_code_2024.common import RawInput, map_input_file
 from advent_of_code_2024.day_08.common import (
     Board,
     Position,
-    read_antennas_positions,
+    parse_antennas_positions,
 )
 
 
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Number of unique antinodes positions within the board.
+    """
+    board: Board = parse_antennas_positions(raw_input)
+    antinodes: t.Set[Position] = board.compute_all_antinodes_positions_v1()
+    return len(antinodes)
+
+
 def main() -> None:
     """Main function."""
-    board: Board = read_antennas_positions("input.txt", __file__)
-    antinodes: t.Set[Position] = board.compute_all_antinodes_positions_v1()
-    board.print_board(antinodes)
-    print(len(antinodes))
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,24 @@
 """Common methods for the Day 09"""
 
-import os
 import typing as t
 
+from advent_of_code_2024.common import ASCII_ZERO, RawInput, to_buffer
+from advent_of_code_2024.common.budget import ProgressTracker, track_progress
+from advent_of_code_2024.common.parse_cache import cached_parser
+
+
+@cached_parser(version=1)
+def parse_disk_map(raw_input: RawInput) -> t.List[int]:
+    """Parse disk map from a raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        t.List[int]: Disk map.
+    """
+    return [char - ASCII_ZERO for char in bytes(to_buffer(raw_input)).strip()]
+
 
 class FileSystem:
     """File system class."""
@@ -10,36 +26,11 @@ class FileSystem:
     disk_map: t.List[int]
     disk_blocks: t.List[int | None]
 
-    def __init__(
-        self,
-        file_name: str,
-        from_file: str,
-    ):
-        self.disk_map = []
+    def __init__(self, disk_map: t.List[int]):
+        self.disk_map = disk_map
         self.disk_blocks = []
-        self.__read_disk_map(file_name, from_file)
         self.__generate_disk_blocks()
 
-    def __read_disk_map(
-        self,
-        file_name: str,
-        from_file: str,
-    ) -> None:
-        """Read disk map from a txt file.
-
-        Args:
-            file_name (str): Input file name.
-            from_file (str): File from where the method is called.
-        """
-        absolute_path_to_file: str = os.path.realpath(
-            os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-        )
-
-        with open(
-            absolute_path_to_file, "r", encoding="utf-8"
-        ) as file_descriptor:
-            self.disk_map = [int(char) for char in file_descriptor.readline()]
-
     def __generate_disk_blocks(self) -> None:
         """Generate disk blocks from disk map."""
         id_number: int = 0
@@ -84,9 +75,17 @@ class FileSystem:
                 return
 
     def compact_disk_blocks_v1(self) -> None:
-        """Compact disk blocks."""
+        """Compact disk blocks.
+
+        Each pass moves one block, at most one per free block: the progress
+        of the passes is reported against the budget of the run.
+        """
+        progress: ProgressTracker = track_progress(
+            "Disk block moves", self.disk_blocks.count(None)
+        )
         compacted_blocks: bool = True
         while compacted_blocks:
+            progress.advance()
             compacted_blocks = False
             for i, block in enumerate(self.disk_blocks):
                 if self.__is_block_free(block) and any(
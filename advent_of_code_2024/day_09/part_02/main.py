@@ -1,13 +1,27 @@
 """Advent of code - Day 09 - Part 02"""
 
-from advent_of_code_2024.day_09.common import FileSystem
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.day_09.common import FileSystem, parse_disk_map
+
+
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Checksum of the compacted disk.
+    """
+    file_system: FileSystem = FileSystem(parse_disk_map(raw_input))
+    file_system.compact_disk_blocks_v2()
+    return file_system.compute_checksum()
 
 
 def main() -> None:
     """Main function."""
-    file_system: FileSystem = FileSystem("input.txt", __file__)
-    file_system.compact_disk_blocks_v2()
-    print(file_system.compute_checksum())
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
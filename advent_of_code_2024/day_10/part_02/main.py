@@ -2,74 +2,99 @@
 
 import typing as t
 
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.backend import use_numpy
+from advent_of_code_2024.common.grid import Grid
 from advent_of_code_2024.day_10.common import (
+    SUMMIT_HEIGHT,
+    TRAILHEAD_HEIGHT,
     find_trailheads,
-    is_valid_position,
-    read_topographic_map,
+    parse_topographic_map,
 )
 
 
 def compute_rating(
-    topographic_map: t.List[t.List[int]],
-    start: t.Tuple[int, int],
-    max_height: int = 9,
+    topographic_map: Grid,
+    start: int,
+    max_height: int = SUMMIT_HEIGHT,
 ) -> int:
     """Compute the rating of a trailhead.
 
     Args:
-        topographic_map (t.List[t.List[int]]): Topographic map.
-        start (t.Tuple[int, int]): Start position.
-        max_height (int, optional): Maximum height. Defaults to 9.
+        topographic_map (Grid): Topographic map.
+        start (int): Start cell index.
+        max_height (int, optional): Maximum height. Defaults to "9".
 
     Returns:
         int: Rating of the trailhead.
     """
-    rows_count: int = len(topographic_map)
-    columns_count: int = len(topographic_map[0])
-    directions: t.List[t.Tuple[int, int]] = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-
-    paths_count: t.List[t.List[int]] = [
-        [0] * columns_count for _ in range(rows_count)
-    ]
-    paths_count[start[0]][start[1]] = 1
-    for current_height in range(max_height + 1):
-        for row in range(rows_count):
-            for column in range(columns_count):
-                if (
-                    topographic_map[row][column] == current_height
-                    and paths_count[row][column] > 0
-                ):
-                    for row_offset, column_offset in directions:
-                        neighbor_row: int = row + row_offset
-                        neighbor_column: int = column + column_offset
-                        if (
-                            is_valid_position(
-                                neighbor_row, neighbor_column, topographic_map
-                            )
-                            and topographic_map[neighbor_row][neighbor_column]
-                            == current_height + 1
-                        ):
-                            paths_count[neighbor_row][
-                                neighbor_column
-                            ] += paths_count[row][column]
+    cells: bytearray = topographic_map.cells
+    paths_count: t.Dict[int, int] = {start: 1}
+    for _ in range(cells[start], max_height):
+        next_paths_count: t.Dict[int, int] = {}
+        for position, count in paths_count.items():
+            next_height: int = cells[position] + 1
+            for offset in topographic_map.neighbour_offsets:
+                neighbor: int = position + offset
+                if cells[neighbor] == next_height:
+                    next_paths_count[neighbor] = (
+                        next_paths_count.get(neighbor, 0) + count
+                    )
+        paths_count = next_paths_count
 
+    return sum(paths_count.values())
+
+
+def compute_total_rating_numpy(topographic_map: Grid) -> int:
+    """Compute the sum of the ratings of all trailheads with NumPy.
+
+    The number of hiking trails from each cell to a summit is computed for
+    the whole map at once, one height at a time from the summits down.
+
+    Args:
+        topographic_map (Grid): Topographic map.
+
+    Returns:
+        int: Sum of the ratings of all trailheads.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    heights = np.frombuffer(bytes(topographic_map.cells), dtype=np.uint8)
+    trails_count = (heights == SUMMIT_HEIGHT).astype(np.int64)
+    for height in range(SUMMIT_HEIGHT - 1, TRAILHEAD_HEIGHT - 1, -1):
+        positions = np.flatnonzero(heights == height)
+        counts = np.zeros(len(positions), dtype=np.int64)
+        for offset in topographic_map.neighbour_offsets:
+            neighbours = positions + offset
+            counts += np.where(
+                heights[neighbours] == height + 1, trails_count[neighbours], 0
+            )
+        trails_count[positions] = counts
+    return int(trails_count[heights == TRAILHEAD_HEIGHT].sum())
+
+
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Sum of the ratings of all trailheads.
+    """
+    topographic_map: Grid = parse_topographic_map(raw_input)
+    if use_numpy():
+        return compute_total_rating_numpy(topographic_map)
     rating: int = 0
-    for row in range(rows_count):
-        for column in range(columns_count):
-            if topographic_map[row][column] == max_height:
-                rating += paths_count[row][column]
+    for trailhead in find_trailheads(topographic_map):
+        rating += compute_rating(topographic_map, trailhead)
     return rating
 
 
 def main() -> None:
     """Main function."""
-    topographic_map: t.List[t.List[int]] = read_topographic_map(
-        "input.txt", __file__
-    )
-    rating = 0
-    for trailhead in find_trailheads(topographic_map):
-        rating += compute_rating(topographic_map, trailhead)
-    print(rating)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,33 +1,23 @@
 """Common methods for the Day 11"""
 
-import os
 import typing as t
 from collections import defaultdict
 
+from advent_of_code_2024.common import RawInput, extract_ints
+from advent_of_code_2024.common.parse_cache import cached_parser
 
-def read_stones_line(
-    file_name: str,
-    from_file: str,
-) -> t.List[int]:
-    """Read stones line from a txt file.
+
+@cached_parser(version=1)
+def parse_stones_line(raw_input: RawInput) -> t.List[int]:
+    """Parse stones line from a raw input.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
         t.List[int]: Stones line.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-
-    stones_line: t.List[int] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        stones_line = [
-            int(stone) for stone in file_descriptor.readline().split(" ")
-        ]
-    return stones_line
+    return extract_ints(raw_input).tolist()
 
 
 def blinks(stones_line: t.List[int], num_blinks: int) -> int:
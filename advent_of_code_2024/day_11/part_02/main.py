@@ -2,14 +2,27 @@
 
 import typing as t
 
-from advent_of_code_2024.day_11.common import blinks, read_stones_line
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.day_11.common import blinks, parse_stones_line
+
+
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Number of stones after 75 blinks.
+    """
+    stones_line: t.List[int] = parse_stones_line(raw_input)
+    return blinks(stones_line, 75)
 
 
 def main() -> None:
     """Main function."""
-    stones_line: t.List[int] = read_stones_line("input.txt", __file__)
-    stones_count: int = blinks(stones_line, 75)
-    print(stones_count)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,29 +1,53 @@
 """Common methods for the Day 12"""
 
-import os
 import typing as t
 
+from advent_of_code_2024.common import RawInput
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.common.parse_cache import cached_parser
+from advent_of_code_2024.common.search import SearchState, breadth_first_search
 
-def read_garden_map(
-    file_name: str,
-    from_file: str,
-) -> t.List[t.List[str]]:
-    """Read garden map from a txt file.
+# Border cells value, never a plant: regions end at the garden edges.
+BORDER: int = ord(".")
+
+
+@cached_parser(version=2)
+def parse_garden_map(raw_input: RawInput) -> Grid:
+    """Parse garden map from a raw input.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
-        t.List[t.List[str]]: Garden map.
+        Grid: Garden map, surrounded by a border.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-
-    garden_map: t.List[t.List[str]] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        garden_map = [
-            list(plants.strip()) for plants in file_descriptor.readlines()
+    return Grid.parse(raw_input, border=BORDER)
+
+
+def find_region(
+    garden_map: Grid, position: int, search: SearchState
+) -> t.List[int]:
+    """Flood fill the plant region of a cell.
+
+    Args:
+        garden_map (Grid): Garden map.
+        position (int): Initial cell index.
+        search (SearchState): Search state of the garden cells, shared by
+            the regions so that each cell is filled once.
+
+    Returns:
+        t.List[int]: Cell indexes of the region.
+    """
+    cells: bytearray = garden_map.cells
+    offsets: t.Tuple[int, int, int, int] = garden_map.neighbour_offsets
+    plant: int = cells[position]
+
+    def same_plant(current_position: int) -> t.List[int]:
+        return [
+            current_position + offset
+            for offset in offsets
+            if cells[current_position + offset] == plant
         ]
-    return garden_map
+
+    breadth_first_search(search, [position], same_plant)
+    return search.order
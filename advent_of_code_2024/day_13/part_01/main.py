@@ -3,10 +3,9 @@
 import typing as t
 from itertools import product
 
-from advent_of_code_2024.day_13.common import (
-    ClawMachine,
-    initialize_claw_machines,
-)
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.render import debug
+from advent_of_code_2024.day_13.common import ClawMachine, parse_claw_machines
 
 
 def compute_minimum_tokens_for_prize(
@@ -22,51 +21,32 @@ def compute_minimum_tokens_for_prize(
     Returns:
         int | None: Minimum tokens required to get the prize or None.
     """
+    # Claw machines are tuples: their values are unpacked once, out of the
+    # loop.
+    (a_x, a_y), (b_x, b_y), (prize_x, prize_y) = claw_machine
     for a_presses, b_presses in product(range(max_presses + 1), repeat=2):
-        current_x = (
-            a_presses * claw_machine.button_a.x_shift
-            + b_presses * claw_machine.button_b.x_shift
-        )
-        current_y = (
-            a_presses * claw_machine.button_a.y_shift
-            + b_presses * claw_machine.button_b.y_shift
-        )
-
         if (
-            current_x == claw_machine.prize.x
-            and current_y == claw_machine.prize.y
+            a_presses * a_x + b_presses * b_x == prize_x
+            and a_presses * a_y + b_presses * b_y == prize_y
         ):
             cost = a_presses * 3 + b_presses * 1
-            print(
-                a_presses,
-                b_presses,
-                claw_machine.button_a.x_shift,
-                claw_machine.button_a.y_shift,
-                claw_machine.button_b.x_shift,
-                claw_machine.button_b.y_shift,
-                claw_machine.prize.x,
-                claw_machine.prize.y,
-            )
+            debug(a_presses, b_presses, a_x, a_y, b_x, b_y, prize_x, prize_y)
             return cost
 
-    print(
-        None,
-        None,
-        claw_machine.button_a.x_shift,
-        claw_machine.button_a.y_shift,
-        claw_machine.button_b.x_shift,
-        claw_machine.button_b.y_shift,
-        claw_machine.prize.x,
-        claw_machine.prize.y,
-    )
+    debug(None, None, a_x, a_y, b_x, b_y, prize_x, prize_y)
     return None
 
 
-def main() -> None:
-    """Main function."""
-    claw_machines: t.List[ClawMachine] = initialize_claw_machines(
-        "input.txt", __file__
-    )
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Fewest tokens needed to win all the possible prizes.
+    """
+    claw_machines: t.List[ClawMachine] = parse_claw_machines(raw_input)
     minimum_tokens_count: int = 0
     for claw_machine in claw_machines:
         minimum_tokens_for_prize = compute_minimum_tokens_for_prize(
@@ -74,7 +54,13 @@ def main() -> None:
         )
         if minimum_tokens_for_prize is not None:
             minimum_tokens_count += minimum_tokens_for_prize
-    print(minimum_tokens_count)
+    return minimum_tokens_count
+
+
+def main() -> None:
+    """Main function."""
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,11 +1,10 @@
 """Advent of code - Day 13 - Part 02"""
 
+import math
 import typing as t
 
-from advent_of_code_2024.day_13.common import (
-    ClawMachine,
-    initialize_claw_machines,
-)
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.day_13.common import ClawMachine, parse_claw_machines
 
 
 def round_press_count(press_count: float, fraction: float = 0.05) -> int:
@@ -24,6 +23,36 @@ def round_press_count(press_count: float, fraction: float = 0.05) -> int:
     return -1
 
 
+def compute_collinear_minimum_tokens(claw_machine: ClawMachine) -> int:
+    """Compute the minimum tokens when both buttons move the claw along the
+    same line.
+
+    The presses of A reaching the prize X are the solutions of
+    ax*A = X (mod bx), spaced by bx/gcd(ax, bx), and the tokens are linear
+    in A: the cheapest are the fewest or the most presses of A.
+
+    Args:
+        claw_machine (ClawMachine): Instance of the ClawMachine.
+
+    Returns:
+        int: Minimum tokens required to get the prize, 0 if it cannot be
+            reached.
+    """
+    (a_x, a_y), (b_x, _), (prize_x, prize_y) = claw_machine
+    gcd: int = math.gcd(a_x, b_x)
+    if a_x * prize_y != a_y * prize_x or prize_x % gcd:
+        return 0
+    step: int = b_x // gcd
+    fewest: int = (prize_x // gcd) * pow(a_x // gcd, -1, step) % step
+    if fewest * a_x > prize_x:
+        return 0
+    most: int = fewest + (prize_x // a_x - fewest) // step * step
+    return min(
+        a_presses * 3 + (prize_x - a_presses * a_x) // b_x
+        for a_presses in (fewest, most)
+    )
+
+
 def compute_minimum_tokens_for_prize(claw_machine: ClawMachine) -> int:
     """Compute the minimum tokens required to get the prize.
 
@@ -53,6 +82,11 @@ def compute_minimum_tokens_for_prize(claw_machine: ClawMachine) -> int:
     Returns:
         int: Minimum tokens required to get the prize.
     """
+    if (
+        claw_machine.button_a.x_shift * claw_machine.button_b.y_shift
+        == claw_machine.button_a.y_shift * claw_machine.button_b.x_shift
+    ):
+        return compute_collinear_minimum_tokens(claw_machine)
     b_presses: int = round_press_count(
         (
             claw_machine.prize.y
@@ -71,23 +105,44 @@ def compute_minimum_tokens_for_prize(claw_machine: ClawMachine) -> int:
         (claw_machine.prize.x - claw_machine.button_b.x_shift * b_presses)
         / claw_machine.button_a.x_shift
     )
-    if a_presses < 0 or b_presses < 0:
+    # The rounded presses must reach the prize exactly.
+    if (
+        a_presses < 0
+        or b_presses < 0
+        or a_presses * claw_machine.button_a.x_shift
+        + b_presses * claw_machine.button_b.x_shift
+        != claw_machine.prize.x
+        or a_presses * claw_machine.button_a.y_shift
+        + b_presses * claw_machine.button_b.y_shift
+        != claw_machine.prize.y
+    ):
         return 0
     return a_presses * 3 + b_presses * 1
 
 
-def main() -> None:
-    """Main function."""
-    claw_machines: t.List[ClawMachine] = initialize_claw_machines(
-        "input.txt",
-        __file__,
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Fewest tokens needed to win all the possible shifted prizes.
+    """
+    claw_machines: t.List[ClawMachine] = parse_claw_machines(
+        raw_input,
         prize_shift=10000000000000,
     )
-    minimum_tokens_count: int = sum(
+    return sum(
         compute_minimum_tokens_for_prize(claw_machine)
         for claw_machine in claw_machines
     )
-    print(minimum_tokens_count)
+
+
+def main() -> None:
+    """Main function."""
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
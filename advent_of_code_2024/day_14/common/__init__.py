@@ -1,45 +1,36 @@
 """Common methods for the Day 14"""
 
-import os
-import re
 import typing as t
 
+from advent_of_code_2024.common import RawInput, extract_ints_per_line
+from advent_of_code_2024.common.backend import fits_int64
+from advent_of_code_2024.common.parse_cache import cached_parser
+from advent_of_code_2024.common.render import emit, is_verbose, render_counts
+from advent_of_code_2024.common.vectors import Vector
 
-class Position:
-    """Position class."""
+# Robots positions, and their shifts per second.
+Position: t.TypeAlias = Vector
+Velocity: t.TypeAlias = Vector
 
-    x: int
-    y: int
 
-    def __init__(self, x: int, y: int) -> None:
-        self.x = x
-        self.y = y
-
-
-class Velocity:
-    """Velocity class."""
-
-    x: int
-    y: int
-
-    def __init__(self, x: int, y: int) -> None:
-        self.x = x
-        self.y = y
+class Robot:
+    """Robot class.
 
+    Robots are moved in place, but their position is an immutable vector:
+    a teleport stores a new one.
+    """
 
-class Robot:
-    """Robot class."""
+    __slots__ = ("position", "velocity")
 
     position: Position
     velocity: Velocity
 
-    def __init__(self, raw_input_line: str) -> None:
-        matches = re.findall(r"[-]?\d+", raw_input_line)
-        if matches is None:
-            raise ValueError("Invalid input line")
-        px, py, vx, vy = map(int, matches)
-        self.position = Position(px, py)
-        self.velocity = Velocity(vx, vy)
+    def __init__(self, position: Position, velocity: Velocity) -> None:
+        self.position = position
+        self.velocity = velocity
+
+    def __repr__(self) -> str:
+        return f"Robot(Position: {self.position}, Velocity: {self.velocity})"
 
     def teleport(
         self, board_width: int, board_height: int, seconds: int
@@ -51,16 +42,10 @@ class Robot:
             board_height (int): Board height.
             seconds (int): Number of seconds to teleport the robot to.
         """
-        self.position.x += self.velocity.x * seconds
-        self.position.y += self.velocity.y * seconds
-        if self.position.x < 0:
-            self.position.x = self.position.x % board_width
-        elif self.position.x >= board_width:
-            self.position.x = self.position.x % board_width
-        if self.position.y < 0:
-            self.position.y = self.position.y % board_height
-        elif self.position.y >= board_height:
-            self.position.y = self.position.y % board_height
+        self.position = Position(
+            (self.position.x + self.velocity.x * seconds) % board_width,
+            (self.position.y + self.velocity.y * seconds) % board_height,
+        )
 
 
 class Board:
@@ -76,29 +61,24 @@ class Board:
         self.robots = robots
 
     def print(self, empty_char: str = ".") -> None:
-        """Print the board with all the robots on it.
+        """Print the board with all the robots on it, when the debug output
+        is enabled.
 
         Args:
             empty_char (str, optional):
                 Character used to represent empty slots.
                 Defaults to ".".
         """
-        board: t.List[t.List[int]] = [
-            [0 for _ in range(self.height)] for _ in range(self.width)
-        ]
-
+        if not is_verbose():
+            return
+        counts: t.List[int] = [0] * (self.width * self.height)
         for robot in self.robots:
-            board[robot.position.x][robot.position.y] += 1
-
-        print()
-        for column in range(self.height):
-            for row in range(self.width):
-                if board[row][column] == 0:
-                    print(empty_char, end="")
-                else:
-                    print(board[row][column], end="")
-            print()
-        print()
+            counts[robot.position.y * self.width + robot.position.x] += 1
+        emit(
+            "\n"
+            + render_counts(counts, self.width, self.height, empty_char)
+            + "\n"
+        )
 
     def teleport_robots(self, seconds: int) -> None:
         """Teleport all robots on the board.
@@ -168,29 +148,81 @@ class Board:
         return board
 
 
-def initialize_board(
-    file_name: str,
-    from_file: str,
+def teleport_robots_numpy(
+    board: Board, seconds: t.Sequence[int]
+) -> t.Tuple[t.Any, t.Any]:
+    """Compute the robots positions after several durations with NumPy.
+
+    The robots of the board are not moved.
+
+    Args:
+        board (Board): Board.
+        seconds (t.Sequence[int]): Durations.
+
+    Returns:
+        t.Tuple[t.Any, t.Any]: Arrays of the x and y coordinates, one row
+            per duration and one column per robot.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    robots: t.List[Robot] = board.robots
+    durations = np.asarray(seconds, dtype=np.int64)[:, np.newaxis]
+    positions_x = np.fromiter(
+        (robot.position.x for robot in robots), np.int64, len(robots)
+    )
+    positions_y = np.fromiter(
+        (robot.position.y for robot in robots), np.int64, len(robots)
+    )
+    velocities_x = np.fromiter(
+        (robot.velocity.x for robot in robots), np.int64, len(robots)
+    )
+    velocities_y = np.fromiter(
+        (robot.velocity.y for robot in robots), np.int64, len(robots)
+    )
+    return (
+        (positions_x + velocities_x * durations) % board.width,
+        (positions_y + velocities_y * durations) % board.height,
+    )
+
+
+def can_teleport_robots_numpy(board: Board, seconds: int) -> bool:
+    """Check whether the NumPy teleports of a board cannot overflow.
+
+    Args:
+        board (Board): Board.
+        seconds (int): Longest duration.
+
+    Returns:
+        bool: True if the positions fit in int64.
+    """
+    largest: int = max(
+        (
+            max(abs(robot.position.x), abs(robot.position.y))
+            + max(abs(robot.velocity.x), abs(robot.velocity.y)) * seconds
+            for robot in board.robots
+        ),
+        default=0,
+    )
+    return fits_int64(largest)
+
+
+@cached_parser(version=2)
+def parse_board(
+    raw_input: RawInput,
     board_width: int,
     board_height: int,
 ) -> Board:
-    """Initialize board using configuration from a txt file.
+    """Parse board configuration from a raw input.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
         board_width (int): Board width.
         board_height (int): Board height.
 
     Returns:
         Board: An instantiated board.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-
     board: Board = Board(board_width, board_height, [])
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        for line in file_descriptor.readlines():
-            board.robots.append(Robot(line))
+    for px, py, vx, vy in extract_ints_per_line(raw_input):
+        board.robots.append(Robot(Position(px, py), Velocity(vx, vy)))
     return board
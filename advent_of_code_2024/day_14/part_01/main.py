@@ -1,21 +1,68 @@
 """Advent of code - Day 14 - Part 01"""
 
-from advent_of_code_2024.day_14.common import Board, initialize_board
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.backend import use_numpy
+from advent_of_code_2024.day_14.common import (
+    Board,
+    can_teleport_robots_numpy,
+    parse_board,
+    teleport_robots_numpy,
+)
+
+SECONDS: int = 100
+
+
+def compute_safety_factor_numpy(board: Board, seconds: int) -> int:
+    """Compute the safety factor after some time with NumPy.
+
+    Args:
+        board (Board): Board, its robots are not moved.
+        seconds (int): Number of seconds.
+
+    Returns:
+        int: Product of the number of robots in each quadrant.
+    """
+    positions_x, positions_y = teleport_robots_numpy(board, [seconds])
+    quadrant_width: int = board.width // 2
+    quadrant_height: int = board.height // 2
+    left = positions_x[0] < quadrant_width
+    right = positions_x[0] > quadrant_width
+    top = positions_y[0] < quadrant_height
+    bottom = positions_y[0] > quadrant_height
+    return (
+        int((left & top).sum())
+        * int((right & top).sum())
+        * int((left & bottom).sum())
+        * int((right & bottom).sum())
+    )
+
+
+def solve(
+    raw_input: RawInput,
+    board_width: int = 101,
+    board_height: int = 103,
+) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+        board_width (int, optional): Board width. Defaults to 101.
+        board_height (int, optional): Board height. Defaults to 103.
+
+    Returns:
+        int: Safety factor after 100 seconds.
+    """
+    board: Board = parse_board(raw_input, board_width, board_height)
+    if use_numpy() and can_teleport_robots_numpy(board, SECONDS):
+        return compute_safety_factor_numpy(board, SECONDS)
+    board.teleport_robots(SECONDS)
+    return board.count_robots_in_quadrants()
 
 
 def main() -> None:
     """Main function."""
-    board: Board = initialize_board(
-        file_name="input.txt",
-        from_file=__file__,
-        board_width=101,
-        board_height=103,
-    )
-    board.print()
-    board.teleport_robots(100)
-    board.print()
-    robots_in_quadrants = board.count_robots_in_quadrants()
-    print(robots_in_quadrants)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,23 +1,124 @@
 """Advent of code - Day 14 - Part 02"""
 
-from matplotlib import pyplot as plt
+import typing as t
 
-from advent_of_code_2024.day_14.common import Board, initialize_board
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.backend import use_numpy
+from advent_of_code_2024.day_14.common import (
+    Board,
+    can_teleport_robots_numpy,
+    parse_board,
+    teleport_robots_numpy,
+)
 
+# Number of seconds simulated at once by the NumPy implementation.
+SECONDS_PER_CHUNK: int = 256
 
-def main() -> None:
-    """Main function."""
-    board: Board = initialize_board(
-        file_name="input.txt",
-        from_file=__file__,
-        board_width=101,
-        board_height=103,
-    )
-    for second in range(10_000):
+
+def are_robots_on_distinct_positions(board: Board, seconds: int) -> bool:
+    """Check if every robot stands on its own position after some seconds.
+
+    The robots of the board are not moved.
+
+    Args:
+        board (Board): Board.
+        seconds (int): Number of seconds.
+
+    Returns:
+        bool: True if no position holds more than one robot.
+    """
+    positions: t.Set[t.Tuple[int, int]] = {
+        (
+            (position_x + velocity_x * seconds) % board.width,
+            (position_y + velocity_y * seconds) % board.height,
+        )
+        for (position_x, position_y), (velocity_x, velocity_y) in (
+            (robot.position, robot.velocity) for robot in board.robots
+        )
+    }
+    return len(positions) == len(board.robots)
+
+
+def find_distinct_positions_numpy(board: Board, max_seconds: int) -> int:
+    """Find the first second all the robots stand on distinct positions,
+    with NumPy.
+
+    Args:
+        board (Board): Board, its robots are not moved.
+        max_seconds (int): Maximum number of seconds to simulate.
+
+    Returns:
+        int: Fewest number of seconds, -1 if not found.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    for first_second in range(0, max_seconds, SECONDS_PER_CHUNK):
+        positions_x, positions_y = teleport_robots_numpy(
+            board,
+            range(
+                first_second, min(first_second + SECONDS_PER_CHUNK, max_seconds)
+            ),
+        )
+        keys = np.sort(positions_x * board.height + positions_y, axis=1)
+        distinct = ~np.any(keys[:, 1:] == keys[:, :-1], axis=1)
+        if distinct.any():
+            return first_second + int(np.argmax(distinct))
+    return -1
+
+
+def dump_frames(board: Board, seconds: int, directory: str) -> None:
+    """Dump one image of the board per second to visually find the tree.
+
+    Args:
+        board (Board): Board.
+        seconds (int): Number of seconds to dump.
+        directory (str): Directory where the images are written.
+    """
+    # Matplotlib is only needed to look at the frames, and slow to import.
+    # pylint: disable-next=import-outside-toplevel
+    from matplotlib import pyplot as plt
+
+    for second in range(seconds):
         plt.imshow(board.to_2d_array(), interpolation="nearest", cmap="gray")
-        plt.savefig(f"/tmp/dumps/{second}.png")
+        plt.savefig(f"{directory}/{second}.png")
         board.teleport_robots(1)
 
 
+def solve(
+    raw_input: RawInput,
+    board_width: int = 101,
+    board_height: int = 103,
+    max_seconds: int = 10_000,
+) -> int:
+    """Solve the puzzle from its raw input.
+
+    The easter egg is drawn when all the robots
+    stand on distinct positions for the first time.
+
+    Args:
+        raw_input (RawInput): Raw input.
+        board_width (int, optional): Board width. Defaults to 101.
+        board_height (int, optional): Board height. Defaults to 103.
+        max_seconds (int, optional):
+            Maximum number of seconds to simulate. Defaults to 10_000.
+
+    Returns:
+        int: Fewest number of seconds before the easter egg, -1 if not found.
+    """
+    board: Board = parse_board(raw_input, board_width, board_height)
+    if use_numpy() and can_teleport_robots_numpy(board, max_seconds):
+        return find_distinct_positions_numpy(board, max_seconds)
+    for second in range(max_seconds):
+        if are_robots_on_distinct_positions(board, second):
+            return second
+    return -1
+
+
+def main() -> None:
+    """Main function."""
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
+
+
 if __name__ == "__main__":
     main()
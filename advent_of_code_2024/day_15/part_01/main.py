@@ -1,9 +1,18 @@
 """Advent of code - Day 15 - Part 01"""
 
-import os
 import typing as t
 from enum import Enum
 
+from advent_of_code_2024.common import (
+    RawInput,
+    iter_lines,
+    map_input_file,
+    split_sections,
+)
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.common.parse_cache import cached_parser
+from advent_of_code_2024.common.render import emit, is_verbose, render_grid
+
 
 class DirectionEnum(Enum):
     """Direction enum class."""
@@ -14,6 +23,20 @@ class DirectionEnum(Enum):
     RIGHT = ">"
 
 
+WALL: int = ord("#")
+BOX: int = ord("O")
+EMPTY: int = ord(".")
+ROBOT: int = ord("@")
+
+# Position steps of each direction.
+DIRECTION_STEPS: t.Dict[DirectionEnum, t.Tuple[int, int]] = {
+    DirectionEnum.UP: (0, -1),
+    DirectionEnum.DOWN: (0, 1),
+    DirectionEnum.LEFT: (-1, 0),
+    DirectionEnum.RIGHT: (1, 0),
+}
+
+
 def compute_gps_coordinate(position: t.Tuple[int, int]) -> int:
     position_x, position_y = position
     return position_y * 100 + position_x
@@ -23,161 +46,110 @@ def sum_gps_coordinates(positions: t.List[t.Tuple[int, int]]) -> int:
     return sum([compute_gps_coordinate(position) for position in positions])
 
 
-def get_new_position(
-    position: t.Tuple[int, int],
-    direction: DirectionEnum,
-) -> t.Tuple[int, int]:
-    x, y = position
-    match direction:
-        case DirectionEnum.UP:
-            return (x, y - 1)
-        case DirectionEnum.DOWN:
-            return (x, y + 1)
-        case DirectionEnum.LEFT:
-            return (x - 1, y)
-        case DirectionEnum.RIGHT:
-            return (x + 1, y)
-    return position
-
-
-def print_warehouse(
-    warehouse_size: t.Tuple[int, int],
-    walls: t.List[t.Tuple[int, int]],
-    robot: t.Tuple[int, int],
-    boxes: t.List[t.Tuple[int, int]],
-) -> None:
-    print()
-    for y in range(warehouse_size[1]):
-        for x in range(warehouse_size[0]):
-            match (x, y):
-                case (x, y) if (x, y) in walls:
-                    print("#", end="")
-                case (x, y) if (x, y) == robot:
-                    print("@", end="")
-                case (x, y) if (x, y) in boxes:
-                    print("O", end="")
-                case _:
-                    print(".", end="")
-        print()
-    print()
+def get_offset(warehouse: Grid, direction: DirectionEnum) -> int:
+    """Get the index offset of a move in a direction.
+
+    Args:
+        warehouse (Grid): Warehouse.
+        direction (DirectionEnum): Direction to move to.
+
+    Returns:
+        int: Index offset.
+    """
+    step_x, step_y = DIRECTION_STEPS[direction]
+    return step_y * warehouse.stride + step_x
+
+
+def print_warehouse(warehouse: Grid, robot: int) -> None:
+    """Print warehouse, when the debug output is enabled.
+
+    Args:
+        warehouse (Grid): Warehouse, without the robot.
+        robot (int): Robot cell index.
+    """
+    if is_verbose():
+        emit("\n" + render_grid(warehouse, {robot: ROBOT}) + "\n")
 
 
 def move(
-    warehouse_size: t.Tuple[int, int],
-    robot: t.Tuple[int, int],
-    boxes: t.List[t.Tuple[int, int]],
-    walls: t.List[t.Tuple[int, int]],
+    warehouse: Grid,
+    robot: int,
     directions: t.List[DirectionEnum],
-) -> t.Tuple[t.Tuple[int, int], t.List[t.Tuple[int, int]]]:
+) -> int:
     for direction in directions:
-        new_robot = get_new_position(robot, direction)
+        offset: int = get_offset(warehouse, direction)
+        new_robot: int = robot + offset
 
-        if new_robot in walls:
-            continue  # Wall encountered, do nothing
-
-        # Check for all boxes in a line
-        current_position = new_robot
-        moving_boxes = []
+        # Skip the line of boxes in front of the robot, if any
+        current_position: int = new_robot
+        while warehouse[current_position] == BOX:
+            current_position += offset
 
-        while current_position in boxes:
-            moving_boxes.append(current_position)
-            next_position = get_new_position(current_position, direction)
-            if next_position in walls:
-                moving_boxes = []
-                new_robot = robot
-                break
-            current_position = next_position
+        if warehouse[current_position] == WALL:
+            continue  # Wall encountered, do nothing
 
-        # Move all boxes if no wall or other boxes was encountered
-        for moving_box in moving_boxes:
-            boxes.remove(moving_box)
-            boxes.append(get_new_position(moving_box, direction))
+        # Moving a line of boxes moves its first box after its last one
+        if current_position != new_robot:
+            warehouse[current_position] = BOX
+            warehouse[new_robot] = EMPTY
 
         robot = new_robot
-    print_warehouse(warehouse_size, walls, robot, boxes)
-    return robot, boxes
+    print_warehouse(warehouse, robot)
+    return robot
 
 
-def parse_file(file_name: str, from_file: str) -> t.Tuple[
-    t.Tuple[int, int],
-    t.Tuple[int, int],
-    t.List[t.Tuple[int, int]],
-    t.List[t.Tuple[int, int]],
-    t.List[DirectionEnum],
-]:
-    """Initialize robot using configuration from a txt file.
+@cached_parser(version=2)
+def parse_warehouse(
+    raw_input: RawInput,
+) -> t.Tuple[Grid, int, t.List[DirectionEnum]]:
+    """Initialize robot using configuration from a raw input.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
-        t.Tuple[
-            int,
-            t.Tuple[int, int],
-            t.List[t.Tuple[int, int]],
-            t.List[t.Tuple[int, int]],
-            t.List[DirectionEnum],
-        ]: An instantiated robot.
+        t.Tuple[Grid, int, t.List[DirectionEnum]]:
+            Warehouse without the robot, robot cell index and moves.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
+    sections: t.List[bytes] = split_sections(raw_input)
+    if len(sections) != 2:
+        raise ValueError("Expected a warehouse map and a list of moves.")
 
-    lines: list[str] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        lines = [line.strip() for line in file_descriptor.readlines()]
-
-    map_lines = [
-        line
-        for line in lines
-        if ">" not in line
-        and "<" not in line
-        and "v" not in line
-        and "^" not in line
-        and len(line)
-    ]
+    warehouse: Grid = Grid.parse(sections[0], border=WALL)
 
     directions: t.List[DirectionEnum] = [
         DirectionEnum(direction)
-        for direction in "".join(
-            [
-                line
-                for line in lines
-                if ">" in line or "<" in line or "v" in line or "^" in line
-            ]
-        )
+        for direction in b"".join(iter_lines(sections[1])).decode("ascii")
     ]
 
-    warehouse_size: t.Tuple[int, int] = (len(map_lines[0]), len(map_lines))
-    robot: t.Tuple[int, int] | None = None
-    boxes: t.List[t.Tuple[int, int]] = []
-    walls: t.List[t.Tuple[int, int]] = []
-
-    for y, line in enumerate(map_lines):
-        for x, char in enumerate(line):
-            match char:
-                case "#":
-                    walls.append((x, y))
-                case "@":
-                    robot = (x, y)
-                case "O":
-                    boxes.append((x, y))
-
-    if robot is None:
+    robot: int = warehouse.find(ROBOT)
+    if robot == -1:
         raise ValueError("Robot not found in the warehouse.")
+    warehouse[robot] = EMPTY
+
+    return warehouse, robot, directions
+
 
-    return warehouse_size, robot, boxes, walls, directions
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Sum of the boxes GPS coordinates after all the moves.
+    """
+    warehouse, robot, directions = parse_warehouse(raw_input)
+    move(warehouse, robot, directions)
+    return sum_gps_coordinates(
+        [warehouse.position(box) for box in warehouse.find_all(BOX)]
+    )
 
 
 def main() -> None:
     """Main function."""
-    warehouse_size, robot, boxes, walls, directions = parse_file(
-        file_name="input.txt", from_file=__file__
-    )
-    robot, boxes = move(warehouse_size, robot, boxes, walls, directions)
-    final_gps_count = sum_gps_coordinates(boxes)
-    print(final_gps_count)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,9 +1,18 @@
 """Advent of code - Day 15 - Part 02"""
 
-import os
 import typing as t
 from enum import Enum
 
+from advent_of_code_2024.common import (
+    RawInput,
+    iter_lines,
+    map_input_file,
+    split_sections,
+)
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.common.parse_cache import cached_parser
+from advent_of_code_2024.common.render import emit, is_verbose, render_grid
+
 
 class DirectionEnum(Enum):
     """Direction enum class."""
@@ -14,6 +23,21 @@ class DirectionEnum(Enum):
     RIGHT = ">"
 
 
+WALL: int = ord("#")
+BOX_LEFT: int = ord("[")
+BOX_RIGHT: int = ord("]")
+EMPTY: int = ord(".")
+ROBOT: int = ord("@")
+
+# Position steps of each direction.
+DIRECTION_STEPS: t.Dict[DirectionEnum, t.Tuple[int, int]] = {
+    DirectionEnum.UP: (0, -1),
+    DirectionEnum.DOWN: (0, 1),
+    DirectionEnum.LEFT: (-1, 0),
+    DirectionEnum.RIGHT: (1, 0),
+}
+
+
 def compute_gps_coordinate(position: t.Tuple[int, int]) -> int:
     """Compute GPS coordinate.
 
@@ -40,293 +64,165 @@ def sum_gps_coordinates(positions: t.List[t.Tuple[int, int]]) -> int:
     return sum([compute_gps_coordinate(position) for position in positions])
 
 
-def get_new_position(
-    position: t.Tuple[int, int], direction: DirectionEnum
-) -> t.Tuple[int, int]:
-    """Get new position based on current position and direction.
-
+def get_offset(warehouse: Grid, direction: DirectionEnum) -> int:
+    """Get the index offset of a move in a direction.
 
     Args:
-        position (t.Tuple[int, int]): Initial position.
+        warehouse (Grid): Warehouse.
         direction (DirectionEnum): Direction to move to.
 
     Returns:
-        t.Tuple[int, int]: New position.
+        int: Index offset.
     """
-    x, y = position
-    match direction:
-        case DirectionEnum.UP:
-            return (x, y - 1)
-        case DirectionEnum.DOWN:
-            return (x, y + 1)
-        case DirectionEnum.LEFT:
-            return (x - 1, y)
-        case DirectionEnum.RIGHT:
-            return (x + 1, y)
-    return position
-
-
-def print_warehouse(
-    warehouse_size: t.Tuple[int, int],
-    walls: t.List[t.Tuple[int, int]],
-    robot: t.Tuple[int, int],
-    boxes: t.Dict[t.Tuple[int, int], t.Tuple[int, int]],
-) -> None:
-    """Print warehouse.
+    step_x, step_y = DIRECTION_STEPS[direction]
+    return step_y * warehouse.stride + step_x
+
+
+def print_warehouse(warehouse: Grid, robot: int) -> None:
+    """Print warehouse, when the debug output is enabled.
 
     Args:
-        warehouse_size (t.Tuple[int, int]):
-            Warehouse size (width, height).
-        walls (t.List[t.Tuple[int, int]]):
-            List of walls.
-        robot (t.Tuple[int, int]):
-            Robot position.
-        boxes (t.Dict[t.Tuple[int, int], t.Tuple[int, int]]):
-            Dictionary of boxes.
+        warehouse (Grid): Warehouse, without the robot.
+        robot (int): Robot cell index.
     """
-    left_boxes: t.List[t.Tuple[int, int]] = list(boxes.keys())
-    right_boxes: t.List[t.Tuple[int, int]] = list(boxes.values())
-    for y in range(warehouse_size[1]):
-        for x in range(warehouse_size[0]):
-            pos = (x, y)
-            match pos:
-                case pos if pos in walls:
-                    print("#", end="")
-                case pos if pos == robot:
-                    print("@", end="")
-                case pos if pos in left_boxes:
-                    print("[", end="")
-                case pos if pos in right_boxes:
-                    print("]", end="")
-                case _:
-                    print(".", end="")
-        print()
-    print()
-
-
-def rec_compute_moving_boxes(
-    current_position: t.Tuple[int, int],
-    direction: DirectionEnum,
-    left_boxes_dict: t.Dict[t.Tuple[int, int], t.Tuple[int, int]],
-    right_boxes_dict: t.Dict[t.Tuple[int, int], t.Tuple[int, int]],
-    walls: t.List[t.Tuple[int, int]],
-    visited: t.List[t.Tuple[int, int]],
-) -> t.List[t.Tuple[int, int]]:
-    """Recursively compute moving boxes.
+    if is_verbose():
+        emit(render_grid(warehouse, {robot: ROBOT}) + "\n")
+
+
+def compute_moving_boxes(
+    warehouse: Grid, position: int, offset: int
+) -> t.Set[int] | None:
+    """Compute the boxes pushed by a move into a position.
 
     Args:
-        current_position (t.Tuple[int, int]):
-            Current position.
-        direction (DirectionEnum):
-            Direction to move to.
-        left_boxes_dict (t.Dict[t.Tuple[int, int], t.Tuple[int, int]]):
-            Dictionary of left boxes.
-        right_boxes_dict (t.Dict[t.Tuple[int, int], t.Tuple[int, int]]):
-            Dictionary of right boxes.
-        walls (t.List[t.Tuple[int, int]]):
-            List of walls.
-        visited (t.List[t.Tuple[int, int]]):
-            List of visited positions.
+        warehouse (Grid): Warehouse.
+        position (int): Cell index the robot moves into.
+        offset (int): Index offset of the move.
 
     Returns:
-        t.List[t.Tuple[int, int]]: List of boxes that needs to move.
+        t.Set[int] | None: Left cell index of the boxes that need to move,
+            None if one of them would encounter a wall.
     """
-    if current_position in visited:
-        return []
-
-    if current_position in walls:
-        raise ValueError("Wall encountered")
-
-    visited.append(current_position)
-
-    position_1 = None
-    position_2 = None
-    if current_position in left_boxes_dict.keys():
-        position_1 = current_position
-        position_2 = left_boxes_dict.get(current_position)
-    elif current_position in right_boxes_dict.keys():
-        position_1 = right_boxes_dict.get(current_position)
-        position_2 = current_position
-
-    if position_1 is not None and position_2 is not None:
-        new_position_1 = get_new_position(position_1, direction)
-        new_position_2 = get_new_position(position_2, direction)
-        return (
-            rec_compute_moving_boxes(
-                new_position_1,
-                direction,
-                left_boxes_dict,
-                right_boxes_dict,
-                walls,
-                visited,
-            )
-            + rec_compute_moving_boxes(
-                new_position_2,
-                direction,
-                left_boxes_dict,
-                right_boxes_dict,
-                walls,
-                visited,
-            )
-            + [position_1]
-        )
-
-    return []
+    moving_boxes: t.Set[int] = set()
+    positions: t.List[int] = [position]
+    while positions:
+        current_position: int = positions.pop()
+        cell: int = warehouse[current_position]
+        if cell == WALL:
+            return None
+        if cell == BOX_LEFT:
+            box: int = current_position
+        elif cell == BOX_RIGHT:
+            box = current_position - 1
+        else:
+            continue
+        if box in moving_boxes:
+            continue
+        moving_boxes.add(box)
+        # Cells in front of the box, the box itself excluded
+        for box_position in (box + offset, box + 1 + offset):
+            if box_position not in (box, box + 1):
+                positions.append(box_position)
+    return moving_boxes
 
 
 def move(
-    warehouse_size: t.Tuple[int, int],
-    robot: t.Tuple[int, int],
-    boxes: t.Dict[tuple[int, int], tuple[int, int]],
-    walls: t.List[t.Tuple[int, int]],
+    warehouse: Grid,
+    robot: int,
     directions: t.List[DirectionEnum],
-) -> t.Tuple[t.Tuple[int, int], t.Dict[t.Tuple[int, int], t.Tuple[int, int]]]:
+) -> int:
     """Move robot and boxes.
 
     Args:
-        warehouse_size (t.Tuple[int, int]):
-            Warehouse size (width, height).
-        robot (t.Tuple[int, int]):
-            Robot position.
-        boxes (t.Dict[tuple[int, int], tuple[int, int]]):
-            List of boxes.
-        walls (t.List[t.Tuple[int, int]]):
-            List of walls.
-        directions (t.List[DirectionEnum]):
-            List of directions.
+        warehouse (Grid): Warehouse, without the robot, updated in place.
+        robot (int): Robot cell index.
+        directions (t.List[DirectionEnum]): List of directions.
 
     Returns:
-        t.Tuple[
-            t.Tuple[int, int],
-            t.Dict[t.Tuple[int, int], t.Tuple[int, int]]
-        ]:
-            New robot position and new boxes positions.
+        int: New robot cell index.
     """
     for direction in directions:
-        new_robot = get_new_position(robot, direction)
-
-        if new_robot in walls:
-            # Robot would encounter a wall, stop here.
-            continue
+        offset: int = get_offset(warehouse, direction)
+        new_robot: int = robot + offset
 
-        current_position = new_robot
-        moving_boxes: t.Set[t.Tuple[int, int]] = set()
-
-        left_boxes_dict: t.Dict[tuple[int, int], tuple[int, int]] = boxes
-        right_boxes_dict = {
-            right: left for left, right in left_boxes_dict.items()
-        }
-        try:
-            moving_boxes = set(
-                rec_compute_moving_boxes(
-                    current_position,
-                    direction,
-                    boxes,
-                    right_boxes_dict,
-                    walls,
-                    [],
-                )
-            )
-        except ValueError:
-            # Boxes would encounter at least a wall, stop here.
+        moving_boxes: t.Set[int] | None = compute_moving_boxes(
+            warehouse, new_robot, offset
+        )
+        if moving_boxes is None:
+            # Robot or boxes would encounter at least a wall, stop here.
             continue
 
-        for moving_box in sorted(
-            moving_boxes,
-            key=lambda x: (
-                x[1]
-                if direction in [DirectionEnum.UP, DirectionEnum.DOWN]
-                else x[0]
-            ),
-            reverse=direction in [DirectionEnum.DOWN, DirectionEnum.RIGHT],
-        ):
-            del boxes[moving_box]
-            new_position = get_new_position(moving_box, direction)
-            boxes[new_position] = new_position[0] + 1, new_position[1]
+        for moving_box in moving_boxes:
+            warehouse[moving_box] = EMPTY
+            warehouse[moving_box + 1] = EMPTY
+        for moving_box in moving_boxes:
+            warehouse[moving_box + offset] = BOX_LEFT
+            warehouse[moving_box + 1 + offset] = BOX_RIGHT
 
         robot = new_robot
-    return robot, boxes
+    return robot
+
 
+@cached_parser(version=2)
+def parse_warehouse(
+    raw_input: RawInput,
+) -> t.Tuple[Grid, int, t.List[DirectionEnum]]:
+    """Initialize robot using configuration from a raw input.
 
-def parse_file(file_name: str, from_file: str) -> t.Tuple[
-    t.Tuple[int, int],
-    t.Tuple[int, int],
-    t.Dict[t.Tuple[int, int], t.Tuple[int, int]],
-    t.List[t.Tuple[int, int]],
-    t.List[DirectionEnum],
-]:
-    """Initialize robot using configuration from a txt file.
+    The warehouse is twice as wide as its map.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
-        t.Tuple[
-        t.Tuple[int, int],
-        t.Tuple[int, int],
-        t.List[t.Tuple[int, int]],
-        t.List[DirectionEnum]
-    ]: Lot of things
+        t.Tuple[Grid, int, t.List[DirectionEnum]]:
+            Warehouse without the robot, robot cell index and moves.
     """
-    absolute_path_to_file = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
+    sections: t.List[bytes] = split_sections(raw_input)
+    if len(sections) != 2:
+        raise ValueError("Expected a warehouse map and a list of moves")
+
+    wide_map: bytes = (
+        sections[0]
+        .replace(b"#", b"##")
+        .replace(b"O", b"[]")
+        .replace(b".", b"..")
+        .replace(b"@", b"@.")
     )
-
-    lines = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        lines = [line.strip() for line in file_descriptor.readlines()]
-
-    map_lines = [
-        line.replace("#", "##")
-        .replace("O", "[]")
-        .replace(".", "..")
-        .replace("@", "@.")
-        for line in lines
-        if not any(dir_char in line for dir_char in ["^", "v", "<", ">"])
-        and len(line)
-    ]
+    warehouse: Grid = Grid.parse(wide_map, border=WALL)
 
     directions = [
         DirectionEnum(direction)
-        for direction in "".join(
-            [
-                line
-                for line in lines
-                if any(dir_char in line for dir_char in ["^", "v", "<", ">"])
-            ]
-        )
+        for direction in b"".join(iter_lines(sections[1])).decode("ascii")
     ]
 
-    warehouse_size = (len(map_lines[0]), len(map_lines))
-    robot = None
-    boxes = {}
-    walls = []
-
-    for y, line in enumerate(map_lines):
-        for x, char in enumerate(line):
-            match char:
-                case "#":
-                    walls.append((x, y))
-                case "@":
-                    robot = (x, y)
-                case "[":
-                    boxes[(x, y)] = (x + 1, y)
-
-    if robot is None:
+    robot: int = warehouse.find(ROBOT)
+    if robot == -1:
         raise ValueError("Robot not found in the warehouse")
-    return warehouse_size, robot, boxes, walls, directions
+    warehouse[robot] = EMPTY
+    return warehouse, robot, directions
+
+
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Sum of the wide boxes GPS coordinates after all the moves.
+    """
+    warehouse, robot, directions = parse_warehouse(raw_input)
+    move(warehouse, robot, directions)
+    return sum_gps_coordinates(
+        [warehouse.position(box) for box in warehouse.find_all(BOX_LEFT)]
+    )
 
 
 def main() -> None:
     """Main function."""
-    warehouse_size, robot, boxes, walls, directions = parse_file(
-        file_name="input.txt",
-        from_file=__file__,
-    )
-    robot, boxes = move(warehouse_size, robot, boxes, walls, directions)
-    final_gps_count = sum_gps_coordinates([left for left in boxes.keys()])
-    print(final_gps_count)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,94 +1,124 @@
 """Common methods for the Day 16"""
 
-import os
 import typing as t
 
-# Directions: North (0), East (1), South (2), West (3)
-DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+from advent_of_code_2024.common import RawInput
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.common.parse_cache import cached_parser
 
+# Directions, in the order of the grid neighbour offsets: North (0),
+# East (1), South (2), West (3).
+DIRECTIONS: int = 4
+EAST: int = 1
+WALL: int = ord("#")
+MOVE_COST: int = 1
+TURN_COST: int = 1000
 
-class Node:
-    """Node class."""
 
-    x: int
-    y: int
-    direction: int
-    cost: int
-    heuristic: float
-    total_cost: float
-    parent: t.Optional["Node"]
+def make_moves(
+    maze: Grid,
+) -> t.Callable[[int], t.List[t.Tuple[int, int]]]:
+    """Build the moves of the reindeer between the maze states.
 
-    def __init__(
-        self, x: int, y: int, direction: int, cost: int, heuristic: float
-    ):
-        self.x = x
-        self.y = y
-        self.direction = direction
-        self.cost = cost
-        self.heuristic = heuristic
-        self.total_cost = cost + heuristic
-        self.parent = None
+    A state is a cell index times the number of directions plus the
+    direction: the reindeer moves one cell forward, or turns and moves one
+    cell in the new direction.
 
-    def __lt__(self, other: "Node") -> bool:
-        return self.total_cost < other.total_cost
+    Args:
+        maze (Grid): Maze, surrounded by walls.
+
+    Returns:
+        t.Callable[[int], t.List[t.Tuple[int, int]]]: States reachable from
+            a state, with the move cost.
+    """
+    cells: bytearray = maze.cells
+    offsets: t.Tuple[int, int, int, int] = maze.neighbour_offsets
+
+    def moves(state: int) -> t.List[t.Tuple[int, int]]:
+        position, direction = divmod(state, DIRECTIONS)
+        next_states: t.List[t.Tuple[int, int]] = []
+        for turn in range(DIRECTIONS):
+            new_direction: int = (direction + turn) % DIRECTIONS
+            new_position: int = position + offsets[new_direction]
+            if cells[new_position] != WALL:
+                next_states.append(
+                    (
+                        new_position * DIRECTIONS + new_direction,
+                        MOVE_COST + TURN_COST * (turn % 2),
+                    )
+                )
+        return next_states
+
+    return moves
+
+
+def make_reverse_moves(
+    maze: Grid,
+) -> t.Callable[[int], t.List[t.Tuple[int, int]]]:
+    """Build the moves of the reindeer backwards, from a state to the states
+    it can be reached from.
+
+    Args:
+        maze (Grid): Maze, surrounded by walls.
+
+    Returns:
+        t.Callable[[int], t.List[t.Tuple[int, int]]]: States a state is
+            reachable from, with the move cost.
+    """
+    cells: bytearray = maze.cells
+    offsets: t.Tuple[int, int, int, int] = maze.neighbour_offsets
+
+    def reverse_moves(state: int) -> t.List[t.Tuple[int, int]]:
+        position, direction = divmod(state, DIRECTIONS)
+        previous_position: int = position - offsets[direction]
+        if cells[previous_position] == WALL:
+            return []
+        return [
+            (
+                previous_position * DIRECTIONS + previous_direction,
+                MOVE_COST + TURN_COST * ((direction - previous_direction) % 2),
+            )
+            for previous_direction in range(DIRECTIONS)
+        ]
+
+    return reverse_moves
 
 
 def compute_heuristic(
-    start: t.Tuple[int, int], end: t.Tuple[int, int], divider: int = 1
+    maze: Grid, start: int, end: int, divider: int = 1
 ) -> float:
     """Compute heuristic using Manhattan distance
     with a divider to encourage exploring more paths.
 
     Args:
-        start (t.Tuple[int, int]): Start position.
-        end (t.Tuple[int, int]): End position.
+        maze (Grid): Maze.
+        start (int): Start cell index.
+        end (int): End cell index.
         divider (int, optional): Divider. Defaults to 1.
 
     Returns:
         float: Heuristic value.
     """
-    return (abs(start[0] - end[0]) + abs(start[1] - end[1])) / divider
+    start_x, start_y = maze.position(start)
+    end_x, end_y = maze.position(end)
+    return (abs(start_x - end_x) + abs(start_y - end_y)) / divider
 
 
-def parse_maze(
-    file_name: str,
-    from_file: str,
-) -> t.Tuple[t.List[t.List[int]], t.Tuple[int, int], t.Tuple[int, int]]:
-    """Initialize maze using configuration from a txt file.
+@cached_parser(version=2)
+def parse_maze(raw_input: RawInput) -> t.Tuple[Grid, int, int]:
+    """Initialize maze using configuration from a raw input.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
-        t.List[t.List[int]]: The parsed maze.
+        t.Tuple[Grid, int, int]: The parsed maze, surrounded by walls, and
+            the start and end cell indexes.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-    raw_maze: t.List[t.List[str]] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        raw_maze = [
-            list(row) for row in file_descriptor.read().strip().split("\n")
-        ]
-
-    maze: t.List[t.List[int]] = [
-        [0 for _ in range(len(raw_maze[0]))] for _ in range(len(raw_maze))
-    ]
-    start: t.Tuple[int, int] | None = None
-    end: t.Tuple[int, int] | None = None
-    for y, row in enumerate(raw_maze):
-        for x, cell in enumerate(row):
-            if cell == "S":
-                start = (x, y)
-                maze[y][x] = 0
-            elif cell == "E":
-                end = (x, y)
-                maze[y][x] = 0
-            elif cell == "#":
-                maze[y][x] = 1
-
-    if start is None or end is None:
+    maze: Grid = Grid.parse(raw_input, border=WALL)
+    start: int = maze.find(ord("S"))
+    end: int = maze.find(ord("E"))
+    if start == -1 or end == -1:
         raise ValueError("Start or end position not found in the maze.")
 
     return maze, start, end
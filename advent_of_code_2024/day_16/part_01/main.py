@@ -1,92 +1,75 @@
 """Advent of code - Day 16 - Part 01"""
 
-import heapq
-import typing as t
-
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.counters import add_count
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.common.search import (
+    NOT_FOUND,
+    SearchState,
+    shortest_path_search,
+)
 from advent_of_code_2024.day_16.common import (
     DIRECTIONS,
-    Node,
+    EAST,
     compute_heuristic,
+    make_moves,
     parse_maze,
 )
 
 
 def a_star_search(
-    maze: t.List[t.List[int]],
-    start: t.Tuple[int, int],
-    end: t.Tuple[int, int],
+    maze: Grid,
+    start: int,
+    end: int,
     direction: int,
 ) -> int:
     """Use A* search to find the minimum cost to reach the end position.
 
     Args:
-        maze (t.List[t.List[int]]): Maze.
-        start (t.Tuple[int, int]): Start position.
-        end (t.Tuple[int, int]): End position.
+        maze (Grid): Maze, surrounded by walls.
+        start (int): Start cell index.
+        end (int): End cell index.
         direction (int): Starting direction.
 
+    Raises:
+        ValueError: If the end position cannot be reached.
+
     Returns:
         int: Minimum cost to reach the end position.
     """
-    open_list: t.List[Node] = []
-    closed_list: t.Set[t.Tuple[int, int, int]] = set()
-
-    start_node = Node(
-        x=start[0],
-        y=start[1],
-        direction=direction,
-        cost=0,
-        heuristic=compute_heuristic(start, end),
+    search: SearchState = SearchState(len(maze.cells) * DIRECTIONS)
+    goal: int = shortest_path_search(
+        search,
+        [start * DIRECTIONS + direction],
+        make_moves(maze),
+        is_goal=lambda state: state // DIRECTIONS == end,
+        heuristic=lambda state: compute_heuristic(
+            maze, state // DIRECTIONS, end
+        ),
     )
-    heapq.heappush(open_list, start_node)
-
-    while open_list:
-        current_node: Node = heapq.heappop(open_list)
+    add_count("expanded_nodes", len(search.order))
+    if goal == NOT_FOUND:
+        raise ValueError("No path found")
+    return search.distances[goal]
 
-        if current_node.x == end[0] and current_node.y == end[1]:
-            return current_node.cost
 
-        closed_list.add(
-            (current_node.x, current_node.y, current_node.direction)
-        )
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
 
-        for i in range(4):
-            new_direction: int = (current_node.direction + i) % 4
-            dx, dy = DIRECTIONS[new_direction]
-            new_x: int = current_node.x + dx
-            new_y: int = current_node.y + dy
-
-            if (
-                0 <= new_x < len(maze)
-                and 0 <= new_y < len(maze[0])
-                and maze[new_x][new_y] == 0
-            ):
-                if (new_x, new_y, new_direction) not in closed_list:
-                    node_cost: int = current_node.cost + 1
-                    if i in [1, 3]:
-                        node_cost = current_node.cost + 1001
-                    new_cost: int = node_cost
-                    new_heuristic: float = compute_heuristic(
-                        (new_x, new_y), end
-                    )
-                    new_node = Node(
-                        x=new_x,
-                        y=new_y,
-                        direction=new_direction,
-                        cost=new_cost,
-                        heuristic=new_heuristic,
-                    )
-                    new_node.parent = current_node
-                    heapq.heappush(open_list, new_node)
+    Args:
+        raw_input (RawInput): Raw input.
 
-    raise ValueError("No path found")
+    Returns:
+        int: Lowest score a reindeer could possibly get.
+    """
+    maze, start, end = parse_maze(raw_input)
+    return a_star_search(maze, start, end, direction=EAST)
 
 
 def main() -> None:
     """Main function."""
-    maze, start, end = parse_maze(file_name="input.txt", from_file=__file__)
-    minimum_cost: int = a_star_search(maze, start, end, direction=1)
-    print(minimum_cost)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
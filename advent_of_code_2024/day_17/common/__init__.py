@@ -1,8 +1,16 @@
 """Common methods for the Day 17"""
 
-import os
 import typing as t
 from enum import Enum
+from functools import partial
+
+from advent_of_code_2024.common import RawInput, extract_ints_per_line
+from advent_of_code_2024.common.budget import ProgressTracker, track_progress
+from advent_of_code_2024.common.counters import add_count
+from advent_of_code_2024.common.parallel import (
+    get_parallel_workers,
+    parallel_map,
+)
 
 
 class OperandEnum(Enum):
@@ -232,18 +240,26 @@ class Computer:
             str: Program output.
         """
         instruction_id: int = 0
+        executed_instructions: int = 0
         while instruction_id < len(self.instructions) - 1:
             instruction: int = self.instructions[instruction_id]
             instructions_function = self.instructions_functions.get(instruction)
             if instructions_function is None:
                 raise ValueError("Invalid instruction")
             instruction_id = instructions_function(instruction_id)
+            executed_instructions += 1
+        add_count("executed_instructions", executed_instructions)
         return ",".join([str(output) for output in self.output])
 
     def fix_register_a(self) -> int:
         """Fix register A value so that the output
             is the same as the instructions.
 
+        The candidate values are run on fresh computers, in parallel
+        according to the configured parallel mode. The search may not end
+        on some programs: the candidates tried are reported against the
+        budget of the run.
+
         Returns:
             int: Fixed register A value.
         """
@@ -253,18 +269,30 @@ class Computer:
         self.output: t.List[int] = [-1 for _ in range(len(self.instructions))]
         i: int = len(self.instructions) - 1
         changed: bool
+        batch_size: int = get_parallel_workers()
+        progress: ProgressTracker = track_progress("Register A candidates")
 
         while i >= 0:
             changed = False
 
             while self.instructions[i] != self.output[i]:
                 changed = True
-                register_a += pow(8, i)
-                self.register_a = int(register_a)
-                self.register_b = int(register_b)
-                self.register_c = int(register_c)
-                self.output = []
-                self.run()
+                # Consecutive candidates are run in batches, one per worker,
+                # and the first one matching is kept.
+                candidates: t.List[int] = [
+                    register_a + pow(8, i) * step
+                    for step in range(1, batch_size + 1)
+                ]
+                outputs: t.List[t.List[int]] = parallel_map(
+                    partial(
+                        run_program, self.instructions, register_b, register_c
+                    ),
+                    candidates,
+                )
+                progress.advance(len(candidates))
+                for register_a, self.output in zip(candidates, outputs):
+                    if self.instructions[i] == self.output[i]:
+                        break
 
             if changed:
                 i = len(self.instructions) - 1
@@ -274,39 +302,46 @@ class Computer:
         return register_a
 
 
-def initialize_computer(
-    file_name: str,
-    from_file: str,
-) -> Computer:
-    """Initialize computer using configuration from a txt file.
+def run_program(
+    instructions: t.List[int],
+    register_b: int,
+    register_c: int,
+    register_a: int,
+) -> t.List[int]:
+    """Run a program on a fresh computer.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        instructions (t.List[int]): Program instructions.
+        register_b (int): Initial value of register B.
+        register_c (int): Initial value of register C.
+        register_a (int): Initial value of register A.
 
     Returns:
-        Computer: The instantiated computer.
+        t.List[int]: Program output.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
+    computer: Computer = Computer(
+        register_a=register_a,
+        register_b=register_b,
+        register_c=register_c,
+        instructions=instructions,
     )
+    computer.run()
+    return computer.output
 
-    register_a: int = 0
-    register_b: int = 0
-    register_c: int = 0
-    instructions: t.List[int] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        for line in file_descriptor.readlines():
-            if line.startswith("Register A:"):
-                register_a = int(line.split(":")[1].strip())
-            elif line.startswith("Register B:"):
-                register_b = int(line.split(":")[1].strip())
-            elif line.startswith("Register C:"):
-                register_c = int(line.split(":")[1].strip())
-            elif line.startswith("Program:"):
-                instructions = [
-                    int(x) for x in line.split(":")[1].strip().split(",")
-                ]
+
+def parse_computer(raw_input: RawInput) -> Computer:
+    """Initialize computer using configuration from a raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        Computer: The instantiated computer.
+    """
+    lines: t.List[t.List[int]] = extract_ints_per_line(raw_input)
+    if len(lines) != 4:
+        raise ValueError("Expected three registers and a program.")
+    (register_a,), (register_b,), (register_c,), instructions = lines
 
     return Computer(
         register_a=register_a,
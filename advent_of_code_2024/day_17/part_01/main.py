@@ -1,16 +1,26 @@
 """Advent of code - Day 17 - Part 01"""
 
-from advent_of_code_2024.day_17.common import Computer, initialize_computer
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.day_17.common import Computer, parse_computer
+
+
+def solve(raw_input: RawInput) -> str:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        str: Program output.
+    """
+    computer: Computer = parse_computer(raw_input)
+    return computer.run()
 
 
 def main() -> None:
     """Main function."""
-    computer: Computer = initialize_computer(
-        file_name="input.txt", from_file=__file__
-    )
-    print(computer)
-    output: str = computer.run()
-    print(output)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,16 +1,26 @@
 """Advent of code - Day 17 - Part 02"""
 
-from advent_of_code_2024.day_17.common import Computer, initialize_computer
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.day_17.common import Computer, parse_computer
+
+
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Lowest register A value making the program output itself.
+    """
+    computer: Computer = parse_computer(raw_input)
+    return computer.fix_register_a()
 
 
 def main() -> None:
     """Main function."""
-    computer: Computer = initialize_computer(
-        file_name="input.txt", from_file=__file__
-    )
-    print(computer)
-    register_a: int = computer.fix_register_a()
-    print(register_a)
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -1,20 +1,31 @@
 """Common methods for the Day 18"""
 
-import os
 import typing as t
-from collections import deque
+
+from advent_of_code_2024.common import RawInput, extract_ints
+from advent_of_code_2024.common.counters import add_count
+from advent_of_code_2024.common.grid import Grid
+from advent_of_code_2024.common.parse_cache import cached_parser
+from advent_of_code_2024.common.render import emit, is_verbose, render_grid
+from advent_of_code_2024.common.search import (
+    NOT_FOUND,
+    SearchState,
+    breadth_first_search,
+)
+
+CORRUPTED: int = ord("#")
 
 
 class BFSSolver:
     """Breadth-first search solver."""
 
-    maze: t.List[t.List[str]]
+    maze: Grid
     empty_cell: str
     walked_cell: str
 
     def __init__(
         self,
-        maze: t.List[t.List[str]],
+        maze: Grid,
         empty_cell: str = ".",
         walked_cell: str = "O",
     ) -> None:
@@ -22,43 +33,6 @@ class BFSSolver:
         self.empty_cell = empty_cell
         self.walked_cell = walked_cell
 
-    def __is_valid_position(self, position_x: int, position_y: int) -> bool:
-        """Check if the position is valid.
-
-        Args:
-            position_x (int): X position.
-            position_y (int): Y position.
-
-        Returns:
-            bool: True if the position is valid, False otherwise.
-        """
-        return (
-            0 <= position_x < len(self.maze[0])
-            and 0 <= position_y < len(self.maze)
-            and self.maze[position_y][position_x] == self.empty_cell
-        )
-
-    def __get_adjacent_positions(
-        self,
-        position_x: int,
-        position_y: int,
-    ) -> t.List[t.Tuple[int, int]]:
-        """Get the adjacent positions of the given position.
-
-        Args:
-            position_x (int): X position.
-            position_y (int): Y position.
-
-        Returns:
-            t.List[t.Tuple[int, int]]: The adjacent positions.
-        """
-        return [
-            (position_x - 1, position_y),
-            (position_x + 1, position_y),
-            (position_x, position_y - 1),
-            (position_x, position_y + 1),
-        ]
-
     def compute_shortest_path(
         self,
         start_position: t.Tuple[int, int],
@@ -79,43 +53,40 @@ class BFSSolver:
             t.List[t.Tuple[int, int]]:
                 The shortest path from the start to the end position.
         """
-        visited: t.Set[t.Tuple[int, int]] = set()
-        queue: t.Deque[t.Tuple[int, int]] = deque([start_position])
-        parent: t.Dict[t.Tuple[int, int], t.Tuple[int, int] | None] = {}
-
-        visited.add(start_position)
-        parent[start_position] = None
-
-        while queue:
-            current_position: t.Tuple[int, int] | None = queue.popleft()
-            if current_position is None:
-                raise ValueError("Current position is None.")
-
-            if current_position == end_position:
-                path: t.List[t.Tuple[int, int]] = []
-                while current_position:
-                    path.append(current_position)
-                    current_position = parent[current_position]
-                if print_maze:
-                    self.print_maze(path)
-                return path[::-1]
-
-            for adjacent_position in self.__get_adjacent_positions(
-                position_x=current_position[0],
-                position_y=current_position[1],
-            ):
-                if (
-                    adjacent_position not in visited
-                    and self.__is_valid_position(
-                        position_x=adjacent_position[0],
-                        position_y=adjacent_position[1],
-                    )
-                ):
-                    queue.append(adjacent_position)
-                    visited.add(adjacent_position)
-                    parent[adjacent_position] = current_position
-
-        return None
+        if not (
+            self.maze.contains(*start_position)
+            and self.maze.contains(*end_position)
+        ):
+            return None
+        cells: bytearray = self.maze.cells
+        offsets: t.Tuple[int, int, int, int] = self.maze.neighbour_offsets
+        empty_cell: int = ord(self.empty_cell)
+        end: int = self.maze.index(*end_position)
+
+        def empty_neighbours(position: int) -> t.List[int]:
+            return [
+                position + offset
+                for offset in offsets
+                if cells[position + offset] == empty_cell
+            ]
+
+        search: SearchState = SearchState(len(cells), track_parents=True)
+        goal: int = breadth_first_search(
+            search,
+            [self.maze.index(*start_position)],
+            empty_neighbours,
+            is_goal=lambda position: position == end,
+        )
+        add_count("visited_cells", len(search.order))
+        if goal == NOT_FOUND:
+            return None
+
+        path: t.List[t.Tuple[int, int]] = [
+            self.maze.position(position) for position in search.path(goal)
+        ]
+        if print_maze:
+            self.print_maze(path)
+        return path
 
     def compute_minimum_steps(
         self,
@@ -146,33 +117,31 @@ class BFSSolver:
         self,
         path: t.List[t.Tuple[int, int]] | None = None,
     ) -> None:
-        """Print the path in the maze.
+        """Print the path in the maze, when the debug output is enabled.
 
         Args:
             path (t.List[t.Tuple[int, int]] | None):
                 The path to print in the maze.
                 Defaults to None.
         """
-        print("> Maze:")
-        for position_y, row in enumerate(self.maze):
-            for position_x, cell in enumerate(row):
-                if path is not None and (position_x, position_y) in path:
-                    print(self.walked_cell, end="")
-                else:
-                    print(cell, end="")
-            print()
-        print()
+        if not is_verbose():
+            return
+        walked_cell: int = ord(self.walked_cell)
+        overlays: t.Dict[int, int] = {
+            self.maze.index(*position): walked_cell for position in path or []
+        }
+        emit("> Maze:\n" + render_grid(self.maze, overlays) + "\n")
 
 
 def corrupt_memory_space(
-    memory_space: t.List[t.List[str]],
+    memory_space: Grid,
     bytes_positions: t.List[t.Tuple[int, int]],
     max_bytes: int | None = None,
-) -> t.List[t.List[str]]:
+) -> Grid:
     """Corrupt the memory space with the given bytes positions.
 
     Args:
-        memory_space (t.List[t.List[str]]):
+        memory_space (Grid):
             Memory space to corrupt.
         bytes_positions (t.List[t.Tuple[int, int]]):
             Bytes positions to corrupt the memory space.
@@ -180,17 +149,17 @@ def corrupt_memory_space(
             Maximum number of bytes to corrupt the memory space.
 
     Returns:
-        t.List[t.List[str]]: The corrupted memory space.
+        Grid: The corrupted memory space.
     """
     max_bytes = max_bytes if max_bytes is not None else len(bytes_positions)
     for position_x, position_y in bytes_positions[:max_bytes]:
-        if position_x < len(memory_space[0]) and position_y < len(memory_space):
-            memory_space[position_y][position_x] = "#"
+        if memory_space.contains(position_x, position_y):
+            memory_space[memory_space.index(position_x, position_y)] = CORRUPTED
 
     return memory_space
 
 
-def generate_memory_space(width: int, height: int) -> t.List[t.List[str]]:
+def generate_memory_space(width: int, height: int) -> Grid:
     """Generate a memory space with the given width and height.
 
     Args:
@@ -198,33 +167,20 @@ def generate_memory_space(width: int, height: int) -> t.List[t.List[str]]:
         height (int): Height of the memory space.
 
     Returns:
-        t.List[t.List[str]]: The generated memory space.
+        Grid: The generated memory space, surrounded by corrupted cells.
     """
-    return [["." for _ in range(width + 1)] for _ in range(height + 1)]
+    return Grid(width + 1, height + 1, fill=ord("."), border=CORRUPTED)
 
 
-def read_bytes_positions(
-    file_name: str,
-    from_file: str,
-) -> t.List[t.Tuple[int, int]]:
-    """Read list of bytes positions from a txt file.
+@cached_parser(version=1)
+def parse_bytes_positions(raw_input: RawInput) -> t.List[t.Tuple[int, int]]:
+    """Parse list of bytes positions from a raw input.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
         t.List[t.Tuple[int, int]]: The list of bytes positions.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-
-    bytes_positions: t.List[t.Tuple[int, int]] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        for line in file_descriptor.readlines():
-            position_x: int = int(line.split(",")[0])
-            position_y: int = int(line.split(",")[1])
-            bytes_positions.append((position_x, position_y))
-
-    return bytes_positions
+    coordinates = extract_ints(raw_input)
+    return list(zip(coordinates[0::2], coordinates[1::2]))
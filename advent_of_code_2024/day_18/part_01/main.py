@@ -2,44 +2,52 @@
 
 import typing as t
 
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.grid import Grid
 from advent_of_code_2024.day_18.common import (
     BFSSolver,
     corrupt_memory_space,
     generate_memory_space,
-    read_bytes_positions,
+    parse_bytes_positions,
 )
 
 
-def main(
-    start_position: t.Tuple[int, int],
-    end_position: t.Tuple[int, int],
-    memory_space_width: int,
-    memory_space_height: int,
-    max_corrupted_bytes: int,
-) -> None:
-    """Main function.
+def solve(
+    raw_input: RawInput,
+    start_position: t.Tuple[int, int] = (0, 0),
+    end_position: t.Tuple[int, int] = (70, 70),
+    memory_space_width: int = 70,
+    memory_space_height: int = 70,
+    max_corrupted_bytes: int = 1024,
+) -> int:
+    """Solve the puzzle from its raw input.
 
     Args:
+        raw_input (RawInput):
+            Raw input.
         start_position (t.Tuple[int, int]):
-            Start position in the memory space.
+            Start position in the memory space. Defaults to (0, 0).
         end_position (t.Tuple[int, int]):
-            End position in the memory space.
+            End position in the memory space. Defaults to (70, 70).
         memory_space_width (int):
-            Memory space width.
+            Memory space width. Defaults to 70.
         memory_space_height (int):
-            Memory space height.
+            Memory space height. Defaults to 70.
         max_corrupted_bytes (int):
             Maximum number of corrupted bytes in the memory space.
+            Defaults to 1024.
+
+    Returns:
+        int: Minimum number of steps needed to reach the exit.
     """
-    bytes_positions: t.List[t.Tuple[int, int]] = read_bytes_positions(
-        file_name="input.txt",
-        from_file=__file__,
+    bytes_positions: t.List[t.Tuple[int, int]] = parse_bytes_positions(
+        raw_input
     )
-    memory_space: t.List[t.List[str]] = generate_memory_space(
+    memory_space: Grid = generate_memory_space(
         width=memory_space_width,
         height=memory_space_height,
     )
-    corrupted_memory_space: t.List[t.List[str]] = corrupt_memory_space(
+    corrupted_memory_space: Grid = corrupt_memory_space(
         memory_space=memory_space,
         bytes_positions=bytes_positions,
         max_bytes=max_corrupted_bytes,
@@ -49,16 +57,15 @@ def main(
     ).compute_minimum_steps(
         start_position=start_position,
         end_position=end_position,
-        print_maze=True,
     )
-    print(steps_count)
+    return steps_count
+
+
+def main() -> None:
+    """Main function."""
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
-    main(
-        start_position=(0, 0),
-        end_position=(70, 70),
-        memory_space_width=70,
-        memory_space_height=70,
-        max_corrupted_bytes=1024,
-    )
+    main()
@@ -2,11 +2,13 @@
 
 import typing as t
 
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.grid import Grid
 from advent_of_code_2024.day_18.common import (
     BFSSolver,
     corrupt_memory_space,
     generate_memory_space,
-    read_bytes_positions,
+    parse_bytes_positions,
 )
 
 
@@ -14,7 +16,7 @@ def compute_first_byte_that_prevents_exit(
     start_position: t.Tuple[int, int],
     end_position: t.Tuple[int, int],
     bytes_positions: t.List[t.Tuple[int, int]],
-    memory_space: t.List[t.List[str]],
+    memory_space: Grid,
 ) -> t.Tuple[int, int] | None:
     """Compute the first byte that prevents the exit.
 
@@ -22,7 +24,7 @@ def compute_first_byte_that_prevents_exit(
         start_position (t.Tuple[int, int]): Start position.
         end_position (t.Tuple[int, int]): End position.
         bytes_positions (t.List[t.Tuple[int, int]]): Bytes positions.
-        memory_space (t.List[t.List[str]]): Memory space.
+        memory_space (Grid): Memory space.
 
     Returns:
         t.Tuple[int, int] | None: First byte that prevents the exit.
@@ -37,7 +39,8 @@ def compute_first_byte_that_prevents_exit(
             end_position=end_position,
         )
     ) is not None:
-        while bytes_positions[idx] not in shortest_path:
+        path_positions: t.Set[t.Tuple[int, int]] = set(shortest_path)
+        while bytes_positions[idx] not in path_positions:
             bfs_solver.maze = corrupt_memory_space(
                 memory_space=memory_space,
                 bytes_positions=[bytes_positions[idx]],
@@ -50,45 +53,50 @@ def compute_first_byte_that_prevents_exit(
     return bytes_positions[idx] if idx < len(bytes_positions) else None
 
 
-def main(
-    start_position: t.Tuple[int, int],
-    end_position: t.Tuple[int, int],
-    memory_space_width: int,
-    memory_space_height: int,
-) -> None:
-    """Main function.
+def solve(
+    raw_input: RawInput,
+    start_position: t.Tuple[int, int] = (0, 0),
+    end_position: t.Tuple[int, int] = (70, 70),
+    memory_space_width: int = 70,
+    memory_space_height: int = 70,
+) -> t.Tuple[int, int] | None:
+    """Solve the puzzle from its raw input.
 
     Args:
+        raw_input (RawInput):
+            Raw input.
         start_position (t.Tuple[int, int]):
-            Start position in the memory space.
+            Start position in the memory space. Defaults to (0, 0).
         end_position (t.Tuple[int, int]):
-            End position in the memory space.
+            End position in the memory space. Defaults to (70, 70).
         memory_space_width (int):
-            Memory space width.
+            Memory space width. Defaults to 70.
         memory_space_height (int):
-            Memory space height.
+            Memory space height. Defaults to 70.
+
+    Returns:
+        t.Tuple[int, int] | None: First byte that prevents the exit.
     """
-    bytes_positions: t.List[t.Tuple[int, int]] = read_bytes_positions(
-        file_name="input.txt",
-        from_file=__file__,
+    bytes_positions: t.List[t.Tuple[int, int]] = parse_bytes_positions(
+        raw_input
     )
-    memory_space: t.List[t.List[str]] = generate_memory_space(
+    memory_space: Grid = generate_memory_space(
         width=memory_space_width,
         height=memory_space_height,
     )
-    bad_byte: t.Tuple[int, int] | None = compute_first_byte_that_prevents_exit(
+    return compute_first_byte_that_prevents_exit(
         start_position=start_position,
         end_position=end_position,
         bytes_positions=bytes_positions,
         memory_space=memory_space,
     )
-    print(bad_byte)
+
+
+def main() -> None:
+    """Main function."""
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
-    main(
-        start_position=(0, 0),
-        end_position=(70, 70),
-        memory_space_width=70,
-        memory_space_height=70,
-    )
+    main()
@@ -1,9 +1,11 @@
 """Common methods for the Day 19"""
 
-import os
 import typing as t
 from functools import lru_cache
 
+from advent_of_code_2024.common import RawInput, iter_lines, split_sections
+from advent_of_code_2024.common.parse_cache import cached_parser
+
 
 def count_possible_solutions(design: str, towels: t.List[str]) -> int:
     """Count possible solutions for the design using list of infinite towels.
@@ -41,32 +43,24 @@ def count_possible_solutions(design: str, towels: t.List[str]) -> int:
     return count_ways(0)
 
 
-def parse_input_file(
-    file_name: str,
-    from_file: str,
-) -> t.Tuple[t.List[str], t.List[str]]:
-    """Parse txt file.
+@cached_parser(version=1)
+def parse_input(raw_input: RawInput) -> t.Tuple[t.List[str], t.List[str]]:
+    """Parse raw input.
 
     Args:
-        file_name (str): Input file name.
-        from_file (str): File from where the method is called.
+        raw_input (RawInput): Raw input.
 
     Returns:
         t.Tuple[t.List[str], t.List[str]]:
             List of towels.
             List of designs.
     """
-    absolute_path_to_file: str = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(from_file), file_name)
-    )
-
     towels: t.List[str] = []
     designs: t.List[str] = []
-    with open(absolute_path_to_file, "r", encoding="utf-8") as file_descriptor:
-        for line in file_descriptor.readlines():
-            if "," in line:
-                towels = [p.strip() for p in line.split(",")]
-            elif len(line.strip()) > 0:
-                designs.append(line.strip())
+    sections: t.List[bytes] = split_sections(raw_input)
+    if sections:
+        towels = sections[0].decode("ascii").replace(" ", "").split(",")
+    for section in sections[1:]:
+        designs.extend(line.decode("ascii") for line in iter_lines(section))
 
     return towels, designs
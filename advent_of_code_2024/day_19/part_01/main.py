@@ -1,21 +1,38 @@
 """Advent of code - Day 19 - Part 01"""
 
+from functools import partial
+
+from advent_of_code_2024.common import RawInput, map_input_file
+from advent_of_code_2024.common.parallel import parallel_map
 from advent_of_code_2024.day_19.common import (
     count_possible_solutions,
-    parse_input_file,
+    parse_input,
 )
 
 
-def main() -> None:
-    """Main function."""
-    towels, designs = parse_input_file(
-        file_name="input.txt",
-        from_file=__file__,
-    )
+def solve(raw_input: RawInput) -> int:
+    """Solve the puzzle from its raw input.
+
+    Args:
+        raw_input (RawInput): Raw input.
+
+    Returns:
+        int: Number of possible designs.
+    """
+    towels, designs = parse_input(raw_input)
     possible_designs_count: int = sum(
-        bool(count_possible_solutions(design, towels)) for design in designs
+        bool(count)
+        for count in parallel_map(
+            partial(count_possible_solutions, towels=towels), designs
+        )
     )
-    print(possible_designs_count)
+    return possible_designs_count
+
+
+def main() -> None:
+    """Main function."""
+    with map_input_file("input.txt", __file__) as raw_input:
+        print(solve(raw_input))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,62 @@
+"""Synthetic input generators of the daily puzzles"""
+
+import importlib
+import os
+import re
+import typing as t
+
+GENERATORS_PACKAGE: str = "advent_of_code_2024.generators"
+GENERATORS_DIRECTORY: str = os.path.dirname(__file__)
+GENERATOR_MODULE_REGEX: re.Pattern[str] = re.compile(r"^day_(\d+)\.py$")
+
+
+def available_generator_days() -> t.List[int]:
+    """List the days having an input generator.
+
+    Returns:
+        t.List[int]: Sorted day numbers.
+    """
+    return sorted(
+        int(module_match.group(1))
+        for module_match in map(
+            GENERATOR_MODULE_REGEX.match, os.listdir(GENERATORS_DIRECTORY)
+        )
+        if module_match is not None
+    )
+
+
+def get_generator(day: int) -> t.Callable[[int, int], str]:
+    """Get the input generator of a day.
+
+    Args:
+        day (int): Day number.
+
+    Raises:
+        ValueError: If the day has no generator.
+
+    Returns:
+        t.Callable[[int, int], str]: Function taking a size and a seed
+            and returning a raw input.
+    """
+    if day not in available_generator_days():
+        raise ValueError(f"No input generator for day {day}.")
+    module = importlib.import_module(f"{GENERATORS_PACKAGE}.day_{day:02d}")
+    generator: t.Callable[[int, int], str] = module.generate
+    return generator
+
+
+def generate_input(day: int, size: int, seed: int = 0) -> str:
+    """Generate a synthetic raw input for a day.
+
+    The meaning of the size depends on the day (number of lines, grid
+    side, ...), the same size and seed always give the same input.
+
+    Args:
+        day (int): Day number.
+        size (int): Input size.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    return get_generator(day)(size, seed)
@@ -0,0 +1,28 @@
+"""Synthetic input generator for the Day 01"""
+
+import random
+import typing as t
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate the two lists of location IDs.
+
+    About a third of the right list IDs are picked from the left list,
+    so that the similarity score is not always zero.
+
+    Args:
+        size (int): Number of lines.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    left: t.List[int] = [rng.randint(10_000, 99_999) for _ in range(size)]
+    right: t.List[int] = [
+        rng.choice(left) if rng.random() < 0.3 else rng.randint(10_000, 99_999)
+        for _ in range(size)
+    ]
+    return "".join(
+        f"{item_1}   {item_2}\n" for item_1, item_2 in zip(left, right)
+    )
@@ -0,0 +1,30 @@
+"""Synthetic input generator for the Day 02"""
+
+import random
+import typing as t
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate reports of levels.
+
+    Reports are monotonic with steps of 1 to 3, some of them get one
+    faulty level so that every safety rule is exercised.
+
+    Args:
+        size (int): Number of reports.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    lines: t.List[str] = []
+    for _ in range(size):
+        direction: int = rng.choice([-1, 1])
+        levels: t.List[int] = [rng.randint(20, 70)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + direction * rng.randint(1, 3))
+        if rng.random() < 0.4:
+            levels[rng.randrange(len(levels))] += rng.choice([-4, 0, 4])
+        lines.append(" ".join(str(level) for level in levels))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,39 @@
+"""Synthetic input generator for the Day 03"""
+
+import random
+import typing as t
+
+NOISE_CHARS: str = "!@#$%^&*()[]{}<>,;:?'+- "
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a corrupted memory.
+
+    Args:
+        size (int): Number of instructions (valid or corrupted).
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    fragments: t.List[str] = []
+    for _ in range(size):
+        left: int = rng.randint(1, 999)
+        right: int = rng.randint(1, 999)
+        fragments.append(
+            rng.choice(
+                [
+                    f"mul({left},{right})",
+                    f"mul({left},{right})",
+                    f"mul({left},{right}]",
+                    f"mul ( {left} , {right} )",
+                    f"mul({left}*",
+                    "do()",
+                    "don't()",
+                    "why()",
+                ]
+            )
+        )
+        fragments.append("".join(rng.choices(NOISE_CHARS, k=rng.randint(0, 4))))
+    return "".join(fragments) + "\n"
@@ -0,0 +1,43 @@
+"""Synthetic input generator for the Day 04"""
+
+import random
+import typing as t
+
+# Cells of a planted X-MAS, as (x, y) offsets from its top left corner.
+X_MAS_CELLS: t.Tuple[t.Tuple[int, int, str], ...] = (
+    (0, 0, "M"),
+    (2, 0, "S"),
+    (1, 1, "A"),
+    (0, 2, "M"),
+    (2, 2, "S"),
+)
+WORD: str = "XMAS"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a word search grid.
+
+    Random letters seldom form an X-MAS on small grids: from a side of 3,
+    one is planted, and from a side of 4, an XMAS is written on a row, so
+    that both parts find something.
+
+    Args:
+        size (int): Grid side.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    rows: t.List[t.List[str]] = [rng.choices(WORD, k=size) for _ in range(size)]
+    if size >= 3:
+        left: int = rng.randrange(size - 2)
+        top: int = rng.randrange(size - 2)
+        for x, y, letter in X_MAS_CELLS:
+            rows[top + y][left + x] = letter
+    if size >= len(WORD):
+        # The word goes on a row the X-MAS does not cross.
+        row: t.List[str] = rows[(top + 3) % size]
+        start: int = rng.randrange(size - len(WORD) + 1)
+        row[start : start + len(WORD)] = WORD
+    return "".join("".join(row) + "\n" for row in rows)
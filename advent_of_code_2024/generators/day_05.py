@@ -0,0 +1,35 @@
+"""Synthetic input generator for the Day 05"""
+
+import random
+import typing as t
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate page ordering rules and updates.
+
+    Rules describe a total order of the pages (one rule per pair of pages),
+    updates hold an odd number of pages in a random order.
+
+    Args:
+        size (int): Number of pages and of updates (at least 3).
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    size = max(size, 3)
+    pages: t.List[int] = rng.sample(range(10, 10 + 10 * size), size)
+    rules: t.List[str] = [
+        f"{pages[before]}|{pages[after]}"
+        for before in range(size)
+        for after in range(before + 1, size)
+    ]
+    rng.shuffle(rules)
+    updates: t.List[str] = []
+    for _ in range(size):
+        length: int = rng.randrange(3, min(size, 23) + 1, 2)
+        updates.append(
+            ",".join(str(page) for page in rng.sample(pages, length))
+        )
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
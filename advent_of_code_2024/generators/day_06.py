@@ -0,0 +1,57 @@
+"""Synthetic input generator for the Day 06"""
+
+import random
+import typing as t
+
+DIRECTIONS: t.List[t.Tuple[int, int]] = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+
+
+def guard_leaves(board: t.List[t.List[str]], x: int, y: int) -> bool:
+    """Check that a guard starting upward eventually leaves the board.
+
+    Args:
+        board (t.List[t.List[str]]): Board rows.
+        x (int): Guard column.
+        y (int): Guard row.
+
+    Returns:
+        bool: False if the guard walks in a loop.
+    """
+    direction: int = 0
+    visited: t.Set[t.Tuple[int, int, int]] = set()
+    while (x, y, direction) not in visited:
+        visited.add((x, y, direction))
+        next_x: int = x + DIRECTIONS[direction][0]
+        next_y: int = y + DIRECTIONS[direction][1]
+        if not (0 <= next_x < len(board[0]) and 0 <= next_y < len(board)):
+            return True
+        if board[next_y][next_x] == "#":
+            direction = (direction + 1) % 4
+        else:
+            x, y = next_x, next_y
+    return False
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a lab map with a guard that leaves it.
+
+    Args:
+        size (int): Grid side (at least 2).
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    size = max(size, 2)
+    while True:
+        board: t.List[t.List[str]] = [
+            ["#" if rng.random() < 0.08 else "." for _ in range(size)]
+            for _ in range(size)
+        ]
+        x: int = rng.randrange(size)
+        y: int = rng.randrange(size)
+        board[y][x] = "."
+        if guard_leaves(board, x, y):
+            board[y][x] = "^"
+            return "".join("".join(row) + "\n" for row in board)
@@ -0,0 +1,38 @@
+"""Synthetic input generator for the Day 07"""
+
+import random
+import typing as t
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate calibration equations.
+
+    About half of the equations are solvable with the additions,
+    multiplications and concatenations of their numbers.
+
+    Args:
+        size (int): Number of equations.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    lines: t.List[str] = []
+    for _ in range(size):
+        numbers: t.List[int] = [
+            rng.randint(1, 99) for _ in range(rng.randint(2, 9))
+        ]
+        result: int = numbers[0]
+        for number in numbers[1:]:
+            operator: str = rng.choice("+*|")
+            if operator == "+":
+                result += number
+            elif operator == "*":
+                result *= number
+            else:
+                result = int(f"{result}{number}")
+        if rng.random() < 0.5:
+            result += rng.randint(1, 9)
+        lines.append(f"{result}: {' '.join(str(number) for number in numbers)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,29 @@
+"""Synthetic input generator for the Day 08"""
+
+import random
+import string
+import typing as t
+
+FREQUENCIES: str = (
+    string.ascii_uppercase + string.ascii_lowercase + string.digits
+)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate an antennas map.
+
+    Args:
+        size (int): Grid side.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    frequencies: str = FREQUENCIES[: max(1, min(len(FREQUENCIES), size // 4))]
+    board: t.List[t.List[str]] = [["."] * size for _ in range(size)]
+    for _ in range(size * size // 25):
+        board[rng.randrange(size)][rng.randrange(size)] = rng.choice(
+            frequencies
+        )
+    return "".join("".join(row) + "\n" for row in board)
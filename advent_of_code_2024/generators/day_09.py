@@ -0,0 +1,23 @@
+"""Synthetic input generator for the Day 09"""
+
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a disk map.
+
+    Args:
+        size (int): Number of digits (files and free spaces).
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    return (
+        "".join(
+            str(rng.randint(1, 9) if index % 2 == 0 else rng.randint(0, 9))
+            for index in range(size)
+        )
+        + "\n"
+    )
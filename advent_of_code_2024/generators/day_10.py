@@ -0,0 +1,53 @@
+"""Synthetic input generator for the Day 10"""
+
+import random
+import typing as t
+
+# Heights of a hiking trail, from its trailhead to its summit.
+TRAIL_HEIGHTS: range = range(10)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a topographic map.
+
+    Heights mostly differ by one from the cell above or on the left,
+    so that the map holds long hiking trails. From a side of 4, a full
+    trail from 0 to 9 is planted along the rows, each row walked in the
+    opposite direction of the previous one, so that every map has a
+    trailhead with a positive score.
+
+    Args:
+        size (int): Grid side.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    heights: t.List[t.List[int]] = []
+    for y in range(size):
+        row: t.List[int] = []
+        for x in range(size):
+            if rng.random() < 0.2 or (x == 0 and y == 0):
+                row.append(rng.randint(0, 9))
+                continue
+            neighbour: int = (
+                row[x - 1]
+                if y == 0 or (x > 0 and rng.random() < 0.5)
+                else heights[y - 1][x]
+            )
+            row.append(min(9, max(0, neighbour + rng.choice([-1, 1]))))
+        heights.append(row)
+    # Consecutive cells of the rows, walked back and forth, are adjacent.
+    cells: t.List[t.Tuple[int, int]] = [
+        (x if y % 2 == 0 else size - 1 - x, y)
+        for y in range(size)
+        for x in range(size)
+    ]
+    if len(cells) >= len(TRAIL_HEIGHTS):
+        start: int = rng.randrange(len(cells) - len(TRAIL_HEIGHTS) + 1)
+        for (x, y), height in zip(cells[start:], TRAIL_HEIGHTS):
+            heights[y][x] = height
+    return "".join(
+        "".join(str(height) for height in row) + "\n" for row in heights
+    )
@@ -0,0 +1,17 @@
+"""Synthetic input generator for the Day 11"""
+
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a line of stones.
+
+    Args:
+        size (int): Number of stones.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    return " ".join(str(rng.randint(0, 999_999)) for _ in range(size)) + "\n"
@@ -0,0 +1,37 @@
+"""Synthetic input generator for the Day 12"""
+
+import random
+import string
+import typing as t
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a garden map.
+
+    Plants are mostly copied from a neighbour, which gives regions of
+    various shapes and sizes.
+
+    Args:
+        size (int): Grid side.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    plants: str = string.ascii_uppercase
+    garden: t.List[t.List[str]] = []
+    for y in range(size):
+        row: t.List[str] = []
+        for x in range(size):
+            neighbours: t.List[str] = []
+            if x > 0:
+                neighbours.append(row[x - 1])
+            if y > 0:
+                neighbours.append(garden[y - 1][x])
+            if neighbours and rng.random() < 0.75:
+                row.append(rng.choice(neighbours))
+            else:
+                row.append(rng.choice(plants))
+        garden.append(row)
+    return "".join("".join(row) + "\n" for row in garden)
@@ -0,0 +1,102 @@
+"""Synthetic input generator for the Day 13"""
+
+import random
+import typing as t
+
+# Shift of the prizes in part 2.
+PRIZE_SHIFT: int = 10_000_000_000_000
+# Lowest prize position of the machine planted for part 2.
+MIN_PLANTED_PRIZE: int = 1000
+
+
+def plant_shifted_prize(
+    rng: random.Random,
+) -> t.Tuple[int, int, int, int, int, int]:
+    """Generate a claw machine whose prize is reachable once shifted.
+
+    One button moves the claw more along X, the other more along Y, so that
+    the shifted prize is between them: the presses reaching a target near
+    it are rounded, and the prize is moved to where they lead.
+
+    Args:
+        rng (random.Random): Random generator.
+
+    Returns:
+        t.Tuple[int, int, int, int, int, int]: Button A shifts, button B
+            shifts and prize position.
+    """
+    a_x, a_y, b_x, b_y = (rng.randint(10, 99) for _ in range(4))
+    while (a_x - a_y) * (b_x - b_y) >= 0:
+        a_x, a_y, b_x, b_y = (rng.randint(10, 99) for _ in range(4))
+    target_x: int = PRIZE_SHIFT + rng.randint(MIN_PLANTED_PRIZE, 20_000)
+    target_y: int = PRIZE_SHIFT + rng.randint(MIN_PLANTED_PRIZE, 20_000)
+    determinant: int = a_x * b_y - a_y * b_x
+    presses_a: int = (target_x * b_y - target_y * b_x) // determinant
+    presses_b: int = (a_x * target_y - a_y * target_x) // determinant
+    return (
+        a_x,
+        a_y,
+        b_x,
+        b_y,
+        presses_a * a_x + presses_b * b_x - PRIZE_SHIFT,
+        presses_a * a_y + presses_b * b_y - PRIZE_SHIFT,
+    )
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def format_claw_machine(
+    a_x: int, a_y: int, b_x: int, b_y: int, prize_x: int, prize_y: int
+) -> str:
+    """Format a claw machine as in the puzzle input.
+
+    Args:
+        a_x (int): X shift of the button A.
+        a_y (int): Y shift of the button A.
+        b_x (int): X shift of the button B.
+        b_y (int): Y shift of the button B.
+        prize_x (int): X position of the prize.
+        prize_y (int): Y position of the prize.
+
+    Returns:
+        str: Claw machine lines.
+    """
+    return (
+        f"Button A: X+{a_x}, Y+{a_y}\n"
+        f"Button B: X+{b_x}, Y+{b_y}\n"
+        f"Prize: X={prize_x}, Y={prize_y}\n"
+    )
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate claw machines.
+
+    About two thirds of the prizes are reachable with at most 100 presses
+    of each button. One more machine, at a random place, has a prize
+    reachable once shifted by PRIZE_SHIFT, so that both parts win
+    something.
+
+    Args:
+        size (int): Number of random claw machines.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    planted: int = rng.randint(0, size)
+    machines: t.List[str] = []
+    for index in range(size + 1):
+        if index == planted:
+            machines.append(format_claw_machine(*plant_shifted_prize(rng)))
+            continue
+        a_x, a_y, b_x, b_y = (rng.randint(10, 99) for _ in range(4))
+        presses_a: int = rng.randint(0, 100)
+        presses_b: int = rng.randint(0, 100)
+        prize_x: int = presses_a * a_x + presses_b * b_x
+        prize_y: int = presses_a * a_y + presses_b * b_y
+        if rng.random() < 0.33:
+            prize_x += rng.randint(1, 9)
+        machines.append(
+            format_claw_machine(a_x, a_y, b_x, b_y, prize_x, prize_y)
+        )
+    return "\n".join(machines)
@@ -0,0 +1,24 @@
+"""Synthetic input generator for the Day 14"""
+
+import random
+
+BOARD_WIDTH: int = 101
+BOARD_HEIGHT: int = 103
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate robots on the default 101x103 board.
+
+    Args:
+        size (int): Number of robots.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    return "".join(
+        f"p={rng.randrange(BOARD_WIDTH)},{rng.randrange(BOARD_HEIGHT)} "
+        f"v={rng.randint(-99, 99)},{rng.randint(-99, 99)}\n"
+        for _ in range(size)
+    )
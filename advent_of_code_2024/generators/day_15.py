@@ -0,0 +1,42 @@
+"""Synthetic input generator for the Day 15"""
+
+import random
+import typing as t
+
+MOVES_LINE_LENGTH: int = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a warehouse and the robot moves.
+
+    Args:
+        size (int): Warehouse side (at least 3), the robot does size²
+            moves.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    size = max(size, 3)
+    warehouse: t.List[t.List[str]] = [
+        [
+            (
+                "#"
+                if x in (0, size - 1) or y in (0, size - 1)
+                else rng.choices("#O.", weights=[5, 20, 75])[0]
+            )
+            for x in range(size)
+        ]
+        for y in range(size)
+    ]
+    warehouse[rng.randint(1, size - 2)][rng.randint(1, size - 2)] = "@"
+    moves: str = "".join(rng.choices("<>^v", k=size * size))
+    return (
+        "".join("".join(row) + "\n" for row in warehouse)
+        + "\n"
+        + "".join(
+            moves[index : index + MOVES_LINE_LENGTH] + "\n"
+            for index in range(0, len(moves), MOVES_LINE_LENGTH)
+        )
+    )
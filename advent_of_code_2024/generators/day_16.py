@@ -0,0 +1,48 @@
+"""Synthetic input generator for the Day 16"""
+
+import random
+import typing as t
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a reindeer maze.
+
+    A perfect maze is carved with a randomized depth-first search, then a
+    few walls are removed so that several best paths may exist. The start
+    is in the bottom left corner and the end in the top right corner.
+
+    Args:
+        size (int): Maze side, rounded up to an odd number (at least 5).
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    size = max(size, 5) | 1
+    maze: t.List[t.List[str]] = [["#"] * size for _ in range(size)]
+    stack: t.List[t.Tuple[int, int]] = [(1, size - 2)]
+    maze[size - 2][1] = "."
+    while stack:
+        x, y = stack[-1]
+        neighbours: t.List[t.Tuple[int, int]] = [
+            (x + d_x, y + d_y)
+            for d_x, d_y in [(0, -2), (2, 0), (0, 2), (-2, 0)]
+            if 0 < x + d_x < size - 1
+            and 0 < y + d_y < size - 1
+            and maze[y + d_y][x + d_x] == "#"
+        ]
+        if not neighbours:
+            stack.pop()
+            continue
+        next_x, next_y = rng.choice(neighbours)
+        maze[(y + next_y) // 2][(x + next_x) // 2] = "."
+        maze[next_y][next_x] = "."
+        stack.append((next_x, next_y))
+    for _ in range(size * size // 20):
+        x, y = rng.randint(1, size - 2), rng.randint(1, size - 2)
+        if (x + y) % 2 == 1:
+            maze[y][x] = "."
+    maze[size - 2][1] = "S"
+    maze[1][size - 2] = "E"
+    return "".join("".join(row) + "\n" for row in maze)
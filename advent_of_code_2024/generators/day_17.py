@@ -0,0 +1,113 @@
+"""Synthetic input generator for the Day 17"""
+
+import random
+import typing as t
+
+# Usual shapes of the puzzle programs: the three lowest bits of register A
+# are mixed with two constants (k1, k2) and a shifted copy of register A,
+# one value is output and register A is shifted by three bits until zero.
+PROGRAM_TEMPLATES: t.List[t.Callable[[int, int], t.List[int]]] = [
+    lambda k1, k2: [2, 4, 1, k1, 7, 5, 1, k2, 4, 0, 0, 3, 5, 5, 3, 0],
+    lambda k1, k2: [2, 4, 1, k1, 7, 5, 1, k2, 4, 0, 5, 5, 0, 3, 3, 0],
+    lambda k1, k2: [2, 4, 1, k1, 7, 5, 4, 0, 1, k2, 5, 5, 0, 3, 3, 0],
+    lambda k1, k2: [2, 4, 1, k1, 7, 5, 0, 3, 4, 0, 1, k2, 5, 5, 3, 0],
+]
+
+
+def run_program(program: t.List[int], register_a: int) -> t.List[int]:
+    """Run a program with empty B and C registers.
+
+    Args:
+        program (t.List[int]): Program instructions.
+        register_a (int): Initial value of register A.
+
+    Returns:
+        t.List[int]: Program output.
+    """
+    registers: t.List[int] = [register_a, 0, 0]
+    output: t.List[int] = []
+    pointer: int = 0
+    while pointer < len(program) - 1:
+        opcode, operand = program[pointer], program[pointer + 1]
+        # Operand 7 is only valid as a literal operand.
+        combo: int = registers[operand - 4] if 4 <= operand < 7 else operand
+        pointer += 2
+        match opcode:
+            case 0:
+                registers[0] >>= combo
+            case 1:
+                registers[1] ^= operand
+            case 2:
+                registers[1] = combo % 8
+            case 3:
+                if registers[0]:
+                    pointer = operand
+            case 4:
+                registers[1] ^= registers[2]
+            case 5:
+                output.append(combo % 8)
+            case 6:
+                registers[1] = registers[0] >> combo
+            case 7:
+                registers[2] = registers[0] >> combo
+    return output
+
+
+def has_quine_register(program: t.List[int]) -> bool:
+    """Check that a register A value makes the program output itself.
+
+    Register A is built three bits at a time, from the last output value.
+
+    Args:
+        program (t.List[int]): Program instructions.
+
+    Returns:
+        bool: True if the part 2 of the puzzle has an answer.
+    """
+    candidates: t.List[int] = [0]
+    for index in range(len(program) - 1, -1, -1):
+        candidates = [
+            candidate * 8 + bits
+            for candidate in candidates
+            for bits in range(8)
+            if candidate * 8 + bits
+            and run_program(program, candidate * 8 + bits) == program[index:]
+        ]
+        if not candidates:
+            return False
+    return True
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate a computer and its program.
+
+    The program is picked among the usual shapes of the puzzle programs,
+    with constants for which register A can be fixed to make the program
+    output itself.
+
+    Args:
+        size (int): Number of 3 bits words of register A.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    register_a: int = rng.randrange(8 ** max(size - 1, 0), 8 ** max(size, 1))
+    candidates: t.List[t.List[int]] = [
+        template(k1, k2)
+        for template in PROGRAM_TEMPLATES
+        for k1 in range(8)
+        for k2 in range(8)
+    ]
+    rng.shuffle(candidates)
+    program: t.List[int] = next(
+        candidate for candidate in candidates if has_quine_register(candidate)
+    )
+    return (
+        f"Register A: {register_a}\n"
+        "Register B: 0\n"
+        "Register C: 0\n"
+        "\n"
+        f"Program: {','.join(str(value) for value in program)}\n"
+    )
@@ -0,0 +1,42 @@
+"""Synthetic input generator for the Day 18"""
+
+import random
+import typing as t
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate falling bytes positions.
+
+    Every cell of the memory space except the start and the end eventually
+    gets corrupted, so the path is always cut at some point. The cells of a
+    random staircase path from the start to the end fall last, so the exit
+    stays reachable for most of the bytes.
+
+    Args:
+        size (int): Highest coordinate of the memory space (70 in the
+            puzzle).
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    x, y = 0, 0
+    path: t.Set[t.Tuple[int, int]] = set()
+    while (x, y) != (size, size):
+        if y == size or (x < size and rng.random() < 0.5):
+            x += 1
+        else:
+            y += 1
+        path.add((x, y))
+    path.discard((size, size))
+    positions: t.List[t.Tuple[int, int]] = [
+        (x, y)
+        for y in range(size + 1)
+        for x in range(size + 1)
+        if (x, y) not in path and (x, y) not in ((0, 0), (size, size))
+    ]
+    path_positions: t.List[t.Tuple[int, int]] = sorted(path)
+    rng.shuffle(positions)
+    rng.shuffle(path_positions)
+    return "".join(f"{x},{y}\n" for x, y in positions + path_positions)
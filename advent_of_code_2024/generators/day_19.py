@@ -0,0 +1,39 @@
+"""Synthetic input generator for the Day 19"""
+
+import random
+import typing as t
+
+STRIPES: str = "wubrg"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Generate towel patterns and designs.
+
+    Most designs are concatenations of available patterns, the others are
+    random and usually impossible.
+
+    Args:
+        size (int): Number of designs.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Raw input.
+    """
+    rng: random.Random = random.Random(seed)
+    towels: t.List[str] = sorted(
+        {
+            "".join(rng.choices(STRIPES, k=rng.randint(1, 8)))
+            for _ in range(8 + size // 4)
+        }
+    )
+    designs: t.List[str] = []
+    for _ in range(size):
+        length: int = rng.randint(20, 60)
+        design: str = ""
+        if rng.random() < 0.6:
+            while len(design) < length:
+                design += rng.choice(towels)
+        else:
+            design = "".join(rng.choices(STRIPES, k=length))
+        designs.append(design)
+    return ", ".join(towels) + "\n\n" + "\n".join(designs) + "\n"
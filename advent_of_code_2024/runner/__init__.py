@@ -0,0 +1,529 @@
+"""Runner used to execute and measure the daily solutions"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+import typing as t
+
+from advent_of_code_2024.common import RawInput, map_input
+from advent_of_code_2024.common.budget import BudgetExceededError, reset_budget
+from advent_of_code_2024.common.counters import get_counters, reset_counters
+from advent_of_code_2024.runner.registry import (
+    PACKAGE_DIRECTORY,
+    get_default_registry,
+)
+from advent_of_code_2024.runner.store import (
+    ResultStore,
+    compute_input_hash,
+    compute_source_hash,
+)
+
+if t.TYPE_CHECKING:
+    import cProfile
+
+DEFAULT_PROFILE_DIRECTORY: str = ".profiles"
+PROFILE_TOP_FUNCTIONS: int = 20
+# Hexadecimal digits of the input path hash in the pstats file names.
+PROFILE_HASH_LENGTH: int = 8
+
+
+class SolutionReport:  # pylint: disable=too-many-instance-attributes
+    """Solution report class."""
+
+    day: int
+    part: int
+    input_path: str | None
+    status: str
+    answer: str | None
+    error: str | None
+    wall_time: float
+    cpu_time: float
+    peak_memory: int
+    cached: bool
+    counters: t.Dict[str, int]
+    profile: str | None
+    progress: t.Dict[str, t.Any] | None
+
+    def __init__(
+        self, day: int, part: int, input_path: str | None = None
+    ) -> None:
+        self.day = day
+        self.part = part
+        self.input_path = input_path
+        self.status = "pending"
+        self.answer = None
+        self.error = None
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.peak_memory = 0
+        self.cached = False
+        self.counters = {}
+        self.profile = None
+        self.progress = None
+
+    def __repr__(self) -> str:
+        return (
+            f"SolutionReport(Day: {self.day}, Part: {self.part}, "
+            f"Status: {self.status})"
+        )
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Convert the report to a JSON serializable dictionary.
+
+        Returns:
+            t.Dict[str, t.Any]: Report as a dictionary.
+        """
+        return {
+            "day": self.day,
+            "part": self.part,
+            "input_path": self.input_path,
+            "status": self.status,
+            "answer": self.answer,
+            "error": self.error,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_memory": self.peak_memory,
+            "cached": self.cached,
+            "counters": self.counters,
+            "profile": self.profile,
+            "progress": self.progress,
+        }
+
+
+def find_input_path(
+    day: int, part: int, input_directory: str | None = None
+) -> str:
+    """Find the input file of a day part.
+
+    Inside an input directory, a part specific file (day_XX_part_YY.txt)
+    takes precedence over the day file (day_XX.txt). Without input directory,
+    the input.txt file stored next to the part module is used.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        input_directory (str | None, optional):
+            Directory holding the inputs. Defaults to None.
+
+    Returns:
+        str: Path to the input file, which may not exist.
+    """
+    if input_directory is None:
+        return os.path.join(
+            PACKAGE_DIRECTORY,
+            f"day_{day:02d}",
+            f"part_{part:02d}",
+            "input.txt",
+        )
+    part_input_path: str = os.path.join(
+        input_directory, f"day_{day:02d}_part_{part:02d}.txt"
+    )
+    if os.path.isfile(part_input_path):
+        return part_input_path
+    return os.path.join(input_directory, f"day_{day:02d}.txt")
+
+
+def discover_solutions(
+    days: t.Collection[int] | None = None,
+    parts: t.Collection[int] | None = None,
+) -> t.List[t.Tuple[int, int]]:
+    """Discover the available day parts from the package directories.
+
+    The day parts are listed from the default solver registry, none of their
+    modules is imported.
+
+    Args:
+        days (t.Collection[int] | None, optional):
+            Days to keep. Defaults to None (all days).
+        parts (t.Collection[int] | None, optional):
+            Parts to keep. Defaults to None (all parts).
+
+    Returns:
+        t.List[t.Tuple[int, int]]: Sorted list of (day, part) tuples.
+    """
+    return get_default_registry().select(days, parts)
+
+
+def make_store_key(day: int, part: int, input_path: str) -> str:
+    """Build the result store key of a day part run on an input file.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        input_path (str): Path to the input file.
+
+    Returns:
+        str: Result store key.
+    """
+    return ResultStore.make_key(
+        day,
+        part,
+        compute_input_hash(input_path),
+        compute_source_hash(PACKAGE_DIRECTORY, day, part),
+    )
+
+
+def make_cached_report(
+    day: int, part: int, input_path: str, answer: str
+) -> SolutionReport:
+    """Build the report of an answer found in the result store.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        input_path (str): Path to the input file.
+        answer (str): Stored answer.
+
+    Returns:
+        SolutionReport: Cached report.
+    """
+    report: SolutionReport = SolutionReport(day, part, input_path)
+    report.status = "ok"
+    report.answer = answer
+    report.cached = True
+    return report
+
+
+def load_solver(report: SolutionReport) -> t.Callable[..., t.Any] | None:
+    """Load the solve function of the day part of a report.
+
+    Args:
+        report (SolutionReport): Report of the run, set to an
+            "import-error" status if the solution cannot be imported.
+
+    Returns:
+        t.Callable[..., t.Any] | None: Solve function, None if the
+            solution cannot be imported.
+    """
+    try:
+        return get_default_registry().load(report.day, report.part)
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        report.status = "import-error"
+        report.error = f"{type(exception).__name__}: {exception}"
+        return None
+
+
+def make_profile_name(day: int, part: int, input_path: str) -> str:
+    """Make the name of the pstats file of a day part run on an input.
+
+    The input file stem is followed by a short SHA-256 of its absolute path,
+    so that inputs of several directories, profiled concurrently, get their
+    own file.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        input_path (str): Path to the input file.
+
+    Returns:
+        str: File name, day_XX_part_YY_<stem>_<hash>.prof.
+    """
+    stem: str = os.path.splitext(os.path.basename(input_path))[0]
+    path_hash: str = hashlib.sha256(
+        os.path.abspath(input_path).encode("utf-8")
+    ).hexdigest()[:PROFILE_HASH_LENGTH]
+    return f"day_{day:02d}_part_{part:02d}_{stem}_{path_hash}.prof"
+
+
+def save_profile(
+    profiler: "cProfile.Profile",
+    profile_directory: str,
+    day: int,
+    part: int,
+    input_path: str,
+) -> str:
+    """Save the statistics of a profiled run and summarize them.
+
+    The statistics are written to a temporary file first, then moved in
+    place, so that a concurrent run of the same input never leaves a
+    partial file.
+
+    Args:
+        profiler (cProfile.Profile): Profiler of the run.
+        profile_directory (str): Directory of the pstats files.
+        day (int): Day number.
+        part (int): Part number.
+        input_path (str): Path to the input file of the run.
+
+    Returns:
+        str: Path of the pstats file followed by the functions taking the
+            most cumulative time.
+    """
+    import pstats  # pylint: disable=import-outside-toplevel
+
+    os.makedirs(profile_directory, exist_ok=True)
+    profile_path: str = os.path.join(
+        profile_directory,
+        make_profile_name(day, part, input_path),
+    )
+    temporary_path: str = f"{profile_path}.{os.getpid()}.tmp"
+    profiler.dump_stats(temporary_path)
+    os.replace(temporary_path, profile_path)
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).strip_dirs().sort_stats(
+        pstats.SortKey.CUMULATIVE
+    ).print_stats(PROFILE_TOP_FUNCTIONS)
+    return f"{profile_path}\n{summary.getvalue().strip()}"
+
+
+def measure_solution(
+    report: SolutionReport,
+    solve: t.Callable[..., t.Any],
+    raw_input: RawInput,
+    profiler: "cProfile.Profile | None" = None,
+    trace_memory: bool = True,
+) -> None:
+    """Run a solve function on a raw input and record it in a report.
+
+    Anything printed by the solution is redirected to the standard error,
+    and the counters it reports are attached to the report. The clock of
+    the budget starts with the run: a solution exceeding it is aborted with
+    a "budget-exceeded" status, and the progress it made is attached.
+
+    Args:
+        report (SolutionReport): Report of the run, updated in place.
+        solve (t.Callable[..., t.Any]): Solve function.
+        raw_input (RawInput): Raw input.
+        profiler (cProfile.Profile | None, optional):
+            Profiler running the solution. Defaults to None.
+        trace_memory (bool, optional): Measure the peak memory with
+            tracemalloc, which slows the solution down. Defaults to True.
+    """
+    reset_counters()
+    if trace_memory:
+        tracemalloc.start()
+    # The memory baseline is taken once the memory is traced.
+    reset_budget()
+    wall_start: float = time.perf_counter()
+    cpu_start: float = time.process_time()
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            report.answer = str(
+                solve(raw_input)
+                if profiler is None
+                else profiler.runcall(solve, raw_input)
+            )
+        report.status = "ok"
+    except BudgetExceededError as exception:
+        report.status = "budget-exceeded"
+        report.error = str(exception)
+        report.progress = exception.progress.to_dict()
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        report.status = "error"
+        report.error = f"{type(exception).__name__}: {exception}"
+    finally:
+        report.cpu_time = time.process_time() - cpu_start
+        report.wall_time = time.perf_counter() - wall_start
+        if trace_memory:
+            _, report.peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    report.counters = get_counters()
+
+
+def run_solution(
+    day: int,
+    part: int,
+    input_path: str | None = None,
+    store: ResultStore | None = None,
+    profile_directory: str | None = None,
+) -> SolutionReport:
+    """Run the solve function of a day part and measure it.
+
+    The input file is memory-mapped before the measurement starts, its pages
+    are only loaded when the solution parses them. Anything printed
+    by the solution is redirected to the standard error, so that the standard
+    output only holds the reports.
+
+    When a result store is given, an answer already computed for the same
+    input and the same sources is returned without running the solution.
+
+    When a profile directory is given, the solution runs under cProfile and
+    its statistics are saved in a day_XX_part_YY_<input>.prof file. The counters
+    reported by the solution are attached to the report when enabled.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        input_path (str | None, optional):
+            Path to the input file. Defaults to None (part input.txt file).
+        store (ResultStore | None, optional):
+            Store of the known answers. Defaults to None.
+        profile_directory (str | None, optional):
+            Directory of the pstats files. Defaults to None (no profiling).
+
+    Returns:
+        SolutionReport: Report of the run.
+    """
+    input_path = input_path or find_input_path(day, part)
+    report: SolutionReport = SolutionReport(day, part, input_path)
+    solve: t.Callable[..., t.Any] | None = load_solver(report)
+    if solve is None:
+        return report
+
+    if not os.path.isfile(input_path):
+        report.status = "missing-input"
+        report.error = f"Input file {input_path} not found"
+        return report
+
+    store_key: str | None = None
+    if store is not None:
+        store_key = make_store_key(day, part, input_path)
+        answer: str | None = store.get(store_key)
+        if answer is not None:
+            return make_cached_report(day, part, input_path, answer)
+    profiler: "cProfile.Profile | None" = None
+    if profile_directory is not None:
+        # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+        import cProfile
+
+        profiler = cProfile.Profile()
+    with map_input(input_path) as raw_input:
+        measure_solution(report, solve, raw_input, profiler)
+    if profiler is not None:
+        report.profile = save_profile(
+            profiler, t.cast(str, profile_directory), day, part, input_path
+        )
+    if store is not None and store_key is not None and report.status == "ok":
+        store.put(store_key, t.cast(str, report.answer))
+    return report
+
+
+def run_solutions(
+    solutions: t.Iterable[t.Tuple[int, int]],
+    input_directory: str | None = None,
+    store: ResultStore | None = None,
+    profile_directory: str | None = None,
+) -> t.Generator[SolutionReport, None, None]:
+    """Run several day parts one after the other.
+
+    Args:
+        solutions (t.Iterable[t.Tuple[int, int]]): (day, part) tuples.
+        input_directory (str | None, optional):
+            Directory holding the inputs. Defaults to None.
+        store (ResultStore | None, optional):
+            Store of the known answers. Defaults to None.
+        profile_directory (str | None, optional):
+            Directory of the pstats files. Defaults to None (no profiling).
+
+    Yields:
+        SolutionReport: Report of each run.
+    """
+    for day, part in solutions:
+        yield run_solution(
+            day,
+            part,
+            find_input_path(day, part, input_directory),
+            store,
+            profile_directory,
+        )
+
+
+def format_memory(size: int) -> str:
+    """Format a memory size in a human readable way.
+
+    Args:
+        size (int): Size in bytes.
+
+    Returns:
+        str: Formatted size.
+    """
+    value: float = float(size)
+    for unit in ["B", "KiB", "MiB"]:
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def format_table(reports: t.List[SolutionReport]) -> str:
+    """Format reports as a text table.
+
+    Args:
+        reports (t.List[SolutionReport]): Reports to format.
+
+    Returns:
+        str: Text table.
+    """
+    header: t.List[str] = [
+        "Day",
+        "Part",
+        "Status",
+        "Wall (s)",
+        "CPU (s)",
+        "Peak memory",
+        "Answer",
+    ]
+    rows: t.List[t.List[str]] = [
+        [
+            f"{report.day:02d}",
+            f"{report.part:02d}",
+            report.status + (" (cached)" if report.cached else ""),
+            f"{report.wall_time:.4f}",
+            f"{report.cpu_time:.4f}",
+            format_memory(report.peak_memory),
+            (report.answer if report.error is None else report.error) or "",
+        ]
+        for report in reports
+    ]
+    widths: t.List[int] = [
+        max(len(row[column]) for row in [header] + rows)
+        for column in range(len(header) - 1)
+    ]
+    return "\n".join(
+        " | ".join(
+            [cell.ljust(width) for cell, width in zip(row, widths)] + [row[-1]]
+        ).rstrip()
+        for row in [header] + rows
+    )
+
+
+def format_details(reports: t.List[SolutionReport]) -> str:
+    """Format the counters, the profiles and the progress of the reports.
+
+    Args:
+        reports (t.List[SolutionReport]): Reports to format.
+
+    Returns:
+        str: Counters, profile summary and progress of the aborted runs of
+            each report, empty if none.
+    """
+    sections: t.List[str] = []
+    for report in reports:
+        title: str = f"Day {report.day:02d} - Part {report.part:02d}"
+        if report.counters:
+            sections.append(
+                f"{title} counters: "
+                + ", ".join(
+                    f"{name}={value}"
+                    for name, value in sorted(report.counters.items())
+                )
+            )
+        if report.profile is not None:
+            sections.append(f"{title} profile: {report.profile}")
+        if report.progress is not None:
+            sections.append(
+                f"{title} progress: "
+                + ", ".join(
+                    f"{name}={value}"
+                    for name, value in report.progress.items()
+                    if value is not None
+                )
+            )
+    return "\n\n".join(sections)
+
+
+def format_json(reports: t.List[SolutionReport]) -> str:
+    """Format reports as a JSON document.
+
+    Args:
+        reports (t.List[SolutionReport]): Reports to format.
+
+    Returns:
+        str: JSON document.
+    """
+    return json.dumps([report.to_dict() for report in reports], indent=2)
@@ -0,0 +1,189 @@
+"""Batch runs of the daily solutions over many inputs, streamed as JSONL"""
+
+import json
+import os
+import re
+import typing as t
+
+from advent_of_code_2024.common.parse_cache import set_memory_parse_cache
+from advent_of_code_2024.runner import SolutionReport, run_solution
+from advent_of_code_2024.runner.registry import get_default_registry
+
+# Input file names: day_XX.txt, day_XX_part_YY.txt, or any day_XX prefixed
+# name such as day_XX_alice.txt.
+INPUT_FILE_REGEX: re.Pattern[str] = re.compile(
+    r"^day_(\d+)(?:_part_(\d+))?(?:[_.-].*)?\.txt$"
+)
+# Directories of inputs of a single day: day_XX/*.txt.
+DAY_DIRECTORY_REGEX: re.Pattern[str] = re.compile(r"^day_(\d+)$")
+INPUT_EXTENSION: str = ".txt"
+
+
+class BatchInput:  # pylint: disable=too-few-public-methods
+    """Batch input class: one input file and the parts to run on it."""
+
+    day: int
+    input_path: str
+    parts: t.List[int] | None
+
+    def __init__(
+        self, day: int, input_path: str, parts: t.List[int] | None = None
+    ) -> None:
+        self.day = day
+        self.input_path = input_path
+        self.parts = parts
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchInput(Day: {self.day}, Parts: {self.parts}, "
+            f"Input: {self.input_path})"
+        )
+
+
+def scan_input_directory(directory: str) -> t.Iterator[BatchInput]:
+    """List the inputs of a directory, lazily.
+
+    Inputs are the day_XX*.txt files of the directory (a day_XX_part_YY*.txt
+    file only runs its part) and the .txt files of its day_XX directories.
+    They are yielded in directory order, without listing the whole
+    directory first.
+
+    Args:
+        directory (str): Input directory.
+
+    Yields:
+        BatchInput: Each input found.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                day_match = DAY_DIRECTORY_REGEX.match(entry.name)
+                if day_match is None:
+                    continue
+                with os.scandir(entry.path) as day_entries:
+                    for day_entry in day_entries:
+                        if day_entry.is_file() and day_entry.name.endswith(
+                            INPUT_EXTENSION
+                        ):
+                            yield BatchInput(
+                                int(day_match.group(1)), day_entry.path
+                            )
+                continue
+            file_match = INPUT_FILE_REGEX.match(entry.name)
+            if file_match is None or not entry.is_file():
+                continue
+            yield BatchInput(
+                int(file_match.group(1)),
+                entry.path,
+                (
+                    [int(file_match.group(2))]
+                    if file_match.group(2) is not None
+                    else None
+                ),
+            )
+
+
+def read_manifest(manifest_path: str) -> t.Iterator[BatchInput]:
+    """Read the inputs of a manifest, one line at a time.
+
+    Each non-empty line of the manifest is a JSON object such as
+    {"day": 1, "input": "inputs/alice.txt", "parts": [2]}, "parts" being
+    optional. Relative input paths are relative to the manifest directory.
+
+    Args:
+        manifest_path (str): Path to the manifest.
+
+    Raises:
+        ValueError: If a line is not a valid input description.
+
+    Yields:
+        BatchInput: Each input of the manifest.
+    """
+    manifest_directory: str = os.path.dirname(manifest_path)
+    with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+        for line_number, line in enumerate(manifest_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry: t.Dict[str, t.Any] = json.loads(line)
+                parts: t.List[int] | None = entry.get("parts")
+                yield BatchInput(
+                    int(entry["day"]),
+                    os.path.join(manifest_directory, entry["input"]),
+                    (
+                        [int(part) for part in parts]
+                        if parts is not None
+                        else None
+                    ),
+                )
+            except (ValueError, KeyError, TypeError) as exception:
+                raise ValueError(
+                    f"Invalid manifest line {line_number}: {exception}"
+                ) from exception
+
+
+def iter_batch_inputs(source: str) -> t.Iterator[BatchInput]:
+    """List the inputs of a directory or of a manifest file.
+
+    Args:
+        source (str): Input directory or manifest path.
+
+    Returns:
+        t.Iterator[BatchInput]: Inputs, read lazily.
+    """
+    if os.path.isdir(source):
+        return scan_input_directory(source)
+    return read_manifest(source)
+
+
+def run_batch(
+    inputs: t.Iterable[BatchInput],
+    days: t.Collection[int] | None = None,
+    parts: t.Collection[int] | None = None,
+) -> t.Generator[SolutionReport, None, None]:
+    """Run the selected day parts on each input, one input at a time.
+
+    The parts of an input run one after the other and share its parsed
+    structures through the in-memory parse cache, which is dropped before
+    the next input: memory stays bounded by the largest input, whatever
+    the number of inputs.
+
+    Args:
+        inputs (t.Iterable[BatchInput]): Inputs to run.
+        days (t.Collection[int] | None, optional):
+            Days to keep. Defaults to None (all days).
+        parts (t.Collection[int] | None, optional):
+            Parts to keep. Defaults to None (all parts).
+
+    Yields:
+        SolutionReport: Report of each run, in input order.
+    """
+    registry = get_default_registry()
+    for batch_input in inputs:
+        if days is not None and batch_input.day not in days:
+            continue
+        selected_parts: t.List[int] = [
+            part
+            for _, part in registry.select([batch_input.day], parts)
+            if batch_input.parts is None or part in batch_input.parts
+        ]
+        set_memory_parse_cache(True)
+        try:
+            for part in selected_parts:
+                yield run_solution(
+                    batch_input.day, part, batch_input.input_path
+                )
+        finally:
+            set_memory_parse_cache(False)
+
+
+def format_json_line(report: SolutionReport) -> str:
+    """Format a report as a single JSON line.
+
+    Args:
+        report (SolutionReport): Report to format.
+
+    Returns:
+        str: Compact JSON object, without newline.
+    """
+    return json.dumps(report.to_dict(), separators=(",", ":"))
@@ -0,0 +1,327 @@
+"""Long-running solver daemon answering JSON requests with warm state"""
+
+import io
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+import typing as t
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+
+from advent_of_code_2024.common import map_input
+from advent_of_code_2024.common.backend import get_backend, set_backend
+from advent_of_code_2024.common.budget import Budget, get_budget, set_budget
+from advent_of_code_2024.common.parallel import (
+    get_parallel_mode,
+    get_parallel_workers,
+    set_parallel_mode,
+)
+from advent_of_code_2024.common.parse_cache import (
+    get_parse_cache_directory,
+    set_memory_parse_cache,
+    set_parse_cache_directory,
+)
+from advent_of_code_2024.runner import (
+    SolutionReport,
+    load_solver,
+    measure_solution,
+)
+from advent_of_code_2024.runner.registry import get_default_registry
+
+# Parsed inputs kept in memory by each worker.
+MEMORY_PARSE_CACHE_ENTRIES: int = 64
+PING_COMMAND: str = "ping"
+
+
+def initialize_daemon_worker(
+    solutions: t.List[t.Tuple[int, int]],
+    settings: t.Tuple[str | None, str, int, str, Budget | None],
+) -> None:
+    """Warm a daemon worker up: import the solutions and enable the cache.
+
+    Args:
+        solutions (t.List[t.Tuple[int, int]]):
+            (day, part) tuples of the solutions to import.
+        settings (t.Tuple[str | None, str, int, str, Budget | None]):
+            Parse cache directory, parallel mode, parallel workers, backend
+            and budget of the main process.
+    """
+    (
+        parse_cache_directory,
+        parallel_mode,
+        parallel_workers,
+        backend,
+        budget,
+    ) = settings
+    set_parse_cache_directory(parse_cache_directory)
+    set_parallel_mode(parallel_mode, parallel_workers)
+    set_backend(backend)
+    set_budget(budget)
+    set_memory_parse_cache(True, MEMORY_PARSE_CACHE_ENTRIES)
+    registry = get_default_registry()
+    for day, part in solutions:
+        try:
+            registry.load(day, part)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Reported by the requests of this part.
+            continue
+
+
+def handle_request(
+    request: t.Dict[str, t.Any], trace_memory: bool = False
+) -> t.Dict[str, t.Any]:
+    """Answer a solve request.
+
+    A request holds the "day" and "part" to run and either the raw "input"
+    text or an "input_path", plus an optional "id" copied in the response.
+
+    Args:
+        request (t.Dict[str, t.Any]): Decoded request.
+        trace_memory (bool, optional): Measure the peak memory of the
+            solution. Defaults to False.
+
+    Returns:
+        t.Dict[str, t.Any]: Response: the report of the run and the request
+            id.
+    """
+    try:
+        day: int = int(request["day"])
+        part: int = int(request["part"])
+    except (KeyError, TypeError, ValueError) as exception:
+        return make_error_response(request, f"Invalid day or part: {exception}")
+    input_path: str | None = request.get("input_path")
+    report: SolutionReport = SolutionReport(day, part, input_path)
+    solve: t.Callable[..., t.Any] | None = load_solver(report)
+    if solve is not None:
+        if input_path is not None:
+            if os.path.isfile(input_path):
+                with map_input(input_path) as raw_input:
+                    measure_solution(
+                        report, solve, raw_input, trace_memory=trace_memory
+                    )
+            else:
+                report.status = "missing-input"
+                report.error = f"Input file {input_path} not found"
+        elif isinstance(request.get("input"), str):
+            measure_solution(
+                report, solve, request["input"], trace_memory=trace_memory
+            )
+        else:
+            return make_error_response(request, "Missing input or input_path")
+    return {"id": request.get("id"), **report.to_dict()}
+
+
+def make_error_response(
+    request: t.Dict[str, t.Any], error: str
+) -> t.Dict[str, t.Any]:
+    """Build the response of an invalid request.
+
+    Args:
+        request (t.Dict[str, t.Any]): Decoded request.
+        error (str): Error message.
+
+    Returns:
+        t.Dict[str, t.Any]: Response with a "bad-request" status.
+    """
+    return {"id": request.get("id"), "status": "bad-request", "error": error}
+
+
+class SolverDaemon:
+    """Solver daemon class: pool of warm workers answering JSON requests.
+
+    With a single worker, the requests run one after the other in a thread
+    of the daemon process, without any pickling. With more workers, they
+    run concurrently in processes, each one keeping its own imported
+    modules and parsed inputs.
+    """
+
+    executor: Executor
+    trace_memory: bool
+
+    def __init__(
+        self,
+        solutions: t.List[t.Tuple[int, int]],
+        workers: int = 1,
+        trace_memory: bool = False,
+    ) -> None:
+        settings: t.Tuple[str | None, str, int, str, Budget | None] = (
+            get_parse_cache_directory(),
+            get_parallel_mode(),
+            get_parallel_workers(),
+            get_backend(),
+            get_budget(),
+        )
+        self.trace_memory = trace_memory
+        if workers == 1:
+            initialize_daemon_worker(solutions, settings)
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers or None,
+                initializer=initialize_daemon_worker,
+                initargs=(solutions, settings),
+            )
+
+    def __repr__(self) -> str:
+        return f"SolverDaemon(Executor: {type(self.executor).__name__})"
+
+    def submit(self, line: str) -> "Future[t.Dict[str, t.Any]]":
+        """Decode a request line and schedule its answer.
+
+        Args:
+            line (str): JSON request.
+
+        Returns:
+            Future[t.Dict[str, t.Any]]: Future response.
+        """
+        future: "Future[t.Dict[str, t.Any]]"
+        try:
+            request: t.Any = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request is a JSON object")
+        except ValueError as exception:
+            future = Future()
+            future.set_result(
+                make_error_response({}, f"Invalid request: {exception}")
+            )
+            return future
+        if request.get("command") == PING_COMMAND:
+            future = Future()
+            future.set_result({"id": request.get("id"), "status": "ok"})
+            return future
+        return self.executor.submit(handle_request, request, self.trace_memory)
+
+    def serve_stream(
+        self, input_stream: t.TextIO, output_stream: t.TextIO
+    ) -> None:
+        """Answer the requests of a stream, one JSON object per line.
+
+        Responses are written as soon as they are ready, so they may come
+        out of order: the "id" of a request identifies its response.
+
+        Args:
+            input_stream (t.TextIO): Stream of the requests.
+            output_stream (t.TextIO): Stream of the responses.
+        """
+        lock: threading.Lock = threading.Lock()
+        # Responses not written yet, waited for at the end of the stream.
+        pending: t.Set["Future[t.Dict[str, t.Any]]"] = set()
+
+        def write_response(future: "Future[t.Dict[str, t.Any]]") -> None:
+            try:
+                response: t.Dict[str, t.Any] = future.result()
+            # pylint: disable-next=broad-exception-caught
+            except Exception as exception:
+                # The worker process running the request crashed.
+                response = make_error_response(
+                    {}, f"{type(exception).__name__}: {exception}"
+                )
+                response["status"] = "error"
+            with lock:
+                output_stream.write(
+                    json.dumps(response, separators=(",", ":")) + "\n"
+                )
+                output_stream.flush()
+                pending.discard(future)
+
+        for line in input_stream:
+            if not line.strip():
+                continue
+            future: "Future[t.Dict[str, t.Any]]" = self.submit(line)
+            with lock:
+                pending.add(future)
+            future.add_done_callback(write_response)
+        with lock:
+            remaining: t.List["Future[t.Dict[str, t.Any]]"] = list(pending)
+        wait(remaining)
+
+    def serve_unix_socket(self, socket_path: str) -> None:
+        """Answer the requests of the clients of a Unix domain socket.
+
+        Each connection is served in its own thread, as a stream of
+        requests, until it is closed. The daemon serves until it receives
+        SIGINT or SIGTERM.
+
+        Args:
+            socket_path (str): Path of the socket, removed on exit.
+        """
+        daemon: SolverDaemon = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            """Handler of a client connection."""
+
+            def handle(self) -> None:
+                input_stream = io.TextIOWrapper(
+                    t.cast(t.BinaryIO, self.rfile), encoding="utf-8"
+                )
+                output_stream = io.TextIOWrapper(
+                    t.cast(t.BinaryIO, self.wfile),
+                    encoding="utf-8",
+                    write_through=True,
+                )
+                try:
+                    daemon.serve_stream(input_stream, output_stream)
+                finally:
+                    # The handler closes the socket files itself.
+                    input_stream.detach()
+                    output_stream.detach()
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        with socketserver.ThreadingUnixStreamServer(
+            socket_path, RequestHandler
+        ) as server:
+            server.daemon_threads = True
+            # Stop serving on SIGTERM as on SIGINT: shutdown waits for
+            # serve_forever, so it is called from another thread.
+            signal.signal(
+                signal.SIGTERM,
+                lambda *_: threading.Thread(target=server.shutdown).start(),
+            )
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.remove(socket_path)
+
+    def close(self) -> None:
+        """Stop the workers once the scheduled requests are answered."""
+        self.executor.shutdown(wait=True)
+
+
+def serve(
+    solutions: t.List[t.Tuple[int, int]],
+    socket_path: str | None = None,
+    workers: int = 1,
+    trace_memory: bool = False,
+) -> None:
+    """Run a solver daemon on a Unix socket, or on the standard streams.
+
+    Args:
+        solutions (t.List[t.Tuple[int, int]]):
+            (day, part) tuples of the solutions imported at startup.
+        socket_path (str | None, optional): Path of the Unix domain socket.
+            Defaults to None (requests on the standard input, responses on
+            the standard output).
+        workers (int, optional): Number of workers, 0 for one per CPU.
+            Defaults to 1 (requests run in the daemon process).
+        trace_memory (bool, optional): Measure the peak memory of the
+            solutions. Defaults to False.
+    """
+    daemon: SolverDaemon = SolverDaemon(solutions, workers, trace_memory)
+    try:
+        if socket_path is None:
+            daemon.serve_stream(sys.stdin, sys.stdout)
+        else:
+            daemon.serve_unix_socket(socket_path)
+    finally:
+        daemon.close()
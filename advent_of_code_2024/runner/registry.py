@@ -0,0 +1,147 @@
+"""Registry of the solvers entry points, imported on first use"""
+
+import importlib
+import os
+import re
+import typing as t
+
+PACKAGE_NAME: str = "advent_of_code_2024"
+PACKAGE_DIRECTORY: str = os.path.dirname(os.path.dirname(__file__))
+DAY_DIRECTORY_REGEX: re.Pattern[str] = re.compile(r"^day_(\d+)$")
+PART_DIRECTORY_REGEX: re.Pattern[str] = re.compile(r"^part_(\d+)$")
+SOLVER_FUNCTION_NAME: str = "solve"
+
+# pylint: disable-next=invalid-name
+_default_registry: t.Optional["SolverRegistry"] = None
+
+
+def get_module_name(day: int, part: int) -> str:
+    """Get the name of the module holding the solution of a day part.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+
+    Returns:
+        str: Fully qualified module name.
+    """
+    return f"{PACKAGE_NAME}.day_{day:02d}.part_{part:02d}.main"
+
+
+class SolverRegistry:
+    """Solver registry class: entry point of each day part, by name.
+
+    Entry points are "module:function" names, recorded without importing
+    anything: the module of a day part is only imported when the part is
+    loaded, so selecting and listing parts stays cheap and a part with a
+    missing dependency only fails when it runs.
+    """
+
+    entry_points: t.Dict[t.Tuple[int, int], str]
+    solvers: t.Dict[t.Tuple[int, int], t.Callable[..., t.Any]]
+
+    def __init__(self) -> None:
+        self.entry_points = {}
+        self.solvers = {}
+
+    def __repr__(self) -> str:
+        return f"SolverRegistry(Solvers: {len(self.entry_points)})"
+
+    def register(self, day: int, part: int, entry_point: str) -> None:
+        """Record the entry point of a day part.
+
+        Args:
+            day (int): Day number.
+            part (int): Part number.
+            entry_point (str): "module:function" name of the solve function.
+        """
+        self.entry_points[(day, part)] = entry_point
+        self.solvers.pop((day, part), None)
+
+    def discover(self, package_directory: str = PACKAGE_DIRECTORY) -> None:
+        """Register the day parts found in the package directories.
+
+        Args:
+            package_directory (str, optional): Package directory.
+                Defaults to the advent_of_code_2024 package.
+        """
+        for day_directory in os.listdir(package_directory):
+            day_match = DAY_DIRECTORY_REGEX.match(day_directory)
+            if day_match is None:
+                continue
+            day: int = int(day_match.group(1))
+            day_path: str = os.path.join(package_directory, day_directory)
+            for part_directory in os.listdir(day_path):
+                part_match = PART_DIRECTORY_REGEX.match(part_directory)
+                if part_match is None or not os.path.isfile(
+                    os.path.join(day_path, part_directory, "main.py")
+                ):
+                    continue
+                part: int = int(part_match.group(1))
+                self.register(
+                    day,
+                    part,
+                    f"{get_module_name(day, part)}:{SOLVER_FUNCTION_NAME}",
+                )
+
+    def select(
+        self,
+        days: t.Collection[int] | None = None,
+        parts: t.Collection[int] | None = None,
+    ) -> t.List[t.Tuple[int, int]]:
+        """Select registered day parts.
+
+        Args:
+            days (t.Collection[int] | None, optional):
+                Days to keep. Defaults to None (all days).
+            parts (t.Collection[int] | None, optional):
+                Parts to keep. Defaults to None (all parts).
+
+        Returns:
+            t.List[t.Tuple[int, int]]: Sorted list of (day, part) tuples.
+        """
+        return sorted(
+            (day, part)
+            for day, part in self.entry_points
+            if (days is None or day in days)
+            and (parts is None or part in parts)
+        )
+
+    def load(self, day: int, part: int) -> t.Callable[..., t.Any]:
+        """Import the solve function of a day part.
+
+        Parts that were never registered are loaded from their conventional
+        module.
+
+        Args:
+            day (int): Day number.
+            part (int): Part number.
+
+        Returns:
+            t.Callable[..., t.Any]: Solve function.
+        """
+        solver: t.Callable[..., t.Any] | None = self.solvers.get((day, part))
+        if solver is None:
+            module_name, _, function_name = self.entry_points.get(
+                (day, part),
+                f"{get_module_name(day, part)}:{SOLVER_FUNCTION_NAME}",
+            ).partition(":")
+            solver = t.cast(
+                t.Callable[..., t.Any],
+                getattr(importlib.import_module(module_name), function_name),
+            )
+            self.solvers[(day, part)] = solver
+        return solver
+
+
+def get_default_registry() -> SolverRegistry:
+    """Get the registry of the package day parts, discovered on first use.
+
+    Returns:
+        SolverRegistry: Default registry.
+    """
+    global _default_registry  # pylint: disable=global-statement
+    if _default_registry is None:
+        _default_registry = SolverRegistry()
+        _default_registry.discover()
+    return _default_registry
@@ -0,0 +1,273 @@
+"""Scheduler running the daily solutions in a pool of processes"""
+
+import math
+import os
+import typing as t
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+
+from advent_of_code_2024.common.backend import get_backend, set_backend
+from advent_of_code_2024.common.budget import Budget, get_budget, set_budget
+from advent_of_code_2024.common.counters import (
+    are_counters_enabled,
+    set_counters_enabled,
+)
+from advent_of_code_2024.common.parallel import (
+    get_parallel_mode,
+    get_parallel_workers,
+    set_parallel_mode,
+)
+from advent_of_code_2024.common.parse_cache import (
+    get_parse_cache_directory,
+    set_memory_parse_cache,
+    set_parse_cache_directory,
+)
+from advent_of_code_2024.common.render import get_verbosity, set_verbosity
+from advent_of_code_2024.runner import (
+    SolutionReport,
+    make_cached_report,
+    make_store_key,
+    run_solution,
+)
+from advent_of_code_2024.runner.store import ResultStore, make_timing_key
+
+
+class Job:  # pylint: disable=too-few-public-methods
+    """Job class: one day part to run on one input file."""
+
+    day: int
+    part: int
+    input_path: str
+
+    def __init__(self, day: int, part: int, input_path: str) -> None:
+        self.day = day
+        self.part = part
+        self.input_path = input_path
+
+    def __repr__(self) -> str:
+        return (
+            f"Job(Day: {self.day}, Part: {self.part}, "
+            f"Input: {self.input_path})"
+        )
+
+
+class JobGroup:
+    """Job group class: parts of a day sharing the same input file.
+
+    The parts of a group run one after the other in the same worker, so
+    the input parsed by the first part is reused by the next ones.
+    """
+
+    day: int
+    input_path: str
+    parts: t.List[int]
+
+    def __init__(self, day: int, input_path: str) -> None:
+        self.day = day
+        self.input_path = input_path
+        self.parts = []
+
+    def __repr__(self) -> str:
+        return (
+            f"JobGroup(Day: {self.day}, Parts: {self.parts}, "
+            f"Input: {self.input_path})"
+        )
+
+    def estimate_duration(self, timings: t.Dict[str, float]) -> float:
+        """Estimate the duration of the group from the recorded timings.
+
+        Args:
+            timings (t.Dict[str, float]): Recorded wall times.
+
+        Returns:
+            float: Estimated duration, infinite if a part was never timed.
+        """
+        return sum(
+            timings.get(make_timing_key(self.day, part), math.inf)
+            for part in self.parts
+        )
+
+
+def group_jobs(jobs: t.Iterable[Job]) -> t.List[JobGroup]:
+    """Group the jobs by day and input file.
+
+    Args:
+        jobs (t.Iterable[Job]): Jobs to group.
+
+    Returns:
+        t.List[JobGroup]: Job groups.
+    """
+    groups: t.Dict[t.Tuple[int, str], JobGroup] = {}
+    for job in jobs:
+        group: JobGroup = groups.setdefault(
+            (job.day, job.input_path), JobGroup(job.day, job.input_path)
+        )
+        group.parts.append(job.part)
+    return list(groups.values())
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def initialize_worker(
+    parse_cache_directory: str | None,
+    parallel_mode: str,
+    parallel_workers: int,
+    counters_enabled: bool,
+    backend: str,
+    verbosity: int,
+    budget: Budget | None,
+) -> None:
+    """Apply the settings of the main process to a worker process.
+
+    Args:
+        parse_cache_directory (str | None): Parse cache directory.
+        parallel_mode (str): Parallel mode of the solutions inner loops.
+        parallel_workers (int): Number of parallel workers.
+        counters_enabled (bool): Whether the solutions counters are recorded.
+        backend (str): Backend of the vectorisable solutions.
+        verbosity (int): Verbosity of the solutions debug output.
+        budget (Budget | None): Time and memory budget of each run.
+    """
+    set_parse_cache_directory(parse_cache_directory)
+    set_parallel_mode(parallel_mode, parallel_workers)
+    set_counters_enabled(counters_enabled)
+    set_backend(backend)
+    set_verbosity(verbosity)
+    set_budget(budget)
+
+
+def run_job_group(
+    day: int,
+    parts: t.List[int],
+    input_path: str,
+    profile_directory: str | None = None,
+) -> t.List[SolutionReport]:
+    """Run the parts of a job group, in a worker process.
+
+    Args:
+        day (int): Day number.
+        parts (t.List[int]): Part numbers.
+        input_path (str): Path to the input file.
+        profile_directory (str | None, optional):
+            Directory of the pstats files. Defaults to None (no profiling).
+
+    Returns:
+        t.List[SolutionReport]: Report of each part.
+    """
+    set_memory_parse_cache(True)
+    try:
+        return [
+            run_solution(day, part, input_path, None, profile_directory)
+            for part in parts
+        ]
+    finally:
+        set_memory_parse_cache(False)
+
+
+def collect_reports(
+    future: "Future[t.List[SolutionReport]]", group: JobGroup
+) -> t.List[SolutionReport]:
+    """Get the reports of a finished job group.
+
+    Args:
+        future (Future[t.List[SolutionReport]]): Finished job group future.
+        group (JobGroup): Job group.
+
+    Returns:
+        t.List[SolutionReport]: Report of each part, error reports if the
+            worker failed.
+    """
+    try:
+        return future.result()
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        reports: t.List[SolutionReport] = []
+        for part in group.parts:
+            report: SolutionReport = SolutionReport(
+                group.day, part, group.input_path
+            )
+            report.status = "error"
+            report.error = f"{type(exception).__name__}: {exception}"
+            reports.append(report)
+        return reports
+
+
+def schedule_jobs(
+    jobs: t.Iterable[Job],
+    workers: int | None = None,
+    store: ResultStore | None = None,
+    timings: t.Dict[str, float] | None = None,
+    profile_directory: str | None = None,
+) -> t.Generator[SolutionReport, None, None]:
+    """Run jobs in a pool of processes and yield reports as they finish.
+
+    Answers found in the result store are yielded first. The other jobs are
+    grouped by day and input, and the groups are submitted longest first
+    according to the recorded timings (never timed groups first).
+
+    Args:
+        jobs (t.Iterable[Job]): Jobs to run.
+        workers (int | None, optional):
+            Number of processes. Defaults to None (number of CPUs).
+        store (ResultStore | None, optional):
+            Store of the known answers. Defaults to None.
+        timings (t.Dict[str, float] | None, optional):
+            Recorded wall times. Defaults to None.
+        profile_directory (str | None, optional):
+            Directory of the pstats files. Defaults to None (no profiling).
+
+    Yields:
+        SolutionReport: Report of each job, in completion order.
+    """
+    jobs_to_run: t.List[Job] = []
+    for job in jobs:
+        if store is not None and os.path.isfile(job.input_path):
+            answer: str | None = store.get(
+                make_store_key(job.day, job.part, job.input_path)
+            )
+            if answer is not None:
+                yield make_cached_report(
+                    job.day, job.part, job.input_path, answer
+                )
+                continue
+        jobs_to_run.append(job)
+
+    groups: t.List[JobGroup] = sorted(
+        group_jobs(jobs_to_run),
+        key=lambda group: group.estimate_duration(timings or {}),
+        reverse=True,
+    )
+    if not groups:
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers or os.cpu_count() or 1, len(groups)),
+        initializer=initialize_worker,
+        initargs=(
+            get_parse_cache_directory(),
+            get_parallel_mode(),
+            get_parallel_workers(),
+            are_counters_enabled(),
+            get_backend(),
+            get_verbosity(),
+            get_budget(),
+        ),
+    ) as executor:
+        futures: t.Dict["Future[t.List[SolutionReport]]", JobGroup] = {
+            executor.submit(
+                run_job_group,
+                group.day,
+                group.parts,
+                group.input_path,
+                profile_directory,
+            ): group
+            for group in groups
+        }
+        for future in as_completed(futures):
+            group: JobGroup = futures[future]
+            for report in collect_reports(future, group):
+                if store is not None and report.status == "ok":
+                    store.put(
+                        make_store_key(
+                            report.day, report.part, group.input_path
+                        ),
+                        t.cast(str, report.answer),
+                    )
+                yield report
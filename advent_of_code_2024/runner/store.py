@@ -0,0 +1,252 @@
+"""Persistent store of the solutions answers"""
+
+import hashlib
+import json
+import os
+import tempfile
+import typing as t
+from collections import OrderedDict
+
+from advent_of_code_2024.common import map_input
+
+RESULT_STORE_PATH_ENV: str = "AOC_RESULT_STORE"
+TIMINGS_FILE_NAME: str = "timings.json"
+DEFAULT_RESULT_STORE_MAX_SIZE: int = 1024 * 1024
+SHARED_SOURCE_DIRECTORY: str = "common"
+
+
+def get_default_result_store_path() -> str:
+    """Get the default path of the result store file.
+
+    Returns:
+        str: AOC_RESULT_STORE environment variable, or a file in the user
+            cache directory.
+    """
+    path: str | None = os.environ.get(RESULT_STORE_PATH_ENV)
+    if path:
+        return path
+    cache_directory: str = os.environ.get(
+        "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.path.join(cache_directory, "advent_of_code_2024", "answers.json")
+
+
+def get_default_timings_path() -> str:
+    """Get the default path of the recorded timings file.
+
+    Returns:
+        str: File stored next to the default result store.
+    """
+    return os.path.join(
+        os.path.dirname(get_default_result_store_path()), TIMINGS_FILE_NAME
+    )
+
+
+def load_timings(path: str) -> t.Dict[str, float]:
+    """Load the recorded wall times of the day parts.
+
+    Args:
+        path (str): Path to the timings file.
+
+    Returns:
+        t.Dict[str, float]: Wall time of each "DD:PP" day part, empty if
+            the file is missing or unreadable.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file_descriptor:
+            timings: t.Dict[str, float] = json.load(file_descriptor)
+    except (OSError, ValueError):
+        return {}
+    return timings
+
+
+def save_timings(path: str, timings: t.Dict[str, float]) -> None:
+    """Save the recorded wall times of the day parts.
+
+    Args:
+        path (str): Path to the timings file.
+        timings (t.Dict[str, float]): Wall time of each "DD:PP" day part.
+    """
+    directory: str = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=directory, suffix=".tmp"
+    )
+    with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+        json.dump(timings, temp_file, indent=2, sort_keys=True)
+    os.replace(temporary_path, path)
+
+
+def make_timing_key(day: int, part: int) -> str:
+    """Build the timings key of a day part.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+
+    Returns:
+        str: Timings key.
+    """
+    return f"{day:02d}:{part:02d}"
+
+
+def compute_input_hash(input_path: str) -> str:
+    """Compute the SHA-256 of an input file.
+
+    Args:
+        input_path (str): Path to the input file.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    with map_input(input_path) as buffer:
+        return hashlib.sha256(buffer).hexdigest()
+
+
+def compute_source_hash(package_directory: str, day: int, part: int) -> str:
+    """Compute the SHA-256 of the sources a day part depends on.
+
+    The sources are the part module, the day common module and the shared
+    common modules of the package.
+
+    Args:
+        package_directory (str): Package directory.
+        day (int): Day number.
+        part (int): Part number.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    day_directory: str = os.path.join(package_directory, f"day_{day:02d}")
+    source_directories: t.List[str] = [
+        os.path.join(package_directory, SHARED_SOURCE_DIRECTORY),
+        os.path.join(day_directory, SHARED_SOURCE_DIRECTORY),
+        os.path.join(day_directory, f"part_{part:02d}"),
+    ]
+    digest = hashlib.sha256()
+    for source_directory in source_directories:
+        if not os.path.isdir(source_directory):
+            continue
+        for file_name in sorted(os.listdir(source_directory)):
+            if not file_name.endswith(".py"):
+                continue
+            digest.update(file_name.encode())
+            with open(
+                os.path.join(source_directory, file_name), "rb"
+            ) as file_descriptor:
+                digest.update(file_descriptor.read())
+    return digest.hexdigest()
+
+
+class ResultStore:
+    """Result store class.
+
+    Answers are kept in least recently used order and the oldest ones are
+    evicted once the store exceeds its maximum size.
+    """
+
+    path: str
+    max_size: int
+    size: int
+    entries: "OrderedDict[str, str]"
+    modified: bool
+
+    def __init__(
+        self, path: str, max_size: int = DEFAULT_RESULT_STORE_MAX_SIZE
+    ) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.size = 0
+        self.entries = OrderedDict()
+        self.modified = False
+        self.load()
+
+    def __repr__(self) -> str:
+        return f"ResultStore(Path: {self.path}, Entries: {len(self.entries)})"
+
+    @staticmethod
+    def make_key(day: int, part: int, input_hash: str, source_hash: str) -> str:
+        """Build the key of an answer.
+
+        Args:
+            day (int): Day number.
+            part (int): Part number.
+            input_hash (str): Hash of the input file.
+            source_hash (str): Hash of the solution sources.
+
+        Returns:
+            str: Answer key.
+        """
+        return f"{day:02d}:{part:02d}:{input_hash}:{source_hash}"
+
+    @staticmethod
+    def get_entry_size(key: str, answer: str) -> int:
+        """Get the size taken by an entry.
+
+        Args:
+            key (str): Answer key.
+            answer (str): Answer.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return len(key.encode()) + len(answer.encode())
+
+    def load(self) -> None:
+        """Load the store file, an unreadable file gives an empty store."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file_descriptor:
+                entries: t.List[t.List[str]] = json.load(file_descriptor)
+        except (OSError, ValueError):
+            return
+        for key, answer in entries:
+            self.put(key, answer)
+        self.modified = False
+
+    def save(self) -> None:
+        """Write the store file atomically, if it has been modified."""
+        if not self.modified:
+            return
+        directory: str = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=directory, suffix=".tmp"
+        )
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+            json.dump(
+                [list(entry) for entry in self.entries.items()], temp_file
+            )
+        os.replace(temporary_path, self.path)
+        self.modified = False
+
+    def get(self, key: str) -> str | None:
+        """Get an answer and mark it as recently used.
+
+        Args:
+            key (str): Answer key.
+
+        Returns:
+            str | None: Answer, None if not stored.
+        """
+        answer: str | None = self.entries.get(key)
+        if answer is not None:
+            self.entries.move_to_end(key)
+            self.modified = True
+        return answer
+
+    def put(self, key: str, answer: str) -> None:
+        """Store an answer, evicting the least recently used ones if needed.
+
+        Args:
+            key (str): Answer key.
+            answer (str): Answer.
+        """
+        previous_answer: str | None = self.entries.pop(key, None)
+        if previous_answer is not None:
+            self.size -= self.get_entry_size(key, previous_answer)
+        self.entries[key] = answer
+        self.size += self.get_entry_size(key, answer)
+        while self.size > self.max_size and self.entries:
+            evicted_key, evicted_answer = self.entries.popitem(last=False)
+            self.size -= self.get_entry_size(evicted_key, evicted_answer)
+        self.modified = True
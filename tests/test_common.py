@@ -0,0 +1,28 @@
+"""Tests of the input parsing shared by all the days"""
+
+import unittest
+
+from advent_of_code_2024.common import parse_grid
+
+
+class ParseGridTest(unittest.TestCase):
+    """Grid parsing tests."""
+
+    def test_rectangular(self) -> None:
+        """Rows of the same width, whatever the line terminators."""
+        self.assertEqual(parse_grid("ab\ncd\n"), (b"abcd", 2, 2))
+        self.assertEqual(parse_grid(b"ab\r\ncd\r\n"), (b"abcd", 2, 2))
+        self.assertEqual(parse_grid("a\nb\nc"), (b"abc", 1, 3))
+        self.assertEqual(parse_grid(""), (b"", 0, 0))
+
+    def test_ragged(self) -> None:
+        """Rows of different widths are rejected, even when the number of
+        cells is a multiple of the first width."""
+        for raw_input in ("ab\nc\ndef", "abc\na\nc", "ab\n\ncd", "ab\nabc"):
+            with self.subTest(raw_input=raw_input):
+                with self.assertRaises(ValueError):
+                    parse_grid(raw_input)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""Tests of the day 1 suffix absolute sums and location index"""
+
+import random
+import typing as t
+import unittest
+
+from advent_of_code_2024.day_01.common import LocationIndex, SuffixAbsoluteSum
+from advent_of_code_2024.day_01.part_01.main import compute_total_distance
+from advent_of_code_2024.day_01.part_02.main import compute_similarity_score
+
+
+def get_absolute_sum(weights: t.List[int], differences: t.List[int]) -> int:
+    """Compute a weighted sum of absolute differences, the direct way.
+
+    Args:
+        weights (t.List[int]): Weight of each difference.
+        differences (t.List[int]): Differences.
+
+    Returns:
+        int: Weighted sum of the absolute differences.
+    """
+    return sum(
+        weight * abs(difference)
+        for weight, difference in zip(weights, differences)
+    )
+
+
+class SuffixAbsoluteSumTest(unittest.TestCase):
+    """Suffix absolute sum tests, against the direct sum."""
+
+    def check(
+        self,
+        distances: SuffixAbsoluteSum,
+        weights: t.List[int],
+        differences: t.List[int],
+    ) -> None:
+        """Check a sum against its expected weights and differences.
+
+        Args:
+            distances (SuffixAbsoluteSum): Sum to check.
+            weights (t.List[int]): Expected weights.
+            differences (t.List[int]): Expected differences.
+        """
+        self.assertEqual(len(distances), len(weights))
+        self.assertEqual(
+            [distances.get_difference(index) for index in range(len(weights))],
+            differences,
+        )
+        self.assertEqual(
+            distances.total, get_absolute_sum(weights, differences)
+        )
+
+    def test_init(self) -> None:
+        """The initial total is the weighted sum of absolute differences."""
+        distances: SuffixAbsoluteSum = SuffixAbsoluteSum([3, 0, 2], [-2, 5, 1])
+        self.assertEqual(distances.total, 8)
+        self.assertEqual(SuffixAbsoluteSum([], []).total, 0)
+
+    def test_shift_suffix_crossing_zero(self) -> None:
+        """Differences crossing zero switch from shrinking to growing."""
+        weights: t.List[int] = [1, 2, 3, 4]
+        differences: t.List[int] = [0, -1, 1, 0]
+        distances: SuffixAbsoluteSum = SuffixAbsoluteSum(
+            list(weights), list(differences)
+        )
+        for start, step in ((0, 1), (0, 1), (1, -1), (3, -1), (0, -1), (2, 1)):
+            distances.shift_suffix(start, step)
+            for index in range(start, len(differences)):
+                differences[index] += step
+            self.check(distances, weights, differences)
+
+    def test_random_operations(self) -> None:
+        """Random shifts, insertions, weight changes and splits."""
+        rng: random.Random = random.Random(0)
+        for _ in range(50):
+            weights: t.List[int] = [
+                rng.randint(0, 5) for _ in range(rng.randint(0, 20))
+            ]
+            differences: t.List[int] = [
+                rng.randint(-3, 3) for _ in range(len(weights))
+            ]
+            distances: SuffixAbsoluteSum = SuffixAbsoluteSum(
+                list(weights), list(differences)
+            )
+            for _ in range(200):
+                operation: int = rng.randrange(4)
+                if operation == 0 or not weights:
+                    index: int = rng.randint(0, len(weights))
+                    weight: int = rng.randint(0, 5)
+                    difference: int = rng.randint(-3, 3)
+                    distances.insert(index, weight, difference)
+                    weights.insert(index, weight)
+                    differences.insert(index, difference)
+                elif operation == 1:
+                    index = rng.randrange(len(weights))
+                    weights[index] = rng.randint(0, 5)
+                    distances.set_weight(index, weights[index])
+                else:
+                    start: int = rng.randint(0, len(weights))
+                    step: int = rng.choice((-1, 1))
+                    distances.shift_suffix(start, step)
+                    for index in range(start, len(differences)):
+                        differences[index] += step
+                self.check(distances, weights, differences)
+            index = rng.randint(0, len(weights))
+            moved: SuffixAbsoluteSum = distances.split(index)
+            self.check(distances, weights[:index], differences[:index])
+            self.check(moved, weights[index:], differences[index:])
+
+
+class LocationIndexTest(unittest.TestCase):
+    """Location index tests, against the day 1 one-liners."""
+
+    def check(
+        self, index: LocationIndex, list_1: t.List[int], list_2: t.List[int]
+    ) -> None:
+        """Check an index against both lists.
+
+        Args:
+            index (LocationIndex): Index to check.
+            list_1 (t.List[int]): Expected first list.
+            list_2 (t.List[int]): Expected second list.
+        """
+        self.assertEqual(index.lengths, (len(list_1), len(list_2)))
+        self.assertEqual(
+            index.total_distance, compute_total_distance(list_1, list_2)
+        )
+        self.assertEqual(
+            index.similarity_score, compute_similarity_score(list_1, list_2)
+        )
+
+    def test_example(self) -> None:
+        """The example of the puzzle, built at once and added ID by ID."""
+        list_1: t.List[int] = [3, 4, 2, 1, 3, 3]
+        list_2: t.List[int] = [4, 3, 5, 3, 9, 3]
+        self.check(LocationIndex(list_1, list_2), list_1, list_2)
+        index: LocationIndex = LocationIndex()
+        for location_id_1, location_id_2 in zip(list_1, list_2):
+            index.add(1, location_id_1)
+            index.add(2, location_id_2)
+        self.assertEqual(index.total_distance, 11)
+        self.assertEqual(index.similarity_score, 31)
+
+    def test_errors(self) -> None:
+        """Unknown lists and missing IDs are rejected."""
+        index: LocationIndex = LocationIndex([1], [2])
+        with self.assertRaises(ValueError):
+            index.add(3, 1)
+        with self.assertRaises(ValueError):
+            index.remove(1, 2)
+
+    def test_random_events(self) -> None:
+        """Random additions and removals, mostly of unknown IDs, so that
+        blocks are split and rebuilt."""
+        rng: random.Random = random.Random(0)
+        list_1: t.List[int] = [rng.randint(0, 10**6) for _ in range(50)]
+        list_2: t.List[int] = [rng.randint(0, 10**6) for _ in range(40)]
+        index: LocationIndex = LocationIndex(list_1, list_2, [7, 10**6 + 1])
+        for event in range(3000):
+            list_number: int = rng.choice((1, 2))
+            location_ids: t.List[int] = list_1 if list_number == 1 else list_2
+            if location_ids and rng.random() < 0.3:
+                location_id: int = rng.choice(location_ids)
+                location_ids.remove(location_id)
+                index.remove(list_number, location_id)
+            else:
+                location_id = rng.randint(0, 10**6)
+                location_ids.append(location_id)
+                index.add(list_number, location_id)
+            if not event % 100:
+                self.check(index, list_1, list_2)
+        self.check(index, list_1, list_2)
+        self.assertGreater(len(index.blocks), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()